@@ -10,12 +10,17 @@ from .iproto.protocol import (
     Iterator,
     Metadata,
     MPInterval,
+    Param,
     PushIterator,
     Response,
     Schema,
     SchemaIndex,
     SchemaSpace,
     TarantoolTuple,
+    register_ext_type,
+    register_type_encoder,
+    unregister_ext_type,
+    unregister_type_encoder,
 )
 
 __version__ = "2.4.0"
@@ -1,10 +1,14 @@
 import enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from asynctnt.iproto import protocol
 
+from . import batch
+from .batch import BatchResponse, wait_batch
+from .diff import diff_update_ops, is_update_cheaper
 from .exceptions import TarantoolNotConnectedError
-from .prepared import PreparedStatement
+from .prepared import PreparedStatement, StatementCache
+from .template import CallTemplate, UpdateTemplate
 from .types import KeyType, MethodRet, SpaceType, TupleType
 
 
@@ -21,10 +25,11 @@ class Isolation(enum.IntEnum):
 
 
 class Api:
-    __slots__ = ("_db",)
+    __slots__ = ("_db", "_stmt_cache")
 
     def __init__(self):
         self._db: Union[_DbMock, protocol.Db] = _DbMock()
+        self._stmt_cache: Optional[StatementCache] = None
 
     def _set_db(self, db: protocol.Db):
         self._db = db
@@ -106,6 +111,84 @@ class Api:
             func_name, args, timeout=timeout, push_subscribe=push_subscribe
         )
 
+    async def call_many(
+        self,
+        func_name: str,
+        args_list: Iterable[Optional[List[Any]]],
+        *,
+        timeout: float = -1.0,
+    ) -> BatchResponse:
+        """
+        Call a function once for every set of arguments.
+        All the requests are sent in a single write and share a single
+        waiter, so there are no per-call futures.
+
+        Examples:
+
+        .. code-block:: pycon
+
+            >>> res = await conn.call_many('f', [[1], [2], [3]])
+            >>> [r.body for r in res]
+            [[1], [2], [3]]
+
+        :param func_name: function name to call
+        :param args_list: iterable of arguments lists
+        :param timeout: Request timeout (of the whole batch)
+
+        :returns: :class:`asynctnt.batch.BatchResponse` instance with
+                  a response or an exception for every call
+        """
+        return BatchResponse(
+            await self._db.call_many(func_name, args_list, timeout=timeout)
+        )
+
+    async def call_batch(
+        self,
+        calls: Iterable[Tuple[str, Optional[List[Any]]]],
+        *,
+        timeout: float = -1.0,
+    ) -> BatchResponse:
+        """
+        Call different functions with a single write.
+        Same as :meth:`call_many` but every call is
+        a ``(func_name, args)`` pair.
+
+        Examples:
+
+        .. code-block:: pycon
+
+            >>> res = await conn.call_batch([
+            ...     ('get_user', [1]),
+            ...     ('get_orders', [1, 'new']),
+            ... ])
+
+        :param calls: iterable of ``(func_name, args)`` pairs
+        :param timeout: Request timeout (of the whole batch)
+
+        :returns: :class:`asynctnt.batch.BatchResponse` instance with
+                  a response or an exception for every call
+        """
+        return BatchResponse(await self._db.call_batch(calls, timeout=timeout))
+
+    def template(self, func_name: str, *, call16: bool = False) -> CallTemplate:
+        """
+        Create a :class:`asynctnt.template.CallTemplate` instance.
+        Header and body of the call request are encoded only once,
+        so repeated calls of the same function are cheaper.
+
+        Examples:
+
+        .. code-block:: pycon
+
+            >>> get_profile = conn.template('get_profile')
+            >>> await get_profile([42])
+            <Response sync=3 rowcount=1 data=[...]>
+
+        :param func_name: function name to call
+        :param call16: use call16 request instead of call
+        """
+        return CallTemplate(self, func_name, call16=call16)
+
     def eval(
         self,
         expression: str,
@@ -190,6 +273,49 @@ class Api:
         """
         return self._db.select(space, key, **kwargs)
 
+    async def select_many(
+        self,
+        space: SpaceType,
+        keys: Iterable[Any],
+        *,
+        index: Union[str, int] = 0,
+        timeout: float = -1,
+    ) -> List[Optional[Any]]:
+        """
+        Fetch many tuples by unique keys at once.
+        Select requests for all the keys are sent in a single write
+        and share a single waiter, so there are no per-key futures.
+
+        Examples:
+
+        .. code-block:: pycon
+
+            >>> await conn.select_many('tester', [1, 2, 100500])
+            [<TarantoolTuple id=1 name='one'>,
+             <TarantoolTuple id=2 name='two'>,
+             None]
+
+            >>> await conn.select_many('tester', [['one'], ['two']], index='txt')
+            [<TarantoolTuple id=1 name='one'>,
+             <TarantoolTuple id=2 name='two'>]
+
+        :param space: space id or space name.
+        :param keys: iterable of keys (a key is either a list/tuple
+                     of key parts, a dict or a single key part value)
+        :param index: index id or name
+        :param timeout: Request timeout (of the whole batch)
+
+        :returns: list of tuples in the order of keys (``None`` for
+                  the keys which are not found)
+        """
+        results = await self._db.select_many(space, keys, index=index, timeout=timeout)
+        tuples = []
+        for resp in results:
+            if isinstance(resp, BaseException):
+                raise resp
+            tuples.append(resp.body[0] if resp.body else None)
+        return tuples
+
     def insert(
         self,
         space: SpaceType,
@@ -247,6 +373,112 @@ class Api:
         """
         return self._db.replace(space, t, timeout=timeout)
 
+    def replace_diff(
+        self,
+        space: SpaceType,
+        old: Optional[Sequence[Any]],
+        new: TupleType,
+        *,
+        key_fields: Sequence[int] = (0,),
+        timeout: float = -1.0,
+    ) -> MethodRet:
+        """
+        Write the new value of a tuple sending only the changed fields.
+        The old tuple is compared with the new one and the smallest list
+        of ``=``, ``!`` and ``#`` update operations is sent in an update
+        request. Replace request is sent instead if it is smaller
+        (or if primary key fields differ).
+
+        Note that unlike replace the update does nothing if the tuple
+        has been deleted since it was read (response is empty then).
+
+        .. code-block:: pycon
+
+            >>> res = await conn.select('users', [1])
+            >>> user = res[0]
+            >>> new_user = list(user)
+            >>> new_user[5] = 'new@email.com'
+            >>> await conn.replace_diff('users', user, new_user)
+            <Response sync=4 rowcount=1 data=[...]>
+
+        :param space: space id or space name.
+        :param old: current value of the tuple (as it was read)
+        :param new: new value of the tuple
+        :param key_fields: numbers of the primary key fields in a tuple
+        :param timeout: Request timeout
+
+        :returns: :class:`asynctnt.Response` instance
+        """
+        if old is not None and isinstance(new, (list, tuple)):
+            ops = diff_update_ops(old, new, key_fields=key_fields)
+            if ops is not None:
+                key = [new[i] for i in key_fields]
+                if is_update_cheaper(key, ops, new):
+                    return self._db.update(space, key, ops, timeout=timeout)
+        return self._db.replace(space, new, timeout=timeout)
+
+    async def insert_many(
+        self,
+        space: SpaceType,
+        tuples: Iterable[TupleType],
+        *,
+        replace: bool = False,
+        chunk_size: int = 1000,
+        max_in_flight: int = 4,
+        in_transaction: bool = False,
+        return_exceptions: bool = False,
+        timeout: float = -1,
+    ) -> BatchResponse:
+        """
+        Bulk insert (or replace) of many tuples.
+        Tuples are split into chunks of ``chunk_size``; requests of a chunk
+        are sent in a single write and at most ``max_in_flight`` chunks
+        are waited for at the same time. On the first raised error the
+        rest of the tuples are not sent and the chunks still in progress
+        are cancelled (with ``in_transaction`` their transactions are
+        rolled back unless they are already committed).
+
+        Examples:
+
+        .. code-block:: pycon
+
+            >>> res = await conn.insert_many(
+            ...     'tester', ([i, str(i)] for i in range(100000))
+            ... )
+            >>> res.rowcount
+            100000
+
+        :param space: space id or space name.
+        :param tuples: iterable of tuples to insert
+        :param replace: send replace requests instead of inserts
+        :param chunk_size: number of tuples in a chunk
+        :param max_in_flight: max number of chunks in progress
+        :param in_transaction: wrap every chunk into a stream transaction,
+                               so a chunk is applied atomically (the whole
+                               chunk is rolled back on any error)
+        :param return_exceptions: return errors of failed tuples inside
+                                  the result instead of raising the first
+                                  one (ignored with ``in_transaction``)
+        :param timeout: Request timeout
+
+        :returns: :class:`asynctnt.batch.BatchResponse` instance
+        """
+
+        def insert_chunk(chunk):
+            return batch.insert_chunk(
+                self._db,
+                space,
+                chunk,
+                replace=replace,
+                in_transaction=in_transaction,
+                return_exceptions=return_exceptions,
+                timeout=timeout,
+            )
+
+        return BatchResponse(
+            await batch.run_chunks(tuples, chunk_size, max_in_flight, insert_chunk)
+        )
+
     def delete(
         self,
         space: SpaceType,
@@ -320,6 +552,40 @@ class Api:
         """
         return self._db.update(space, key, operations, **kwargs)
 
+    def compile_update(
+        self,
+        space: SpaceType,
+        operations: List[Any],
+        *,
+        index: SpaceType = 0,
+    ) -> UpdateTemplate:
+        """
+        Compile update operations into a
+        :class:`asynctnt.template.UpdateTemplate` instance.
+        Operations are validated, field names are resolved and static
+        parts are encoded only once, so repeated updates of the same
+        shape are cheaper. Use :class:`asynctnt.Param` as a placeholder
+        for the values passed on every update.
+
+        Examples:
+
+        .. code-block:: pycon
+
+            >>> from asynctnt import Param
+            >>> charge = conn.compile_update(
+            ...     'accounts', [('-', 'balance', Param), ('=', 'ts', Param)]
+            ... )
+            >>> await charge([42], [100, 1700000000])
+            <Response sync=3 rowcount=1 data=[...]>
+
+        :param space: space id or space name.
+        :param operations: operations list in the same format as in
+                           :meth:`update`, arguments may be
+                           :class:`asynctnt.Param` placeholders
+        :param index: index id or name to update by
+        """
+        return UpdateTemplate(self, space, operations, index=index)
+
     def upsert(
         self,
         space: SpaceType,
@@ -387,6 +653,9 @@ class Api:
                 <TarantoolTuple 0=2 1='Ethan Hunt'>
             ]>
 
+        If the connection is created with ``statement_cache_size``, query
+        strings are transparently prepared and executed by statement id.
+
         :param query: SQL query or statement_id
         :param args: Query arguments
         :param parse_metadata: Set to False to disable response's metadata
@@ -395,10 +664,85 @@ class Api:
 
         :returns: :class:`asynctnt.Response` instance
         """
+        if self._stmt_cache is not None and isinstance(query, str):
+            return self._stmt_cache.execute(
+                self._db,
+                query,
+                args,
+                parse_metadata=parse_metadata,
+                timeout=timeout,
+            )
         return self._db.execute(
             query, args, parse_metadata=parse_metadata, timeout=timeout
         )
 
+    async def executemany(
+        self,
+        query: Union[str, int],
+        args_list: Iterable[Optional[List[Union[Dict[str, Any], Any]]]],
+        *,
+        parse_metadata: bool = True,
+        fail_fast: bool = False,
+        timeout: float = -1.0,
+    ) -> BatchResponse:
+        """
+        Execute an SQL statement for every set of arguments.
+        All requests are sent with a single write against a prepared
+        statement id, so there is only one round trip to the server.
+
+        .. code-block:: pycon
+
+            # tarantool> box.execute(
+            #   'create table s (id integer primary key, name string)'
+            # )
+
+            >>> res = await conn.executemany(
+            ...     'insert into s values (?, ?)',
+            ...     [[1, 'one'], [2, 'two'], [3, 'three']]
+            ... )
+            >>> res.rowcount
+            3
+
+        A query string is prepared before the execution and unprepared
+        afterwards (or taken from the statement cache if the connection is
+        created with ``statement_cache_size``).
+
+        :param query: SQL query or statement_id
+        :param args_list: Iterable of query arguments
+        :param parse_metadata: Set to False to disable response's metadata
+                               parsing for better performance
+        :param fail_fast: Raise the first error as soon as it is
+                          received instead of waiting for all the
+                          responses
+        :param timeout: Request timeout
+
+        :returns: :class:`asynctnt.batch.BatchResponse` instance
+        """
+        if isinstance(query, str):
+            if self._stmt_cache is None:
+                async with self.prepare(query) as stmt:
+                    return await stmt.executemany(
+                        args_list,
+                        parse_metadata=parse_metadata,
+                        fail_fast=fail_fast,
+                        timeout=timeout,
+                    )
+
+            results = await self._stmt_cache.executemany(
+                self._db,
+                query,
+                args_list,
+                parse_metadata=parse_metadata,
+                fail_fast=fail_fast,
+                timeout=timeout,
+            )
+            return BatchResponse(results)
+
+        futures = self._db.execute_many(
+            query, args_list, parse_metadata=parse_metadata, timeout=timeout
+        )
+        return BatchResponse(await wait_batch(futures, fail_fast))
+
     def prepare(self, query: str) -> PreparedStatement:
         """
         Create a :class:`asynctnt.prepared.PreparedStatement` instance
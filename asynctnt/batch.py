@@ -0,0 +1,235 @@
+import asyncio
+import collections
+import itertools
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .iproto import protocol
+
+
+def _consume_result(fut: asyncio.Future):
+    if not fut.cancelled():
+        fut.exception()
+
+
+ResultType = Union[protocol.Response, BaseException]
+
+
+async def wait_batch(
+    futures: List[asyncio.Future],
+    fail_fast: bool = False,
+    return_exceptions: bool = False,
+) -> List[ResultType]:
+    """
+        Wait for responses of pipelined requests
+
+    :param futures: request futures in the order requests were sent
+    :param fail_fast: raise the first error as soon as it is received
+                      instead of waiting for all the responses
+    :param return_exceptions: put errors into the result list
+                              instead of raising them
+    :return: list of responses in the order of requests
+    """
+    if return_exceptions:
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+    if not fail_fast:
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        for res in results:
+            if isinstance(res, BaseException):
+                raise res
+        return results
+
+    responses = []
+    try:
+        for fut in futures:
+            responses.append(await fut)
+    except BaseException:
+        for fut in futures:
+            fut.add_done_callback(_consume_result)
+        raise
+    return responses
+
+
+def iter_chunks(iterable: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    it = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+async def run_chunks(
+    iterable: Iterable[Any],
+    chunk_size: int,
+    max_in_flight: int,
+    func: Callable[[List[Any]], Awaitable[List[ResultType]]],
+) -> List[ResultType]:
+    """
+        Split items into chunks and process them with func keeping
+        at most max_in_flight chunks in progress. On the first error
+        the chunks still in progress are cancelled
+
+    :return: concatenated results of all chunks in order
+    """
+    if max_in_flight <= 0:
+        raise ValueError("max_in_flight must be positive")
+
+    results = []
+    pending = collections.deque()
+    try:
+        for chunk in iter_chunks(iterable, chunk_size):
+            if len(pending) >= max_in_flight:
+                results.extend(await pending.popleft())
+            pending.append(asyncio.ensure_future(func(chunk)))
+
+        while pending:
+            results.extend(await pending.popleft())
+    except BaseException:
+        for task in pending:
+            task.cancel()
+            task.add_done_callback(_consume_result)
+        raise
+    return results
+
+
+async def load_spaces(db: protocol.Db, spaces: Iterable[Any]):
+    """
+    Wait for schema of the spaces to be loaded (with ``lazy_schema``).
+    Requests to a space which is not loaded yet are sent after the
+    load, i.e. out of a corked write and out of order
+    """
+    loads = [db.space_load(space) for space in spaces]
+    loads = [load for load in loads if load is not None]
+    if loads:
+        await asyncio.gather(*loads)
+
+
+async def insert_chunk(
+    db: protocol.Db,
+    space: Any,
+    tuples: List[Any],
+    *,
+    replace: bool,
+    in_transaction: bool,
+    return_exceptions: bool,
+    timeout: float,
+) -> List[ResultType]:
+    if not in_transaction:
+        futures = db.insert_many(space, tuples, replace=replace, timeout=timeout)
+        return await wait_batch(futures, return_exceptions=return_exceptions)
+
+    # begin, inserts and commit are sent over a separate stream, so the
+    # chunk is applied atomically
+    await load_spaces(db, (space,))
+    stream_db = db.create_stream()
+    stream_db.cork()
+    try:
+        futures = [stream_db.begin(0, timeout=timeout)]
+        try:
+            futures.extend(
+                stream_db.insert_many(space, tuples, replace=replace, timeout=timeout)
+            )
+        except BaseException:
+            # begin is flushed anyway, so roll it back in the same write
+            futures.append(stream_db.rollback(timeout=timeout))
+            for fut in futures:
+                fut.add_done_callback(_consume_result)
+            raise
+    finally:
+        stream_db.uncork()
+
+    try:
+        results = await wait_batch(futures, return_exceptions=True)
+    except asyncio.CancelledError:
+        stream_db.rollback(timeout=timeout).add_done_callback(_consume_result)
+        raise
+
+    for res in results:
+        if isinstance(res, BaseException):
+            await stream_db.rollback(timeout=timeout)
+            raise res
+
+    await stream_db.commit(timeout=timeout)
+    return results[1:]
+
+
+class BatchResponse:
+    """
+    Responses of a batch of requests sent in one go
+    """
+
+    __slots__ = ("_responses",)
+
+    def __init__(self, responses: List[ResultType]):
+        self._responses = responses
+
+    @property
+    def responses(self) -> List[ResultType]:
+        """
+        Responses in the order of requests (or exceptions for
+        the failed requests if errors are returned)
+        """
+        return self._responses
+
+    @property
+    def errors(self) -> List[Tuple[int, BaseException]]:
+        """
+        Indexes and errors of the failed requests
+        """
+        return [
+            (i, resp)
+            for i, resp in enumerate(self._responses)
+            if isinstance(resp, BaseException)
+        ]
+
+    @property
+    def rowcount(self) -> int:
+        """
+        Total number of rows affected by the batch
+        """
+        return sum(
+            resp.rowcount
+            for resp in self._responses
+            if not isinstance(resp, BaseException)
+        )
+
+    @property
+    def autoincrement_ids(self) -> Optional[List[int]]:
+        """
+        Autoincrement ids generated by all requests of the batch
+        """
+        ids = None
+        for resp in self._responses:
+            if isinstance(resp, BaseException):
+                continue
+            if resp.autoincrement_ids:
+                if ids is None:
+                    ids = []
+                ids.extend(resp.autoincrement_ids)
+        return ids
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def __getitem__(self, i) -> ResultType:
+        return self._responses[i]
+
+    def __iter__(self) -> Iterator[ResultType]:
+        return iter(self._responses)
+
+    def __repr__(self):  # pragma: nocover
+        return "<BatchResponse count={}>".format(len(self._responses))
@@ -0,0 +1,369 @@
+import asyncio
+import functools
+import numbers
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from .exceptions import TarantoolError
+from .types import SpaceType, TupleType
+
+if TYPE_CHECKING:  # pragma: nocover
+    from .api import Api
+
+_ADDITIVE_OPS = {"+": 1, "-": -1}
+
+
+def _additive_deltas(
+    t: TupleType, operations: List[Any]
+) -> Optional[List[Tuple[int, Any]]]:
+    """
+    Convert operations to a list of (field_no, delta) if all of them are
+    additive operations that can be applied to the tuple t
+    """
+    deltas = []
+    for op in operations:
+        if not isinstance(op, (list, tuple)) or len(op) != 3:
+            return None
+
+        sign = _ADDITIVE_OPS.get(op[0])
+        field_no, value = op[1], op[2]
+        if (
+            sign is None
+            or type(field_no) is not int
+            or field_no < 0
+            or field_no >= len(t)
+            or not _is_number(value)
+            or not _is_number(t[field_no])
+        ):
+            return None
+        deltas.append((field_no, sign * value))
+    return deltas
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Number) and not isinstance(value, bool)
+
+
+def _fail(futures: List[asyncio.Future], exc: BaseException):
+    for f in futures:
+        if not f.done():
+            f.set_exception(exc)
+
+
+def _resolve(futures: List[asyncio.Future], fut: asyncio.Future):
+    if fut.cancelled():
+        for f in futures:
+            if not f.done():
+                f.cancel()
+        return
+
+    exc = fut.exception()
+    for f in futures:
+        if f.done():
+            continue
+        if exc is not None:
+            f.set_exception(exc)
+        else:
+            f.set_result(fut.result())
+
+
+class _CombinedUpsert:
+    __slots__ = ("t", "deltas", "futures")
+
+    def __init__(self, t: TupleType, deltas: List[Tuple[int, Any]]):
+        self.t = list(t)
+        self.deltas: Dict[int, Any] = {}
+        self.futures: List[asyncio.Future] = []
+        self.merge(deltas)
+
+    def merge(self, deltas: List[Tuple[int, Any]]):
+        for field_no, delta in deltas:
+            self.deltas[field_no] = self.deltas.get(field_no, 0) + delta
+
+    def can_merge(self, deltas: List[Tuple[int, Any]]) -> bool:
+        return all(
+            field_no < len(self.t) and _is_number(self.t[field_no])
+            for field_no, _ in deltas
+        )
+
+    def merge_later(self, deltas: List[Tuple[int, Any]]):
+        # if the tuple does not exist the first upsert inserts it and the
+        # rest of them update it, so apply the later deltas to the tuple
+        for field_no, delta in deltas:
+            self.t[field_no] += delta
+        self.merge(deltas)
+
+    def operations(self) -> List[Any]:
+        ops = []
+        for field_no, delta in self.deltas.items():
+            if delta == 0:
+                continue
+            if delta > 0:
+                ops.append(["+", field_no, delta])
+            else:
+                ops.append(["-", field_no, -delta])
+        return ops
+
+
+class UpsertCombiner:
+    """
+    Write-combining buffer of upsert requests to a single space.
+
+    Upserts with additive operations (``+`` and ``-``) on the same key
+    collected within a time window are merged into a single upsert
+    request. All the combined requests are sent in a single write.
+    """
+
+    __slots__ = (
+        "_api",
+        "_space",
+        "_key_fields",
+        "_window",
+        "_max_keys",
+        "_timeout",
+        "_pending",
+        "_in_flight",
+        "_flush_handle",
+        "_closed",
+        "_requested",
+        "_sent",
+        "_error",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        api: "Api",
+        space: SpaceType,
+        *,
+        key_fields: Sequence[int] = (0,),
+        window: float = 0.005,
+        max_keys: int = 10000,
+        timeout: float = -1.0,
+    ):
+        if not key_fields:
+            raise ValueError("key_fields must not be empty")
+        if window < 0:
+            raise ValueError("window must not be negative")
+        if max_keys <= 0:
+            raise ValueError("max_keys must be positive")
+
+        self._api = api
+        self._space = space
+        self._key_fields = tuple(key_fields)
+        self._window = window
+        self._max_keys = max_keys
+        self._timeout = timeout
+        self._pending: Dict[Any, _CombinedUpsert] = {}
+        self._in_flight: Set[asyncio.Future] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._closed = False
+        self._requested = 0
+        self._sent = 0
+        self._error: Optional[BaseException] = None
+
+    @property
+    def space(self) -> SpaceType:
+        """
+        Space of the upserts
+        """
+        return self._space
+
+    @property
+    def closed(self) -> bool:
+        """
+        Is combiner closed
+        """
+        return self._closed
+
+    @property
+    def requested(self) -> int:
+        """
+        Number of upserts requested
+        """
+        return self._requested
+
+    @property
+    def sent(self) -> int:
+        """
+        Number of upsert requests actually sent to Tarantool
+        """
+        return self._sent
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def upsert(self, t: TupleType, operations: List[Any]) -> asyncio.Future:
+        """
+        Add upsert to the buffer. Returns a future which is resolved
+        with the response of the (combined) upsert request or its error.
+        Errors are also raised by :meth:`flush`, so the future may be
+        dropped.
+
+        Upserts with other than ``+`` and ``-`` operations (or with field
+        names instead of numbers) are not combined, but still sent in
+        order with other upserts of the same key.
+
+        :param t: tuple to insert if it's not in space
+        :param operations: operations list to use for update
+                           if tuple is already in space
+        :returns: :class:`asyncio.Future` instance
+        """
+        if self._closed:
+            raise TarantoolError("Upsert combiner is closed")
+        if not isinstance(t, (list, tuple)):
+            raise TypeError("Tuple must be a list or a tuple, got: {}".format(type(t)))
+
+        key = tuple(t[i] for i in self._key_fields)
+        self._requested += 1
+
+        deltas = _additive_deltas(t, operations)
+        entry = self._pending.get(key)
+        if entry is not None and (deltas is None or not entry.can_merge(deltas)):
+            # keep the order of upserts of the same key
+            self._send([self._pending.pop(key)])
+            entry = None
+
+        if deltas is None:
+            return self._send_upsert(t, operations)
+
+        if entry is None:
+            entry = _CombinedUpsert(t, deltas)
+            self._pending[key] = entry
+        else:
+            entry.merge_later(deltas)
+
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        fut.add_done_callback(self._on_done)
+        entry.futures.append(fut)
+
+        if len(self._pending) >= self._max_keys:
+            self._flush_pending()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window, self._flush_pending)
+        return fut
+
+    def _send_upsert(self, t: TupleType, operations: List[Any]) -> asyncio.Future:
+        self._sent += 1
+        fut = self._api._db.upsert(self._space, t, operations, timeout=self._timeout)
+        self._track(fut)
+        return fut
+
+    def _track(self, fut: asyncio.Future):
+        self._in_flight.add(fut)
+        fut.add_done_callback(self._in_flight.discard)
+        fut.add_done_callback(self._on_done)
+
+    def _on_done(self, fut: asyncio.Future):
+        # retrieving the error here keeps asyncio from logging it for
+        # the futures nobody awaits, it is raised by flush() instead
+        if not fut.cancelled() and fut.exception() is not None:
+            self._set_error(fut.exception())
+
+    def _set_error(self, exc: BaseException):
+        if self._error is None:
+            self._error = exc
+
+    def _fail(self, entries: List[_CombinedUpsert], exc: BaseException):
+        self._set_error(exc)
+        for entry in entries:
+            _fail(entry.futures, exc)
+
+    def _send(self, entries: List[_CombinedUpsert]):
+        try:
+            load = self._api._db.space_load(self._space)
+        except TarantoolError as e:
+            self._fail(entries, e)
+            return
+
+        if load is None:
+            self._write(entries)
+            return
+
+        # schema of the space is being loaded (lazy_schema), so the
+        # entries are sent in a single write after it
+        for entry in entries:
+            for f in entry.futures:
+                self._track(f)
+        load.add_done_callback(functools.partial(self._on_space_loaded, entries))
+
+    def _on_space_loaded(self, entries: List[_CombinedUpsert], load: asyncio.Future):
+        exc = asyncio.CancelledError() if load.cancelled() else load.exception()
+        if exc is not None:
+            self._fail(entries, exc)
+            return
+        self._write(entries)
+
+    def _write(self, entries: List[_CombinedUpsert]):
+        db = self._api._db
+        try:
+            db.cork()
+        except TarantoolError as e:
+            self._fail(entries, e)
+            return
+
+        try:
+            for entry in entries:
+                try:
+                    fut = self._send_upsert(entry.t, entry.operations())
+                except Exception as e:
+                    self._fail([entry], e)
+                    continue
+                fut.add_done_callback(functools.partial(_resolve, entry.futures))
+        finally:
+            db.uncork()
+
+    def _flush_pending(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._pending:
+            return
+
+        entries = list(self._pending.values())
+        self._pending.clear()
+        self._send(entries)
+
+    async def flush(self):
+        """
+        Send all the buffered upserts and wait for the responses
+        of all the sent requests.
+
+        :raises: the first error of the upserts since the previous flush
+        """
+        self._flush_pending()
+        results = []
+        if self._in_flight:
+            results = await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+        exc, self._error = self._error, None
+        if exc is not None:
+            raise exc
+        for res in results:
+            if isinstance(res, BaseException):
+                raise res
+
+    async def close(self):
+        """
+        Flush the buffer and close the combiner
+        """
+        if self._closed:
+            return
+        self._closed = True
+        await self.flush()
+
+    def _close_nowait(self):
+        self._closed = True
+        self._flush_pending()
+
+    async def __aenter__(self) -> "UpsertCombiner":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __repr__(self):  # pragma: nocover
+        return "<UpsertCombiner space={!r} pending={}>".format(
+            self._space, len(self._pending)
+        )
@@ -2,13 +2,34 @@ import asyncio
 import enum
 import functools
 import os
-from typing import Optional, Type, Union
-
-from .api import Api
+import types
+import weakref
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from .api import Api, Isolation
+from .combiner import UpsertCombiner
 from .exceptions import ErrorCode, TarantoolDatabaseError, TarantoolError
 from .iproto import protocol
 from .log import logger
+from .prepared import StatementCache
 from .stream import Stream
+from .transaction import TransactionStats, run_transaction
+from .types import SpaceType
+from .watcher import WatchCallback, Watcher
+
+T = TypeVar("T")
 
 __all__ = ("Connection", "connect", "ConnectionState")
 
@@ -31,6 +52,12 @@ class Connection(Api):
         "_auto_refetch_schema",
         "_initial_read_buffer_size",
         "_encoding",
+        "_datetime_as_ns",
+        "_pipelined_handshake",
+        "_schema_refetch_delay",
+        "_lazy_schema",
+        "_schema_snapshot",
+        "_shared_schema",
         "_connect_timeout",
         "_reconnect_timeout",
         "_request_timeout",
@@ -44,6 +71,11 @@ class Connection(Api):
         "_connect_lock",
         "_disconnect_lock",
         "_ping_task",
+        "_record_classes",
+        "_tx_stats",
+        "_combiners",
+        "_watchers",
+        "_watch_cache",
     )
 
     def __init__(
@@ -61,6 +93,13 @@ class Connection(Api):
         ping_timeout: float = 5.0,
         encoding: Optional[str] = None,
         initial_read_buffer_size: Optional[int] = None,
+        datetime_as_ns: bool = False,
+        statement_cache_size: int = 0,
+        pipelined_handshake: bool = False,
+        schema_refetch_delay: float = 0.0,
+        lazy_schema: bool = False,
+        schema_snapshot: Optional[str] = None,
+        shared_schema: bool = False,
     ):
         """
         Connection constructor.
@@ -123,6 +162,47 @@ class Connection(Api):
                 Initial and minimum size of read buffer in bytes.
                 Higher value means less reallocations, but higher
                 memory usage (default is 131072).
+        :param datetime_as_ns:
+                If set to ``True`` then datetime values are returned
+                as integer nanoseconds since the Unix epoch instead of
+                ``datetime`` objects (default is ``False``)
+        :param statement_cache_size:
+                Maximum number of SQL query strings which are
+                automatically prepared by ``execute()`` and then executed
+                by their statement id (default is ``0`` - disabled)
+        :param pipelined_handshake:
+                If set to ``True`` then id, auth and schema fetch
+                requests are sent at once right after the greeting
+                is received, so connecting takes a single round trip
+                instead of three (default is ``False``).
+                Note that schema is selected right behind the auth
+                request, so if authentication yields on the server
+                (e.g. in ``box.session.on_auth`` triggers) the schema
+                may be fetched with guest privileges. It is fetched
+                once more if schema id has changed since the auth
+        :param schema_refetch_delay:
+                Time in seconds to wait before refetching schema
+                after a schema change is noticed, so that changes made
+                within this window are fetched at once (default is ``0``).
+                Requests keep using the current schema meanwhile
+        :param lazy_schema:
+                If set to ``True`` then schema of a space is fetched only
+                when it's first used by name instead of fetching all the
+                spaces on connect (default is ``False``).
+                Requires ``fetch_schema``
+        :param schema_snapshot:
+                Path to a schema snapshot file. If the file holds
+                the schema of the same Tarantool instance and user, it is
+                used right away and schema is fetched only if the server's
+                schema version differs. Fetched schema is saved to
+                the file. Ignored with ``lazy_schema``
+                (default is ``None`` - no snapshot)
+        :param shared_schema:
+                If set to ``True`` then the ``schema_snapshot`` file is
+                memory mapped instead of being loaded, and a space is
+                parsed from it on its first use. The file is never written
+                by such connections, so pre-forked workers may share the
+                snapshot saved by the parent process (default is ``False``)
         """
         super().__init__()
         self._host = host
@@ -141,6 +221,12 @@ class Connection(Api):
             self._auto_refetch_schema = False
         self._initial_read_buffer_size = initial_read_buffer_size
         self._encoding = encoding or "utf-8"
+        self._datetime_as_ns = datetime_as_ns
+        self._pipelined_handshake = pipelined_handshake
+        self._schema_refetch_delay = schema_refetch_delay or 0
+        self._lazy_schema = lazy_schema
+        self._schema_snapshot = schema_snapshot
+        self._shared_schema = shared_schema
 
         self._connect_timeout = connect_timeout
         self._reconnect_timeout = reconnect_timeout or 0
@@ -157,6 +243,15 @@ class Connection(Api):
         self._connect_lock = asyncio.Lock()
         self._disconnect_lock = asyncio.Lock()
         self._ping_task = None
+        self._record_classes: Dict[SpaceType, Callable[..., Any]] = {}
+        self._tx_stats = TransactionStats()
+        self._combiners: "weakref.WeakSet[UpsertCombiner]" = weakref.WeakSet()
+        self._watchers: Dict[str, List[Watcher]] = {}
+        self._watch_cache: Dict[str, Any] = {}
+        if statement_cache_size < 0:
+            raise ValueError("statement_cache_size must not be negative")
+        if statement_cache_size:
+            self._stmt_cache = StatementCache(statement_cache_size)
 
     def _set_state(self, new_state: ConnectionState):
         if self._state != new_state:
@@ -227,10 +322,19 @@ class Connection(Api):
             request_timeout=self._request_timeout,
             initial_read_buffer_size=self._initial_read_buffer_size,
             encoding=self._encoding,
+            datetime_as_ns=self._datetime_as_ns,
+            pipelined_handshake=self._pipelined_handshake,
+            schema_refetch_delay=self._schema_refetch_delay,
+            lazy_schema=self._lazy_schema,
+            schema_snapshot=self._schema_snapshot,
+            shared_schema=self._shared_schema,
             connected_fut=connected_fut,
             on_connection_made=None,
             on_connection_lost=self.connection_lost,
             loop=loop,
+            record_classes=self._record_classes,
+            watch_keys=self._watchers,
+            on_watch_event=self._on_watch_event,
         )
 
     async def _connect(self, return_exceptions: bool = True):
@@ -307,6 +411,9 @@ class Connection(Api):
                     self._transport = tr
                     self._protocol = pr
                     self._set_db(self._protocol.get_common_db())
+                    if self._stmt_cache is not None:
+                        # prepared statements are bound to a session
+                        self._stmt_cache.clear()
                     self._reconnect_task = None
                     self._normalize_api()
 
@@ -391,6 +498,7 @@ class Connection(Api):
                 self._ping_task.cancel()
                 self._ping_task = None
 
+            await self._close_combiners()
             self._clear_db()
             if self._transport:
                 self._disconnect_waiter = loop.create_future()
@@ -427,6 +535,9 @@ class Connection(Api):
             self._ping_task.cancel()
             self._ping_task = None
 
+        for combiner in list(self._combiners):
+            combiner._close_nowait()
+
         if self._transport:
             self._transport.close()
 
@@ -588,6 +699,76 @@ class Connection(Api):
             return None
         return self._protocol.schema
 
+    @property
+    def datetime_as_ns(self) -> bool:
+        """
+        datetime_as_ns value
+        """
+        return self._datetime_as_ns
+
+    @property
+    def pipelined_handshake(self) -> bool:
+        """
+        pipelined_handshake value
+        """
+        return self._pipelined_handshake
+
+    @property
+    def schema_refetch_delay(self) -> float:
+        """
+        schema_refetch_delay value
+        """
+        return self._schema_refetch_delay
+
+    @property
+    def lazy_schema(self) -> bool:
+        """
+        lazy_schema value
+        """
+        return self._lazy_schema
+
+    @property
+    def schema_snapshot(self) -> Optional[str]:
+        """
+        schema_snapshot value
+        """
+        return self._schema_snapshot
+
+    @property
+    def shared_schema(self) -> bool:
+        """
+        shared_schema value
+        """
+        return self._shared_schema
+
+    @property
+    def schema_refetches(self) -> int:
+        """
+        Number of schema fetches made on the current connection
+        """
+        if self._protocol is None:
+            return 0
+        return self._protocol.schema_refetches
+
+    @property
+    def schema_refetches_coalesced(self) -> int:
+        """
+        Number of schema refetch triggers on the current connection
+        which were merged into an already scheduled or running fetch
+        """
+        if self._protocol is None:
+            return 0
+        return self._protocol.schema_refetches_coalesced
+
+    @property
+    def statement_cache_size(self) -> int:
+        """
+        statement_cache_size value
+        """
+        if self._stmt_cache is None:
+            return 0
+        return self._stmt_cache.max_size
+
     @property
     def initial_read_buffer_size(self) -> int:
         """
@@ -601,6 +782,47 @@ class Connection(Api):
         """
         await self._protocol.refetch_schema()
 
+    def register_record(self, space: SpaceType, cls: Callable[..., Any]):
+        """
+        Register a record class for a space. Tuples returned by
+        select/insert/replace/delete/update requests on this space are
+        then decoded straight into ``cls(*fields)`` instead of
+        :class:`asynctnt.TarantoolTuple` objects.
+
+        Any callable accepting tuple fields as positional arguments
+        may be used (``NamedTuple``, dataclasses with ``__slots__``, etc.)
+
+        .. code-block:: python
+
+            class User(NamedTuple):
+                id: int
+                name: str
+
+            conn.register_record('users', User)
+            res = await conn.select('users', [1])
+            assert isinstance(res[0], User)
+
+        :param space: space id or space name
+        :param cls: record class (or any other callable)
+        """
+        if not isinstance(space, (str, int)):
+            raise TypeError(
+                "Space must be either str or int, got: {}".format(type(space))
+            )
+        if not callable(cls):
+            raise TypeError("Record class must be callable")
+        self._record_classes[space] = cls
+
+    def unregister_record(self, space: SpaceType):
+        """
+        Remove a record class previously registered for a space.
+        Tuples of this space are decoded as
+        :class:`asynctnt.TarantoolTuple` again.
+
+        :param space: space id or space name
+        """
+        self._record_classes.pop(space, None)
+
     def _normalize_api(self):
         if (1, 6) <= self.version < (1, 7):  # pragma: nocover
             Api.call = Api.call16
@@ -625,8 +847,191 @@ class Connection(Api):
         stream = Stream()
         db = self._protocol.create_db(True)
         stream._set_db(db)
+        stream._stmt_cache = self._stmt_cache
         return stream
 
+    async def transaction(
+        self,
+        fn: Callable[[Stream], Awaitable[T]],
+        *,
+        isolation: Isolation = Isolation.DEFAULT,
+        tx_timeout: float = 0.0,
+        retries: int = 3,
+        backoff: float = 0.01,
+        max_backoff: float = 1.0,
+        timeout: float = -1.0,
+    ) -> T:
+        """
+        Run ``fn`` in an interactive transaction within a fresh stream.
+        ``begin()`` is called before ``fn`` and ``commit()`` after it
+        (``rollback()`` if ``fn`` raises). If the transaction is aborted
+        by a conflict, it is retried (``fn`` is called again with a new
+        stream) with an exponential backoff with jitter.
+
+        .. code-block:: python
+
+            async def incr(s):
+                res = await s.select('counters', [1])
+                value = res[0]['value'] + 1
+                await s.replace('counters', [1, value])
+                return value
+
+            value = await conn.transaction(incr, retries=5)
+
+        :param fn: coroutine function receiving a :class:`asynctnt.stream.Stream`
+        :param isolation: isolation level
+        :param tx_timeout: transaction timeout
+        :param retries: max number of retries on conflicts
+        :param backoff: initial backoff delay (in seconds)
+        :param max_backoff: max backoff delay (in seconds)
+        :param timeout: request timeout of begin/commit/rollback requests
+
+        :returns: result of ``fn``
+        """
+        return await run_transaction(
+            self,
+            self._tx_stats,
+            fn,
+            isolation=isolation,
+            tx_timeout=tx_timeout,
+            retries=retries,
+            backoff=backoff,
+            max_backoff=max_backoff,
+            timeout=timeout,
+        )
+
+    def upsert_combiner(
+        self,
+        space: SpaceType,
+        *,
+        key_fields: Sequence[int] = (0,),
+        window: float = 0.005,
+        max_keys: int = 10000,
+        timeout: float = -1.0,
+    ) -> UpsertCombiner:
+        """
+        Create a write-combining buffer of upserts to the space.
+        Upserts of the same key with ``+``/``-`` operations made within
+        ``window`` seconds are merged into a single upsert request:
+
+        .. code-block:: python
+
+            combiner = conn.upsert_combiner('counters')
+            for _ in range(1000):
+                combiner.upsert([1, 1], [('+', 1, 1)])
+            await combiner.flush()  # a single upsert [('+', 1, 1000)]
+
+        Buffered upserts are flushed on :meth:`disconnect`.
+
+        :param space: space id or space name
+        :param key_fields: numbers of the primary key fields in a tuple
+        :param window: max time (in seconds) upserts are buffered for
+        :param max_keys: max number of buffered keys (flush when reached)
+        :param timeout: request timeout
+
+        :returns: :class:`asynctnt.combiner.UpsertCombiner` instance
+        """
+        combiner = UpsertCombiner(
+            self,
+            space,
+            key_fields=key_fields,
+            window=window,
+            max_keys=max_keys,
+            timeout=timeout,
+        )
+        self._combiners.add(combiner)
+        return combiner
+
+    async def _close_combiners(self):
+        combiners: List[UpsertCombiner] = list(self._combiners)
+        if not combiners:
+            return
+
+        results = await asyncio.gather(
+            *(combiner.close() for combiner in combiners), return_exceptions=True
+        )
+        for res in results:
+            if isinstance(res, Exception):
+                logger.warning(
+                    "%s Error flushing upserts on disconnect: %s",
+                    self.fingerprint,
+                    res,
+                )
+
+    def watch(self, key: str, callback: Optional[WatchCallback] = None) -> Watcher:
+        """
+        Watch changes of the key value (see ``box.broadcast()``).
+        The current value is delivered first, then every new one:
+
+        .. code-block:: python
+
+            def on_change(key, value):
+                print(key, value)
+
+            watcher = conn.watch('box.status', on_change)
+
+            async for value in conn.watch('config'):
+                ...
+
+        Keys stay watched after reconnects until :meth:`Watcher.unwatch`
+        is called. Latest values of the watched keys are available
+        in :attr:`watch_cache`. Requires Tarantool 2.10+.
+
+        :param key: key name
+        :param callback: function called with the key and the new value
+
+        :returns: :class:`asynctnt.watcher.Watcher` instance
+        """
+        if not isinstance(key, str):
+            raise TypeError("key must be a str, got: {}".format(type(key)))
+
+        watcher = Watcher(self, key, callback)
+        watchers = self._watchers.get(key)
+        if watchers is None:
+            self._watchers[key] = [watcher]
+            if self._protocol is not None:
+                self._protocol.watch(key)
+        else:
+            watchers.append(watcher)
+            # the key is already watched, so start with the cached value
+            asyncio.get_running_loop().call_soon(self._notify_cached, watcher)
+        return watcher
+
+    def _notify_cached(self, watcher: Watcher):
+        if watcher.key in self._watch_cache and watcher._version == 0:
+            watcher._notify(self._watch_cache[watcher.key])
+
+    def _unwatch(self, watcher: Watcher):
+        watchers = self._watchers.get(watcher.key)
+        if watchers is None or watcher not in watchers:
+            return
+
+        watchers.remove(watcher)
+        if not watchers:
+            del self._watchers[watcher.key]
+            self._watch_cache.pop(watcher.key, None)
+            if self._protocol is not None:
+                self._protocol.unwatch(watcher.key)
+
+    def _on_watch_event(self, key: str, value: Any):
+        self._watch_cache[key] = value
+        for watcher in list(self._watchers.get(key, ())):
+            watcher._notify(value)
+
+    @property
+    def watch_cache(self) -> Mapping[str, Any]:
+        """
+        Latest values of the watched keys
+        """
+        return types.MappingProxyType(self._watch_cache)
+
+    @property
+    def transaction_stats(self) -> TransactionStats:
+        """
+        Counters of transactions run with :meth:`transaction`
+        """
+        return self._tx_stats
+
     @property
     def features(self) -> protocol.IProtoFeatures:
         """
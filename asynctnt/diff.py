@@ -0,0 +1,160 @@
+import datetime
+import decimal
+import difflib
+import uuid
+from typing import Any, Dict, List, Optional, Sequence
+
+UpdateOps = List[List[Any]]
+
+
+def _mp_sizeof_len(n: int, fix_limit: int, has_len8: bool = False) -> int:
+    if n < fix_limit:
+        return 1
+    if has_len8 and n <= 0xFF:
+        return 2
+    if n <= 0xFFFF:
+        return 3
+    return 5
+
+
+def mp_sizeof(obj: Any) -> int:
+    """
+    Estimate the size of the object encoded in msgpack
+    """
+    if obj is None or isinstance(obj, bool):
+        return 1
+    if isinstance(obj, int):
+        if -32 <= obj < 128:
+            return 1
+        if -0x80 <= obj <= 0xFF:
+            return 2
+        if -0x8000 <= obj <= 0xFFFF:
+            return 3
+        if -0x80000000 <= obj <= 0xFFFFFFFF:
+            return 5
+        return 9
+    if isinstance(obj, float):
+        return 9
+    if isinstance(obj, str):
+        n = len(obj) if obj.isascii() else len(obj.encode("utf-8"))
+        return _mp_sizeof_len(n, 32, True) + n
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        n = len(obj)
+        return _mp_sizeof_len(n, 0, True) + n
+    if isinstance(obj, dict):
+        return _mp_sizeof_len(len(obj), 16) + sum(
+            mp_sizeof(k) + mp_sizeof(v) for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple)) or hasattr(obj, "__len__"):
+        try:
+            return _mp_sizeof_len(len(obj), 16) + sum(mp_sizeof(v) for v in obj)
+        except TypeError:
+            pass
+    if isinstance(obj, uuid.UUID):
+        return 18
+    if isinstance(obj, decimal.Decimal):
+        return 4 + len(obj.as_tuple().digits) // 2
+    if isinstance(obj, datetime.datetime):
+        return 18 if obj.tzinfo is not None or obj.microsecond else 10
+    return 16
+
+
+def _same(a: Any, b: Any) -> bool:
+    return type(a) is type(b) and a == b
+
+
+def _positional_diff(old: Sequence[Any], new: Sequence[Any]) -> UpdateOps:
+    ops = []
+    common = min(len(old), len(new))
+    for i in range(common):
+        if not _same(old[i], new[i]):
+            ops.append(["=", i, new[i]])
+
+    if len(new) > common:
+        for i in range(common, len(new)):
+            ops.append(["!", i, new[i]])
+    elif len(old) > common:
+        ops.append(["#", common, len(old) - common])
+    return ops
+
+
+def _sequence_diff(old: Sequence[Any], new: Sequence[Any]) -> UpdateOps:
+    # fields may be unhashable, so match them by ids of equal values
+    values: List[Any] = []
+    ids: Dict[Any, int] = {}
+
+    def field_id(value: Any) -> int:
+        try:
+            key = (type(value), value)
+            fid = ids.get(key)
+            if fid is None:
+                fid = ids[key] = len(values)
+                values.append(value)
+            return fid
+        except TypeError:
+            for fid, v in enumerate(values):
+                if _same(v, value):
+                    return fid
+            values.append(value)
+            return len(values) - 1
+
+    old_ids = [field_id(v) for v in old]
+    new_ids = [field_id(v) for v in new]
+
+    ops = []
+    matcher = difflib.SequenceMatcher(None, old_ids, new_ids, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        # all the previous operations are already applied, so the
+        # tuple starts with new[:j1] here
+        if tag == "equal":
+            continue
+
+        n_old, n_new = i2 - i1, j2 - j1
+        for k in range(min(n_old, n_new)):
+            ops.append(["=", j1 + k, new[j1 + k]])
+        if n_new > n_old:
+            for k in range(n_old, n_new):
+                ops.append(["!", j1 + k, new[j1 + k]])
+        elif n_old > n_new:
+            ops.append(["#", j1 + n_new, n_old - n_new])
+    return ops
+
+
+def diff_update_ops(
+    old: Sequence[Any],
+    new: Sequence[Any],
+    *,
+    key_fields: Sequence[int] = (0,),
+) -> Optional[UpdateOps]:
+    """
+    Make the smallest list of update operations (``=``, ``!`` and ``#``)
+    turning the old tuple into the new one.
+
+    :param old: current tuple
+    :param new: new value of the tuple
+    :param key_fields: numbers of the primary key fields
+    :returns: list of operations or None if the tuple can not be
+              updated (primary key fields differ)
+    """
+    for i in key_fields:
+        if i >= len(old) or i >= len(new) or not _same(old[i], new[i]):
+            return None
+
+    ops = _positional_diff(old, new)
+    if len(old) != len(new) or len(ops) > 1:
+        # fields inserted to or removed from the middle of the tuple
+        seq_ops = _sequence_diff(old, new)
+        max_key_field = max(key_fields, default=-1)
+        shifts_key = any(op[0] != "=" and op[1] <= max_key_field for op in seq_ops)
+        if not shifts_key and mp_sizeof(seq_ops) < mp_sizeof(ops):
+            ops = seq_ops
+    return ops
+
+
+def is_update_cheaper(key: Sequence[Any], ops: UpdateOps, new: Sequence[Any]) -> bool:
+    """
+    Check if update request with the key and the operations is smaller
+    than replace request with the new tuple
+    """
+    # + mp_sizeof_uint(IPROTO_KEY)
+    return mp_sizeof(key) + 1 + mp_sizeof(ops) < mp_sizeof(new)
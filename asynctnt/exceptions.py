@@ -32,6 +32,20 @@ class TarantoolDatabaseError(TarantoolError):
         self.error = error
 
 
+class TarantoolTransactionError(TarantoolError):
+    """
+    Exception is raised when a statement of a transaction batch fails
+    """
+
+    def __init__(self, index: int, error: BaseException, committed: bool):
+        super(TarantoolTransactionError, self).__init__(
+            "statement #{} failed: {}".format(index, error)
+        )
+        self.index = index
+        self.error = error
+        self.committed = committed
+
+
 class TarantoolNetworkError(TarantoolError):
     pass
 
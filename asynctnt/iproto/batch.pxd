@@ -0,0 +1,9 @@
+cdef class BatchWaiter:
+    cdef:
+        object fut
+        list responses
+        Py_ssize_t left
+        object timeout_handle
+
+    cdef void _complete(self) except *
+    cdef list _results(self)
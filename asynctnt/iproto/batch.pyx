@@ -0,0 +1,57 @@
+cimport cython
+
+
+@cython.final
+cdef class BatchWaiter:
+    """
+        Shared waiter of a batch of requests. Quacks like a future for
+        every request of the batch and resolves a single future with
+        the list of responses (or errors) once all of them are received.
+    """
+
+    def __cinit__(self):
+        self.fut = None
+        self.responses = []
+        self.left = 0
+        self.timeout_handle = None
+
+    def done(self):
+        return self.fut.done()
+
+    def set_result(self, response):
+        self._complete()
+
+    def set_exception(self, exc):
+        # exception is already saved in the response
+        self._complete()
+
+    def _on_timeout(self):
+        self.timeout_handle = None
+        if not self.fut.done():
+            self.fut.set_exception(
+                asyncio.TimeoutError('Batch exceeded timeout')
+            )
+
+    def _on_done(self, fut):
+        if self.timeout_handle is not None:
+            self.timeout_handle.cancel()
+            self.timeout_handle = None
+
+    cdef void _complete(self) except *:
+        self.left -= 1
+        if self.left == 0 and not self.fut.done():
+            self.fut.set_result(self._results())
+
+    cdef list _results(self):
+        cdef:
+            Response response
+            list results
+
+        results = []
+        for response in self.responses:
+            exc = response.get_exception()
+            if exc is not None:
+                results.append(exc)
+            else:
+                results.append(response)
+        return results
@@ -1,5 +1,5 @@
 cimport cython
-from libc.stdint cimport int64_t, uint32_t, uint64_t
+from libc.stdint cimport int8_t, int64_t, uint32_t, uint64_t
 
 
 @cython.final
@@ -50,4 +50,12 @@ cdef class WriteBuffer:
     cdef char *mp_encode_list(self, char *p, list arr) except NULL
     cdef char *mp_encode_tuple(self, char *p, tuple t) except NULL
     cdef char *mp_encode_dict(self, char *p, dict d) except NULL
+    cdef char *mp_encode_ext(self, char *p, int8_t ext_id,
+                             object data) except NULL
+    cdef char *mp_encode_custom(self, char *p, TypeCodec codec,
+                                object o) except NULL
+    cdef char *mp_encode_str_obj(self, char *p, object o) except NULL
+    cdef char *mp_encode_bytes_obj(self, char *p, object o) except NULL
+    cdef char *mp_encode_int_obj(self, char *p, object o) except NULL
     cdef char *mp_encode_obj(self, char *p, object o) except NULL
+    cdef char *mp_encode_obj_slow(self, char *p, object o) except NULL
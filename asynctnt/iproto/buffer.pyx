@@ -8,13 +8,15 @@ cimport cython
 from cpython.datetime cimport datetime
 from cpython.mem cimport PyMem_Free, PyMem_Malloc, PyMem_Realloc
 from cpython.ref cimport PyObject
-from libc.stdint cimport int64_t, uint8_t, uint32_t, uint64_t
+from libc.stdint cimport int8_t, int64_t, uint8_t, uint32_t, uint64_t
 from libc.stdio cimport printf
 from libc.string cimport memcpy
 
 from decimal import Decimal  # pragma: nocover
 from uuid import UUID  # pragma: nocover
 
+_decimal_to_str = Decimal.__str__
+
 
 # noinspection PyUnresolvedReferences
 # noinspection PyAttributeOutsideInit
@@ -222,19 +224,13 @@ cdef class WriteBuffer:
     cdef char *mp_encode_decimal(self, char *p, object value) except NULL:
         cdef:
             char *begin
-            uint8_t sign
-            tuple digits
-            uint32_t digits_count
-            int exponent
+            str value_str
+            IProtoDecimal dec
             uint32_t length
 
-        decimal_tuple = value.as_tuple()
-        sign = <uint8_t> decimal_tuple.sign
-        digits = <tuple> decimal_tuple.digits
-        exponent = <int> decimal_tuple.exponent
-
-        digits_count = <uint32_t> len(digits)
-        length = decimal_len(exponent, digits_count)
+        value_str = _decimal_to_str(value)
+        decimal_from_str(value_str, &dec)
+        length = decimal_len(dec.exponent, dec.digits_count)
 
         p = begin = self._ensure_allocated(p, mp_sizeof_ext(length))
 
@@ -242,7 +238,7 @@ cdef class WriteBuffer:
         p = mp_encode_extl(p, tarantool.MP_DECIMAL, length)
 
         # encode decimal
-        p = decimal_encode(p, digits_count, sign, digits, exponent)
+        p = decimal_encode(p, &dec)
 
         self._length += (p - begin)
         return p
@@ -368,45 +364,143 @@ cdef class WriteBuffer:
 
         return p
 
-    cdef char *mp_encode_obj(self, char *p, object o) except NULL:
+    cdef char *mp_encode_ext(self, char *p, int8_t ext_id,
+                             object data) except NULL:
+        cdef:
+            char *begin
+            char *data_str
+            ssize_t data_len
+
+        if not cpython.PyBytes_CheckExact(data):
+            raise TypeError(
+                'ext encoder must return bytes, got {}'.format(type(data)))
+
+        data_str = NULL
+        data_len = 0
+        cpython.bytes.PyBytes_AsStringAndSize(data, &data_str, &data_len)
+
+        p = begin = self._ensure_allocated(
+            p, mp_sizeof_ext(<uint32_t> data_len))
+        p = mp_encode_ext(p, ext_id, data_str, <uint32_t> data_len)
+        self._length += (p - begin)
+        return p
+
+    cdef char *mp_encode_custom(self, char *p, TypeCodec codec,
+                                object o) except NULL:
+        value = codec.encoder(o)
+        if codec.is_ext:
+            return self.mp_encode_ext(p, codec.ext_id, value)
+
+        if type(value) is type(o):
+            raise TypeError(
+                'encoder for type `{}` must convert the value '
+                'to another type'.format(type(o)))
+        return self.mp_encode_obj(p, value)
+
+    cdef char *mp_encode_str_obj(self, char *p, object o) except NULL:
         cdef:
             bytes o_string_temp
             char *o_string_str
             ssize_t o_string_len
 
+        o_string_temp = encode_unicode_string(o, self._encoding)
+        o_string_str = NULL
+        o_string_len = 0
+        cpython.bytes.PyBytes_AsStringAndSize(o_string_temp,
+                                              &o_string_str,
+                                              &o_string_len)
+
+        return self.mp_encode_str(p, o_string_str, <uint32_t> o_string_len)
+
+    cdef char *mp_encode_bytes_obj(self, char *p, object o) except NULL:
+        cdef:
+            char *o_string_str
+            ssize_t o_string_len
+
+        o_string_str = NULL
+        o_string_len = 0
+        cpython.bytes.PyBytes_AsStringAndSize(o,
+                                              &o_string_str,
+                                              &o_string_len)
+        return self.mp_encode_bin(p, o_string_str, <uint32_t> o_string_len)
+
+    cdef char *mp_encode_int_obj(self, char *p, object o) except NULL:
+        if o >= 0:
+            return self.mp_encode_uint(p, <uint64_t> o)
+        else:
+            return self.mp_encode_int(p, <int64_t> o)
+
+    cdef char *mp_encode_obj(self, char *p, object o) except NULL:
+        cdef:
+            object t
+            PyObject *codec_p
+
         if o is None:
             return self.mp_encode_nil(p)
 
-        elif isinstance(o, float):
+        # Exact type dispatch for the most common types first.
+        # Subclasses are handled by mp_encode_obj_slow()
+        t = type(o)
+        if t is str:
+            return self.mp_encode_str_obj(p, o)
+
+        elif t is int:
+            return self.mp_encode_int_obj(p, o)
+
+        elif t is float:
+            return self.mp_encode_double(p, <double> o)
+
+        elif t is bool:
+            return self.mp_encode_bool(p, <bint> o)
+
+        elif t is list:
+            return self.mp_encode_list(p, <list> o)
+
+        elif t is dict:
+            return self.mp_encode_dict(p, <dict> o)
+
+        elif t is tuple:
+            return self.mp_encode_tuple(p, <tuple> o)
+
+        elif t is bytes:
+            return self.mp_encode_bytes_obj(p, o)
+
+        if _type_codecs:
+            codec_p = cpython.dict.PyDict_GetItem(_type_codecs, t)
+            if codec_p is not NULL:
+                return self.mp_encode_custom(p, <TypeCodec> codec_p, o)
+
+        if t is datetime:
+            return self.mp_encode_datetime(p, o)
+
+        elif t is Decimal:
+            return self.mp_encode_decimal(p, o)
+
+        elif t is UUID:
+            return self.mp_encode_uuid(p, o)
+
+        elif t is MPInterval:
+            return self.mp_encode_interval(p, <MPInterval> o)
+
+        return self.mp_encode_obj_slow(p, o)
+
+    cdef char *mp_encode_obj_slow(self, char *p, object o) except NULL:
+        cdef TypeCodec codec
+
+        if isinstance(o, float):
             return self.mp_encode_double(p, <double> o)
 
         elif isinstance(o, bool):
             return self.mp_encode_bool(p, <bint> o)
 
         elif isinstance(o, int):
-            if o >= 0:
-                return self.mp_encode_uint(p, <uint64_t> o)
-            else:
-                return self.mp_encode_int(p, <int64_t> o)
+            return self.mp_encode_int_obj(p, o)
 
         elif isinstance(o, bytes):
-            o_string_str = NULL
-            o_string_len = 0
-            cpython.bytes.PyBytes_AsStringAndSize(o,
-                                                  &o_string_str,
-                                                  &o_string_len)
-            return self.mp_encode_bin(p, o_string_str, <uint32_t> o_string_len)
+            return self.mp_encode_bytes_obj(p, o)
 
         elif isinstance(o, str):
-            o_string_temp = encode_unicode_string(o, self._encoding)
-            o_string_str = NULL
-            o_string_len = 0
-            cpython.bytes.PyBytes_AsStringAndSize(o_string_temp,
-                                                  &o_string_str,
-                                                  &o_string_len)
-
-            p = self.mp_encode_str(p, o_string_str, <uint32_t> o_string_len)
-            return p
+            return self.mp_encode_str_obj(p, o)
 
         elif isinstance(o, list):
             return self.mp_encode_list(p, <list> o)
@@ -429,6 +523,9 @@ cdef class WriteBuffer:
         elif isinstance(o, UUID):
             return self.mp_encode_uuid(p, o)
 
-        else:
-            raise TypeError(
-                'Type `{}` is not supported for encoding'.format(type(o)))
+        codec = ext_registry_find_codec(o)
+        if codec is not None:
+            return self.mp_encode_custom(p, codec, o)
+
+        raise TypeError(
+            'Type `{}` is not supported for encoding'.format(type(o)))
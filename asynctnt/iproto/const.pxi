@@ -6,6 +6,9 @@ DEF _DEALLOCATE_RATIO = 4
 
 DEF METADATA_FREELIST_SIZE = 128
 DEF REQUEST_FREELIST = 256
+DEF METADATA_CACHE_SIZE = 1024
+DEF WRITE_CORK_MAX = 1024
+DEF SCHEMA_SNAPSHOT_VERSION = 1
 
 # Header length description:
 # pkt_len +
@@ -29,3 +32,7 @@ DEF SPACE_VSPACE = 281
 DEF SPACE_VINDEX = 289
 
 DEF DATETIME_TAIL_SZ = 4 + 2 + 2
+
+# sign + 'E' + exponent sign + exponent digits + '\0'
+DEF DECIMAL_STR_OVERHEAD = 16
+DEF DECIMAL_STR_BUF_SIZE = 64
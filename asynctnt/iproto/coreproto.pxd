@@ -22,12 +22,19 @@ cdef class CoreProtocol:
 
         ReadBuffer rbuf
         tuple version
+        str instance_uuid
         bytes salt
 
+        list _corked
+        int _cork_depth
+
     cdef bint _is_connected(self)
     cdef bint _is_fully_connected(self)
 
     cdef void _write(self, buf) except *
+    cdef void _cork(self)
+    cdef void _uncork(self) except *
+    cdef void _flush_corked(self) except *
     cdef void _on_data_received(self, data)
     cdef void _process__greeting(self)
     cdef void _on_greeting_received(self)
@@ -13,6 +13,7 @@ from asynctnt.exceptions import TarantoolDatabaseError
 from asynctnt.log import logger
 
 VERSION_STRING_REGEX = re.compile(r'\s*Tarantool\s+([\d.]+)\s+.*')
+INSTANCE_UUID_REGEX = re.compile(r'\(\w+\)\s+([0-9a-fA-F-]{36})')
 
 
 cdef class CoreProtocol:
@@ -39,7 +40,10 @@ cdef class CoreProtocol:
         self.con_state = CONNECTION_BAD
 
         self.version = None
+        self.instance_uuid = None
         self.salt = None
+        self._corked = None
+        self._cork_depth = 0
 
     cdef bint _is_connected(self):
         return self.con_state != CONNECTION_BAD
@@ -57,8 +61,37 @@ cdef class CoreProtocol:
         return self.version
 
     cdef void _write(self, buf) except *:
+        if self._corked is not None:
+            self._corked.append(memoryview(buf))
+            if len(self._corked) >= WRITE_CORK_MAX:
+                self._flush_corked()
+            return
+
         self.transport.write(memoryview(buf))
 
+    cdef void _cork(self):
+        # buffer subsequent writes to send them all at once
+        self._cork_depth += 1
+        if self._corked is None:
+            self._corked = []
+
+    cdef void _uncork(self) except *:
+        if self._cork_depth == 0:
+            return
+
+        self._cork_depth -= 1
+        if self._cork_depth == 0:
+            self._flush_corked()
+            self._corked = None
+
+    cdef void _flush_corked(self) except *:
+        cdef list bufs
+
+        bufs = self._corked
+        if bufs:
+            self._corked = []
+            self.transport.writelines(bufs)
+
     cdef void _on_data_received(self, data):
         cdef:
             size_t ruse, curr
@@ -132,7 +165,9 @@ cdef class CoreProtocol:
     cdef void _process__greeting(self):
         cdef size_t ver_length = TARANTOOL_VERSION_LENGTH
         rbuf = self.rbuf
-        self.version = self._parse_version(self.rbuf.get_slice_end(ver_length))
+        version_line = self.rbuf.get_slice_end(ver_length)
+        self.version = self._parse_version(version_line)
+        self.instance_uuid = self._parse_instance_uuid(version_line)
         self.salt = base64.b64decode(
             self.rbuf.get_slice(ver_length,
                                 ver_length + SALT_LENGTH)
@@ -146,6 +181,11 @@ cdef class CoreProtocol:
             ver = m.group(1)
             return tuple(map(int, ver.split('.')))
 
+    def _parse_instance_uuid(self, version):
+        m = INSTANCE_UUID_REGEX.search(version.decode('ascii'))
+        if m is not None:
+            return m.group(1)
+
     cdef void _on_greeting_received(self):
         pass
 
@@ -179,6 +219,7 @@ cdef class CoreProtocol:
     def connection_lost(self, exc):
         self.con_state = CONNECTION_BAD
         self.version = None
+        self.instance_uuid = None
         self.salt = None
         self.rbuf = None
 
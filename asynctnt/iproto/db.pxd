@@ -2,6 +2,9 @@ cimport cython
 from libc.stdint cimport uint32_t, uint64_t
 
 
+cdef void chain_future(object source, object target)
+
+
 @cython.final
 cdef class Db:
     cdef:
@@ -13,6 +16,11 @@ cdef class Db:
     cdef inline Db create(BaseProtocol protocol, uint64_t stream_id)
 
     cdef inline uint64_t next_sync(self)
+    cdef inline object _space_load(self, object space)
+    cdef object _after_space_load(self, object load, object request)
+    cdef list _after_space_load_many(self, object load, Py_ssize_t n,
+                                     object request)
+    cdef inline object _record_cls(self, SchemaSpace sp)
 
     cdef object _ping(self, float timeout)
 
@@ -31,6 +39,18 @@ cdef class Db:
                       float timeout,
                       bint push_subscribe)
 
+    cdef object _call_many(self,
+                           tarantool.iproto_type op,
+                           str func_name,
+                           object args_list,
+                           float timeout)
+
+    cdef object _call_template(self,
+                               RequestTemplate template,
+                               object args,
+                               float timeout,
+                               bint push_subscribe)
+
     cdef object _eval(self,
                       str expression,
                       object args,
@@ -53,6 +73,18 @@ cdef class Db:
                         bint replace,
                         float timeout)
 
+    cdef object _select_many(self,
+                             object space,
+                             object index,
+                             object keys,
+                             float timeout)
+
+    cdef list _insert_many(self,
+                           object space,
+                           object tuples,
+                           bint replace,
+                           float timeout)
+
     cdef object _delete(self,
                         object space,
                         object index,
@@ -66,18 +98,35 @@ cdef class Db:
                         list operations,
                         float timeout)
 
+    cdef object _update_template(self,
+                                 UpdateRequestTemplate template,
+                                 object key,
+                                 object params,
+                                 float timeout)
+
     cdef object _upsert(self,
                         object space,
                         object t,
                         list operations,
                         float timeout)
 
+    cdef ExecuteRequest _execute_request(self,
+                                         object query,
+                                         object args,
+                                         bint parse_metadata)
+
     cdef object _execute(self,
                          query,
                          object args,
                          bint parse_metadata,
                          float timeout)
 
+    cdef list _execute_many(self,
+                            query,
+                            object args_list,
+                            bint parse_metadata,
+                            float timeout)
+
     cdef object _prepare(self,
                          query,
                          bint parse_metadata,
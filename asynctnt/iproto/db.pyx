@@ -1,6 +1,22 @@
 cimport cython
 
 
+cdef void chain_future(object source, object target):
+    def on_done(f):
+        if target.done():
+            return
+        if f.cancelled():
+            target.cancel()
+            return
+        e = f.exception()
+        if e is not None:
+            target.set_exception(e)
+        else:
+            target.set_result(f.result())
+
+    source.add_done_callback(on_done)
+
+
 @cython.final
 cdef class Db:
     def __cinit__(self):
@@ -19,6 +35,79 @@ cdef class Db:
     cdef inline uint64_t next_sync(self):
         return self._protocol.next_sync()
 
+    cdef inline object _space_load(self, object space):
+        # returns a future if the space has to be loaded first
+        if not self._protocol.lazy_schema \
+                or not isinstance(space, str) \
+                or space in self._protocol._schema.spaces:
+            return None
+        return self._protocol._load_space(<str> space)
+
+    cdef object _after_space_load(self, object load, object request):
+        waiter = self._protocol.create_future()
+
+        def on_load(f):
+            if waiter.done():
+                return
+            if f.cancelled():
+                waiter.cancel()
+                return
+            e = f.exception()
+            if e is not None:
+                waiter.set_exception(e)
+                return
+            try:
+                fut = request()
+            except Exception as e:
+                waiter.set_exception(e)
+                return
+            chain_future(fut, waiter)
+
+        load.add_done_callback(on_load)
+        return waiter
+
+    cdef list _after_space_load_many(self, object load, Py_ssize_t n,
+                                     object request):
+        cdef list waiters = [self._protocol.create_future() for _ in range(n)]
+
+        def on_load(f):
+            if f.cancelled():
+                for waiter in waiters:
+                    waiter.cancel()
+                return
+            e = f.exception()
+            if e is None:
+                try:
+                    futures = request()
+                except Exception as ex:
+                    e = ex
+            if e is not None:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(e)
+                return
+            for fut, waiter in zip(futures, waiters):
+                chain_future(fut, waiter)
+
+        load.add_done_callback(on_load)
+        return waiters
+
+    cdef inline object _record_cls(self, SchemaSpace sp):
+        cdef:
+            dict registry
+            PyObject *obj_p
+
+        registry = self._protocol._record_classes
+        if not registry:
+            return None
+
+        obj_p = cpython.dict.PyDict_GetItem(registry, sp.sid)
+        if obj_p is NULL and sp.name is not None:
+            obj_p = cpython.dict.PyDict_GetItem(registry, sp.name)
+        if obj_p is NULL:
+            return None
+        return <object> obj_p
+
     cdef object _ping(self, float timeout):
         cdef PingRequest req = PingRequest.__new__(PingRequest)
         req.op = tarantool.IPROTO_PING
@@ -73,6 +162,48 @@ cdef class Db:
         req.check_schema_change = True
         return self._protocol.execute(self._protocol, req, timeout)
 
+    cdef object _call_many(self,
+                           tarantool.iproto_type op,
+                           str func_name,
+                           object args_list,
+                           float timeout):
+        # func_name is None - args_list contains (func_name, args) pairs
+        cdef:
+            CallRequest req
+            list reqs
+
+        reqs = []
+        for args in args_list:
+            req = CallRequest.__new__(CallRequest)
+            req.op = op
+            req.sync = self.next_sync()
+            req.stream_id = self._stream_id
+            if func_name is None:
+                req.func_name, req.args = args
+            else:
+                req.func_name = func_name
+                req.args = args
+            req.push_subscribe = False
+            req.check_schema_change = True
+            reqs.append(req)
+
+        return self._protocol._execute_batch(reqs, timeout)
+
+    cdef object _call_template(self,
+                               RequestTemplate template,
+                               object args,
+                               float timeout,
+                               bint push_subscribe):
+        cdef TemplateRequest req = TemplateRequest.__new__(TemplateRequest)
+        req.op = template.op
+        req.sync = self.next_sync()
+        req.stream_id = self._stream_id
+        req.template = template
+        req.args = args
+        req.push_subscribe = push_subscribe
+        req.check_schema_change = True
+        return self._protocol._execute_template(req, timeout)
+
     cdef object _eval(self,
                       str expression,
                       object args,
@@ -125,9 +256,49 @@ cdef class Db:
         req.push_subscribe = False
         req.check_schema_change = check_schema_change
         req.parse_as_tuples = True
+        req.record_cls = self._record_cls(sp)
 
         return self._protocol.execute(self._protocol, req, timeout)
 
+    cdef object _select_many(self,
+                             object space,
+                             object index,
+                             object keys,
+                             float timeout):
+        cdef:
+            SchemaSpace sp
+            SchemaIndex idx
+            SelectRequest req
+            object record_cls
+            list reqs
+
+        sp = self._protocol._schema.get_or_create_space(space)
+        idx = sp.get_index(index)
+        record_cls = self._record_cls(sp)
+
+        reqs = []
+        for key in keys:
+            if not isinstance(key, (list, tuple, dict)):
+                key = [key]
+
+            req = SelectRequest.__new__(SelectRequest)
+            req.op = tarantool.IPROTO_SELECT
+            req.sync = self.next_sync()
+            req.stream_id = self._stream_id
+            req.space = sp
+            req.index = idx
+            req.key = key
+            req.offset = 0
+            req.limit = 1
+            req.iterator = 0  # EQ
+            req.push_subscribe = False
+            req.check_schema_change = True
+            req.parse_as_tuples = True
+            req.record_cls = record_cls
+            reqs.append(req)
+
+        return self._protocol._execute_batch(reqs, timeout)
+
     cdef object _insert(self,
                         object space,
                         object t,
@@ -148,9 +319,41 @@ cdef class Db:
         req.push_subscribe = False
         req.check_schema_change = True
         req.parse_as_tuples = True
+        req.record_cls = self._record_cls(sp)
 
         return self._protocol.execute(self._protocol, req, timeout)
 
+    cdef list _insert_many(self,
+                           object space,
+                           object tuples,
+                           bint replace,
+                           float timeout):
+        cdef:
+            SchemaSpace sp
+            InsertRequest req
+            object record_cls
+            list reqs
+
+        sp = self._protocol._schema.get_or_create_space(space)
+        record_cls = self._record_cls(sp)
+
+        reqs = []
+        for t in tuples:
+            req = InsertRequest.__new__(InsertRequest)
+            req.op = tarantool.IPROTO_REPLACE if replace \
+                else tarantool.IPROTO_INSERT
+            req.sync = self.next_sync()
+            req.stream_id = self._stream_id
+            req.space = sp
+            req.t = t
+            req.push_subscribe = False
+            req.check_schema_change = True
+            req.parse_as_tuples = True
+            req.record_cls = record_cls
+            reqs.append(req)
+
+        return self._protocol._execute_many(reqs, timeout)
+
     cdef object _delete(self,
                         object space,
                         object index,
@@ -174,6 +377,7 @@ cdef class Db:
         req.push_subscribe = False
         req.check_schema_change = True
         req.parse_as_tuples = True
+        req.record_cls = self._record_cls(sp)
 
         return self._protocol.execute(self._protocol, req, timeout)
 
@@ -202,6 +406,42 @@ cdef class Db:
         req.push_subscribe = False
         req.check_schema_change = True
         req.parse_as_tuples = True
+        req.record_cls = self._record_cls(sp)
+
+        return self._protocol.execute(self._protocol, req, timeout)
+
+    cdef object _update_template(self,
+                                 UpdateRequestTemplate template,
+                                 object key,
+                                 object params,
+                                 float timeout):
+        cdef:
+            SchemaSpace sp
+            UpdateTemplateRequest req
+
+        if template.params_count > 0 or params is not None:
+            if not isinstance(params, (list, tuple)):
+                raise TypeError('params must be either list or tuple')
+            if len(params) != template.params_count:
+                raise ValueError(
+                    'Expected {} params, got {}'.format(template.params_count,
+                                                        len(params)))
+
+        sp = self._protocol._schema.get_or_create_space(template.space)
+
+        req = UpdateTemplateRequest.__new__(UpdateTemplateRequest)
+        req.op = tarantool.IPROTO_UPDATE
+        req.sync = self.next_sync()
+        req.stream_id = self._stream_id
+        req.space = sp
+        req.index = sp.get_index(template.index)
+        req.template = template
+        req.key = key
+        req.params = params
+        req.push_subscribe = False
+        req.check_schema_change = True
+        req.parse_as_tuples = True
+        req.record_cls = self._record_cls(sp)
 
         return self._protocol.execute(self._protocol, req, timeout)
 
@@ -229,11 +469,10 @@ cdef class Db:
 
         return self._protocol.execute(self._protocol, req, timeout)
 
-    cdef object _execute(self,
-                         object query,
-                         object args,
-                         bint parse_metadata,
-                         float timeout):
+    cdef ExecuteRequest _execute_request(self,
+                                         object query,
+                                         object args,
+                                         bint parse_metadata):
         cdef:
             ExecuteRequest req
 
@@ -256,8 +495,29 @@ cdef class Db:
         req.push_subscribe = False
         req.check_schema_change = True
         req.parse_as_tuples = True
+        return req
 
-        return self._protocol.execute(self._protocol, req, timeout)
+    cdef object _execute(self,
+                         object query,
+                         object args,
+                         bint parse_metadata,
+                         float timeout):
+        return self._protocol.execute(
+            self._protocol,
+            self._execute_request(query, args, parse_metadata),
+            timeout
+        )
+
+    cdef list _execute_many(self,
+                            object query,
+                            object args_list,
+                            bint parse_metadata,
+                            float timeout):
+        cdef list reqs
+
+        reqs = [self._execute_request(query, args, parse_metadata)
+                for args in args_list]
+        return self._protocol._execute_many(reqs, timeout)
 
     cdef object _prepare(self,
                          object query,
@@ -324,9 +584,27 @@ cdef class Db:
     def stream_id(self):
         return <int> self._stream_id
 
+    @property
+    def schema_id(self):
+        return self._protocol._schema_id
+
     def set_stream_id(self, int stream_id):
         self._stream_id = <uint64_t> stream_id
 
+    def create_stream(self):
+        return self._protocol._create_db(<bint> True)
+
+    def cork(self):
+        self._protocol._cork()
+
+    def uncork(self):
+        self._protocol._uncork()
+
+    def space_load(self, object space):
+        # requests to a space being loaded are sent after the load, so
+        # it has to be awaited before corking requests which keep order
+        return self._space_load(space)
+
     def ping(self, float timeout=-1):
         return self._ping(timeout)
 
@@ -352,6 +630,33 @@ cdef class Db:
                           timeout,
                           <bint> push_subscribe)
 
+    def call_template(self,
+                      RequestTemplate template,
+                      object args=None,
+                      float timeout=-1,
+                      bint push_subscribe=False):
+        return self._call_template(template,
+                                   args,
+                                   timeout,
+                                   <bint> push_subscribe)
+
+    def call_many(self,
+                  str func_name,
+                  object args_list,
+                  float timeout=-1):
+        return self._call_many(tarantool.IPROTO_CALL,
+                               func_name,
+                               args_list,
+                               timeout)
+
+    def call_batch(self,
+                   object calls,
+                   float timeout=-1):
+        return self._call_many(tarantool.IPROTO_CALL,
+                               None,
+                               calls,
+                               timeout)
+
     def eval(self,
              str expression,
              object args=None,
@@ -371,20 +676,65 @@ cdef class Db:
                object iterator=0,
                float timeout=-1,
                bint check_schema_change=True):
+        load = self._space_load(space)
+        if load is not None:
+            return self._after_space_load(
+                load,
+                lambda: self._select(space, index, key, offset, limit,
+                                     iterator, timeout, check_schema_change)
+            )
         return self._select(space, index, key, offset, limit, iterator,
                             timeout, check_schema_change)
 
+    def select_many(self,
+                    object space,
+                    object keys,
+                    object index=0,
+                    float timeout=-1):
+        load = self._space_load(space)
+        if load is not None:
+            keys = list(keys)
+            return self._after_space_load(
+                load, lambda: self._select_many(space, index, keys, timeout)
+            )
+        return self._select_many(space, index, keys, timeout)
+
     def insert(self,
                object space,
                object t,
                bint replace=False,
                float timeout=-1):
+        load = self._space_load(space)
+        if load is not None:
+            return self._after_space_load(
+                load, lambda: self._insert(space, t, <bint> replace, timeout)
+            )
         return self._insert(space, t, <bint> replace, timeout)
 
+    def insert_many(self,
+                    object space,
+                    object tuples,
+                    bint replace=False,
+                    float timeout=-1):
+        load = self._space_load(space)
+        if load is not None:
+            tuples = list(tuples)
+            return self._after_space_load_many(
+                load, len(tuples),
+                lambda: self._insert_many(space, tuples, <bint> replace,
+                                          timeout)
+            )
+        return self._insert_many(space, tuples, <bint> replace, timeout)
+
     def replace(self,
                 object space,
                 object t,
                 float timeout=-1):
+        load = self._space_load(space)
+        if load is not None:
+            return self._after_space_load(
+                load, lambda: self._insert(space, t, <bint> True, timeout)
+            )
         return self._insert(space, t, <bint> True, timeout)
 
     def delete(self,
@@ -392,6 +742,11 @@ cdef class Db:
                object key,
                object index=0,
                float timeout=-1):
+        load = self._space_load(space)
+        if load is not None:
+            return self._after_space_load(
+                load, lambda: self._delete(space, index, key, timeout)
+            )
         return self._delete(space, index, key, timeout)
 
     def update(self,
@@ -400,13 +755,37 @@ cdef class Db:
                list operations,
                object index=0,
                float timeout=-1):
+        load = self._space_load(space)
+        if load is not None:
+            return self._after_space_load(
+                load,
+                lambda: self._update(space, index, key, operations, timeout)
+            )
         return self._update(space, index, key, operations, timeout)
 
+    def update_template(self,
+                        UpdateRequestTemplate template,
+                        object key,
+                        object params=None,
+                        float timeout=-1):
+        load = self._space_load(template.space)
+        if load is not None:
+            return self._after_space_load(
+                load,
+                lambda: self._update_template(template, key, params, timeout)
+            )
+        return self._update_template(template, key, params, timeout)
+
     def upsert(self,
                object space,
                object t,
                list operations,
                float timeout=-1):
+        load = self._space_load(space)
+        if load is not None:
+            return self._after_space_load(
+                load, lambda: self._upsert(space, t, operations, timeout)
+            )
         return self._upsert(space, t, operations, timeout)
 
     def execute(self,
@@ -416,6 +795,14 @@ cdef class Db:
                 float timeout=-1):
         return self._execute(query, args, <bint> parse_metadata, timeout)
 
+    def execute_many(self,
+                     object query,
+                     object args_list,
+                     bint parse_metadata=True,
+                     float timeout=-1):
+        return self._execute_many(query, args_list,
+                                  <bint> parse_metadata, timeout)
+
     def prepare(self,
                 object query,
                 bint parse_metadata=True,
@@ -14,5 +14,6 @@ cdef char *datetime_encode(char *p, IProtoDateTime *dt) except NULL
 cdef int datetime_decode(const char ** p,
                          uint32_t length,
                          IProtoDateTime *dt) except -1
-cdef void datetime_from_py(datetime ob, IProtoDateTime *dt)
+cdef void datetime_from_py(datetime ob, IProtoDateTime *dt) except *
 cdef object datetime_to_py(IProtoDateTime *dt)
+cdef object datetime_to_ns(IProtoDateTime *dt)
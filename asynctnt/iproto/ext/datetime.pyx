@@ -1,7 +1,35 @@
 cimport cpython.datetime
-from cpython.datetime cimport PyDateTimeAPI, datetime, datetime_tzinfo, timedelta_new
+from cpython.datetime cimport (
+    PyDateTimeAPI,
+    datetime,
+    datetime_new,
+    datetime_tzinfo,
+    timedelta_days,
+    timedelta_new,
+    timedelta_seconds,
+)
+from cpython.ref cimport PyObject
 from libc.stdint cimport uint32_t
 from libc.string cimport memcpy
+from libc.time cimport time_t, tm
+
+
+cdef extern from "time.h":
+    """
+    static int asynctnt_localtime(time_t t, struct tm *out)
+    {
+    #ifdef _WIN32
+        return localtime_s(out, &t) == 0 ? 0 : -1;
+    #else
+        return localtime_r(&t, out) != NULL ? 0 : -1;
+    #endif
+    }
+    """
+    int asynctnt_localtime(time_t t, tm *out)
+
+
+# tzoffset (in minutes) -> datetime.timezone
+cdef dict _tz_cache = {}
 
 
 cdef inline void datetime_zero(IProtoDateTime *dt):
@@ -52,36 +80,156 @@ cdef int datetime_decode(
     dt.tzindex = load_u16(p[0])
     p[0] += 2
 
-cdef void datetime_from_py(datetime ob, IProtoDateTime *dt):
+cdef inline object _tz_from_offset(int16_t tzoffset):
+    cdef PyObject *tz_p
+
+    tz_p = cpython.dict.PyDict_GetItem(_tz_cache, <int> tzoffset)
+    if tz_p is not NULL:
+        return <object> tz_p
+
+    tz = timezone_new(timedelta_new(0, <int> tzoffset * 60, 0))
+    _tz_cache[<int> tzoffset] = tz
+    return tz
+
+cdef inline int64_t _days_from_civil(int64_t y, int64_t m, int64_t d):
+    # http://howardhinnant.github.io/date_algorithms.html#days_from_civil
+    cdef int64_t era, yoe, doy, doe
+
+    if m <= 2:
+        y -= 1
+    era = y // 400
+    yoe = y - era * 400
+    doy = (153 * (m - 3 if m > 2 else m + 9) + 2) // 5 + d - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+cdef inline void _civil_from_days(int64_t z, int *y, int *m, int *d):
+    # http://howardhinnant.github.io/date_algorithms.html#civil_from_days
+    cdef int64_t era, doe, yoe, doy, mp
+
+    z += 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    d[0] = <int> (doy - (153 * mp + 2) // 5 + 1)
+    m[0] = <int> (mp + 3 if mp < 10 else mp - 9)
+    y[0] = <int> (yoe + era * 400 + (1 if m[0] <= 2 else 0))
+
+cdef inline int _local_seconds(int64_t t, int64_t *local):
+    # seconds since the epoch of the local wall time at UTC time t
+    cdef tm lt
+
+    if <int64_t> <time_t> t != t or asynctnt_localtime(<time_t> t, &lt) != 0:
+        return -1
+    if lt.tm_sec > 59:
+        # leap second, as datetime.fromtimestamp() does
+        lt.tm_sec = 59
+    local[0] = (
+        _days_from_civil(lt.tm_year + 1900, lt.tm_mon + 1, lt.tm_mday) * 86400
+        + lt.tm_hour * 3600
+        + lt.tm_min * 60
+        + lt.tm_sec
+    )
+    return 0
+
+cdef inline int _local_fold(int64_t t, int64_t local):
+    # same probing as datetime.fromtimestamp(): the wall time is the
+    # second one of a repeated interval if it was also seen a bit earlier
+    cdef int64_t probe, transition
+
+    if _local_seconds(t - 86400, &probe) != 0:
+        return 0
+    transition = local - probe - 86400
+    if transition < 0:
+        if _local_seconds(t + transition, &probe) == 0 and probe == local:
+            return 1
+    return 0
+
+cdef void datetime_from_py(datetime ob, IProtoDateTime *dt) except *:
     cdef:
         double ts
         int offset
-    ts = <double> ob.timestamp()
-    dt.seconds = <int64_t> ts
-    dt.nsec = <int32_t> ((ts - <double> dt.seconds) * 1000000) * 1000
-    if dt.nsec < 0:
-        # correction for negative dates
-        dt.seconds -= 1
-        dt.nsec += 1000000000
-
-    if datetime_tzinfo(ob) is not None:
-        offset = ob.utcoffset().total_seconds()
-        dt.tzoffset = <int16_t> (offset / 60)
+        object utcoffset
+
+    if datetime_tzinfo(ob) is None:
+        # naive datetimes are in local time, so rely on the platform
+        ts = <double> ob.timestamp()
+        dt.seconds = <int64_t> ts
+        dt.nsec = <int32_t> ((ts - <double> dt.seconds) * 1000000) * 1000
+        if dt.nsec < 0:
+            # correction for negative dates
+            dt.seconds -= 1
+            dt.nsec += 1000000000
+        return
+
+    utcoffset = ob.utcoffset()
+    offset = timedelta_days(utcoffset) * 86400 + timedelta_seconds(utcoffset)
+    dt.seconds = (
+        _days_from_civil(
+            cpython.datetime.datetime_year(ob),
+            cpython.datetime.datetime_month(ob),
+            cpython.datetime.datetime_day(ob),
+        ) * 86400
+        + cpython.datetime.datetime_hour(ob) * 3600
+        + cpython.datetime.datetime_minute(ob) * 60
+        + cpython.datetime.datetime_second(ob)
+        - offset
+    )
+    dt.nsec = cpython.datetime.datetime_microsecond(ob) * 1000
+    dt.tzoffset = <int16_t> (offset // 60)
 
 cdef object datetime_to_py(IProtoDateTime *dt):
     cdef:
         double timestamp
-        object tz
+        int64_t seconds
+        int64_t local
+        int64_t days
+        int32_t sod
+        int32_t usec
+        int32_t nsec_rem
+        int year, month, day
+        int fold
 
-    tz = None
+    # round nanoseconds half-even, as datetime.fromtimestamp() does
+    seconds = dt.seconds
+    usec = dt.nsec // 1000
+    nsec_rem = dt.nsec % 1000
+    if nsec_rem > 500 or (nsec_rem == 500 and usec % 2 == 1):
+        usec += 1
+        if usec == 1000000:
+            usec = 0
+            seconds += 1
 
-    if dt.tzoffset != 0:
-        delta = timedelta_new(0, <int> dt.tzoffset * 60, 0)
-        tz = timezone_new(delta)
+    if dt.tzoffset == 0:
+        # naive datetime in local time
+        if _local_seconds(seconds, &local) != 0:
+            # out of the platform's range, let datetime raise the error
+            timestamp = dt.seconds + (<double> dt.nsec) / 1e9
+            return PyDateTimeAPI.DateTime_FromTimestamp(
+                <PyObject *>PyDateTimeAPI.DateTimeType,
+                (timestamp,),
+                NULL,
+            )
+        fold = _local_fold(seconds, local)
+        days = local // 86400
+        sod = <int32_t> (local - days * 86400)
+        _civil_from_days(days, &year, &month, &day)
+        return datetime_new(year, month, day,
+                            sod // 3600, (sod // 60) % 60, sod % 60,
+                            usec, None, fold)
 
-    timestamp = dt.seconds + (<double> dt.nsec) / 1e9
-    return PyDateTimeAPI.DateTime_FromTimestamp(
-        <PyObject *>PyDateTimeAPI.DateTimeType,
-        (timestamp,) if tz is None else (timestamp, tz),
-        NULL,
-    )
+    seconds += <int64_t> dt.tzoffset * 60
+    days = seconds // 86400
+    sod = <int32_t> (seconds - days * 86400)
+    _civil_from_days(days, &year, &month, &day)
+
+    return datetime_new(year, month, day,
+                        sod // 3600, (sod // 60) % 60, sod % 60,
+                        usec, _tz_from_offset(dt.tzoffset))
+
+cdef object datetime_to_ns(IProtoDateTime *dt):
+    if -9223372035 < dt.seconds < 9223372035:
+        return dt.seconds * 1000000000 + dt.nsec
+    return (<object> dt.seconds) * 1000000000 + dt.nsec
@@ -2,13 +2,17 @@ from libc cimport math
 from libc.stdint cimport uint8_t, uint32_t
 
 
+cdef struct IProtoDecimal:
+    uint8_t sign
+    int exponent
+    uint32_t digits_count
+    const char *digits_end  # end of ASCII digits (may include a '.')
+
+
 cdef inline uint32_t bcd_len(uint32_t digits_len):
     return <uint32_t> math.floor(digits_len / 2) + 1
 
 cdef uint32_t decimal_len(int exponent, uint32_t digits_count)
-cdef char *decimal_encode(char *p,
-                          uint32_t digits_count,
-                          uint8_t sign,
-                          tuple digits,
-                          int exponent) except NULL
+cdef int decimal_from_str(str s, IProtoDecimal *dec) except -1
+cdef char *decimal_encode(char *p, IProtoDecimal *dec) except NULL
 cdef object decimal_decode(const char ** p, uint32_t length)
@@ -1,4 +1,6 @@
-from libc.stdint cimport uint32_t
+from cpython.mem cimport PyMem_Free, PyMem_Malloc
+from libc.stdint cimport uint8_t, uint32_t
+from libc.stdio cimport snprintf
 
 from decimal import Decimal
 
@@ -15,41 +17,124 @@ cdef uint32_t decimal_len(int exponent, uint32_t digits_count):
 
     return length
 
-cdef char *decimal_encode(char *p,
-                          uint32_t digits_count,
-                          uint8_t sign,
-                          tuple digits,
-                          int exponent) except NULL:
+cdef int decimal_from_str(str s, IProtoDecimal *dec) except -1:
+    """
+        Parses a result of Decimal.__str__ (e.g. '-12.34', '1.2E+7')
+        without creating any intermediate Python objects
+    """
+    cdef:
+        const char *str_p
+        const char *end
+        const char *digits_start
+        Py_ssize_t str_len
+        uint32_t digits_total
+        uint32_t leading_zeros
+        int frac_count
+        bint dot_seen
+        bint exp_negative
+        int exp_value
+
+    str_p = cpython.unicode.PyUnicode_AsUTF8AndSize(s, &str_len)
+    end = str_p + str_len
+
+    dec.sign = 0
+    if str_p < end and str_p[0] == c'-':
+        dec.sign = 1
+        str_p += 1
+
+    digits_start = str_p
+    digits_total = 0
+    leading_zeros = 0
+    frac_count = 0
+    dot_seen = False
+    while str_p < end:
+        if c'0' <= str_p[0] <= c'9':
+            if str_p[0] == c'0' and leading_zeros == digits_total:
+                leading_zeros += 1
+            digits_total += 1
+            if dot_seen:
+                frac_count += 1
+        elif str_p[0] == c'.' and not dot_seen:
+            dot_seen = True
+        else:
+            break
+        str_p += 1
+
+    if digits_total == 0:
+        raise ValueError(
+            'Decimal value {!r} cannot be encoded'.format(s))
+
+    dec.digits_end = str_p
+
+    exp_value = 0
+    if str_p < end and (str_p[0] == c'E' or str_p[0] == c'e'):
+        str_p += 1
+        exp_negative = False
+        if str_p < end and (str_p[0] == c'-' or str_p[0] == c'+'):
+            exp_negative = str_p[0] == c'-'
+            str_p += 1
+        if str_p == end:
+            raise ValueError(
+                'Decimal value {!r} cannot be encoded'.format(s))
+        while str_p < end and c'0' <= str_p[0] <= c'9':
+            exp_value = exp_value * 10 + (str_p[0] - c'0')
+            str_p += 1
+        if exp_negative:
+            exp_value = -exp_value
+
+    if str_p != end:
+        # NaN, Infinity
+        raise ValueError(
+            'Decimal value {!r} cannot be encoded'.format(s))
+
+    # keep at least one digit for zero values
+    if leading_zeros == digits_total:
+        leading_zeros -= 1
+
+    dec.digits_count = digits_total - leading_zeros
+    dec.exponent = exp_value - frac_count
+    return 0
+
+cdef char *decimal_encode(char *p, IProtoDecimal *dec) except NULL:
     cdef:
         int i
         uint8_t byte
         char *out
+        const char *digit
         uint32_t length
 
     # encode exponent
-    if exponent > 0:
-        p = mp_encode_int(p, -exponent)
+    if dec.exponent > 0:
+        p = mp_encode_int(p, -dec.exponent)
     else:
-        p = mp_encode_uint(p, -exponent)
+        p = mp_encode_uint(p, -dec.exponent)
 
-    length = bcd_len(digits_count)
+    length = bcd_len(dec.digits_count)
 
     out = &p[length - 1]
-    if sign == 1:
+    if dec.sign == 1:
         byte = 0x0d
     else:
         byte = 0x0c
 
-    i = digits_count - 1
+    # digits are consumed from the end of the string, skipping the dot
+    digit = dec.digits_end
+    i = dec.digits_count - 1
     while out >= p:
         if i >= 0:
-            byte |= (<uint8_t> <object> cpython.tuple.PyTuple_GET_ITEM(digits, i)) << 4
+            digit -= 1
+            if digit[0] == c'.':
+                digit -= 1
+            byte |= (<uint8_t> (digit[0] - c'0')) << 4
 
         out[0] = byte
         byte = 0
 
         if i > 0:
-            byte = <uint8_t> <object> cpython.tuple.PyTuple_GET_ITEM(digits, i - 1) & 0xf
+            digit -= 1
+            if digit[0] == c'.':
+                digit -= 1
+            byte = <uint8_t> (digit[0] - c'0') & 0xf
 
         out -= 1
         i -= 2
@@ -65,9 +150,11 @@ cdef object decimal_decode(const char ** p, uint32_t length):
         const char *first
         const char *last
         uint32_t digits_count
-        uint8_t nibble
+        char buf[DECIMAL_STR_BUF_SIZE]
+        char *s
+        char *out
+        size_t s_size
 
-    sign = 0
     first = &p[0][0]
     last = first + length - 1
 
@@ -83,7 +170,7 @@ cdef object decimal_decode(const char ** p, uint32_t length):
     length -= (&p[0][0] - first)
     first = &p[0][0]
 
-    while first[0] == 0:
+    while first < last and first[0] == 0:
         first += 1  # skipping leading zeros
 
     sign = last[0] & 0xf  # extract sign
@@ -92,34 +179,38 @@ cdef object decimal_decode(const char ** p, uint32_t length):
     else:
         sign = 1
 
-    # decode digits
     digits_count = (last - first) * 2 + 1
-    if first[0] & 0xf0 == 0:
-        digits_count -= 1  # adjust for leading zero nibble
-
-    digits = cpython.tuple.PyTuple_New(digits_count)
-
-    if digits_count > 0:
-        while True:
-            nibble = (last[0] & 0xf0) >> 4  # left nibble first
-            item = <object> <int> nibble
-            cpython.Py_INCREF(item)
-            cpython.tuple.PyTuple_SET_ITEM(digits, digits_count - 1, item)
 
-            digits_count -= 1
-            if digits_count == 0:
-                break
-            last -= 1
-
-            nibble = last[0] & 0x0f  # right nibble
-            item = <object> <int> nibble
-            cpython.Py_INCREF(item)
-            cpython.tuple.PyTuple_SET_ITEM(digits, digits_count - 1, item)
-
-            digits_count -= 1
-            if digits_count == 0:
-                break
-
-    p[0] += length
-
-    return Decimal((<object> <int> sign, digits, <object> exponent))
+    s_size = digits_count + DECIMAL_STR_OVERHEAD
+    if s_size <= DECIMAL_STR_BUF_SIZE:
+        s = buf
+    else:
+        s = <char *> PyMem_Malloc(s_size)
+        if s is NULL:
+            raise MemoryError
+
+    try:
+        # Decimal's string parser is the fastest exact way
+        # to construct a Decimal from a coefficient and an exponent
+        out = s
+        if sign == 1:
+            out[0] = c'-'
+            out += 1
+
+        if first[0] & 0xf0 != 0 or first == last:
+            out[0] = <char> (c'0' + ((first[0] & 0xf0) >> 4))
+            out += 1
+        while first < last:
+            out[0] = <char> (c'0' + (first[0] & 0x0f))
+            first += 1
+            out[1] = <char> (c'0' + ((first[0] & 0xf0) >> 4))
+            out += 2
+
+        out += snprintf(out, s_size - (out - s), "E%d", exponent)
+
+        p[0] += length
+        return Decimal(cpython.unicode.PyUnicode_DecodeASCII(
+            s, out - s, NULL))
+    finally:
+        if s != buf:
+            PyMem_Free(s)
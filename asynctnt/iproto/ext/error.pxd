@@ -10,6 +10,10 @@ cdef class IProtoErrorStackFrame:
 
 cdef class IProtoError:
     cdef:
-        readonly list trace
+        bytes _raw
+        bytes _encoding
+        list _trace
+
+    cdef list _decode_trace(self)
 
 cdef IProtoError iproto_error_decode(const char ** b, bytes encoding)
@@ -1,3 +1,4 @@
+cimport cpython.bytes
 cimport cpython.list
 cimport cython
 from libc.stdint cimport uint32_t
@@ -14,7 +15,51 @@ cdef class IProtoErrorStackFrame:
 
 @cython.final
 cdef class IProtoError:
-    pass
+    """
+        Error stack is kept in its raw MessagePack form and decoded
+        only when :attr:`trace` is accessed
+    """
+
+    def __cinit__(self):
+        self._raw = None
+        self._encoding = None
+        self._trace = None
+
+    @property
+    def trace(self):
+        if self._trace is None and self._raw is not None:
+            self._trace = self._decode_trace()
+            self._raw = None
+        return self._trace
+
+    cdef list _decode_trace(self):
+        cdef:
+            const char *b
+            uint32_t size
+            uint32_t arr_size
+            uint32_t key
+            uint32_t i
+            list trace
+
+        b = cpython.bytes.PyBytes_AS_STRING(self._raw)
+        trace = None
+
+        size = mp_decode_map(&b)
+        for _ in range(size):
+            key = mp_decode_uint(&b)
+
+            if key == tarantool.MP_ERROR_STACK:
+                arr_size = mp_decode_array(&b)
+                trace = cpython.list.PyList_New(arr_size)
+                for i in range(arr_size):
+                    el = parse_iproto_error_stack_frame(&b, self._encoding)
+                    cpython.Py_INCREF(el)
+                    cpython.list.PyList_SET_ITEM(trace, i, el)
+            else:  # pragma: nocover
+                logger.debug(f"unknown iproto_error map field with key {key}")
+                mp_next(&b)
+
+        return trace
 
 cdef inline IProtoErrorStackFrame parse_iproto_error_stack_frame(const char ** b, bytes encoding):
     cdef:
@@ -66,7 +111,7 @@ cdef inline IProtoErrorStackFrame parse_iproto_error_stack_frame(const char ** b
                 raise TypeError(f'iproto_error stack frame fields must be a '
                                 f'map, but got {mp_typeof(b[0][0])}')
 
-            frame.fields = _decode_obj(b, encoding)
+            frame.fields = _decode_obj(b, encoding, False)
 
         else:  # pragma: nocover
             logger.debug(f"unknown iproto_error stack element with key {key}")
@@ -76,31 +121,13 @@ cdef inline IProtoErrorStackFrame parse_iproto_error_stack_frame(const char ** b
 
 cdef inline IProtoError iproto_error_decode(const char ** b, bytes encoding):
     cdef:
-        uint32_t size
-        uint32_t arr_size
-        uint32_t key
-        uint32_t i
+        const char *begin
         IProtoError error
 
-    size = 0
-    arr_size = 0
-    key = 0
-
     error = <IProtoError> IProtoError.__new__(IProtoError)
 
-    size = mp_decode_map(b)
-    for _ in range(size):
-        key = mp_decode_uint(b)
-
-        if key == tarantool.MP_ERROR_STACK:
-            arr_size = mp_decode_array(b)
-            error.trace = cpython.list.PyList_New(arr_size)
-            for i in range(arr_size):
-                el = parse_iproto_error_stack_frame(b, encoding)
-                cpython.Py_INCREF(el)
-                cpython.list.PyList_SET_ITEM(error.trace, i, el)
-        else:  # pragma: nocover
-            logger.debug(f"unknown iproto_error map field with key {key}")
-            mp_next(b)
-
+    begin = b[0]
+    mp_next(b)
+    error._raw = cpython.bytes.PyBytes_FromStringAndSize(begin, b[0] - begin)
+    error._encoding = encoding
     return error
@@ -0,0 +1,12 @@
+from libc.stdint cimport int8_t, uint32_t
+
+
+cdef class TypeCodec:
+    cdef:
+        readonly object py_type
+        readonly object encoder
+        readonly bint is_ext
+        readonly int8_t ext_id
+
+cdef object ext_registry_decode(object decoder, const char ** p, uint32_t length)
+cdef TypeCodec ext_registry_find_codec(object o)
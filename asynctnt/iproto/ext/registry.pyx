@@ -0,0 +1,154 @@
+cimport cpython.bytes
+cimport cpython.dict
+cimport cython
+from cpython.ref cimport PyObject
+from libc.stdint cimport int8_t, uint32_t
+
+
+@cython.final
+cdef class TypeCodec:
+    """
+        Encoder registered for a Python type
+    """
+
+    def __cinit__(self):
+        self.py_type = None
+        self.encoder = None
+        self.is_ext = False
+        self.ext_id = 0
+
+    def __repr__(self):  # pragma: nocover
+        return '<TypeCodec type={} ext_id={}>'.format(
+            self.py_type, self.ext_id if self.is_ext else None)
+
+
+# ext_id -> decoder(bytes) -> object
+cdef dict _ext_decoders = {}
+
+# exact python type -> TypeCodec
+cdef dict _type_codecs = {}
+
+
+cdef object ext_registry_decode(object decoder, const char ** p, uint32_t length):
+    data = cpython.bytes.PyBytes_FromStringAndSize(p[0], length)
+    p[0] += length
+    return decoder(data)
+
+cdef TypeCodec ext_registry_find_codec(object o):
+    cdef:
+        PyObject *obj_p
+        TypeCodec codec
+
+    obj_p = cpython.dict.PyDict_GetItem(_type_codecs, type(o))
+    if obj_p is not NULL:
+        return <TypeCodec> obj_p
+
+    # subclasses of the registered types
+    for codec in _type_codecs.values():
+        if isinstance(o, codec.py_type):
+            return codec
+
+    return None
+
+cdef inline void _check_ext_id(int ext_id) except *:
+    if ext_id < -128 or ext_id > 127:
+        raise ValueError('ext_id must be in range [-128, 127], '
+                         'got: {}'.format(ext_id))
+
+
+def register_ext_type(int ext_id, *, py_type=None, encoder=None, decoder=None):
+    """
+        Register a custom MessagePack extension type.
+
+        .. code-block:: python
+
+            class Money:
+                ...
+
+            asynctnt.register_ext_type(
+                42,
+                py_type=Money,
+                encoder=lambda m: m.to_bytes(),
+                decoder=Money.from_bytes,
+            )
+
+        Builtin extension ids (decimal, uuid, datetime, etc.) may be
+        overridden as well.
+
+        :param ext_id: extension type id
+        :param py_type: Python type encoded as this extension
+        :param encoder: callable returning extension payload (``bytes``)
+                        for a ``py_type`` object
+        :param decoder: callable constructing an object
+                        from an extension payload (``bytes``)
+    """
+    cdef TypeCodec codec
+
+    _check_ext_id(ext_id)
+    if (py_type is None) != (encoder is None):
+        raise ValueError('py_type and encoder must be specified together')
+    if py_type is None and decoder is None:
+        raise ValueError('either encoder or decoder must be specified')
+
+    if py_type is not None:
+        if not isinstance(py_type, type):
+            raise TypeError('py_type must be a type')
+
+        codec = <TypeCodec> TypeCodec.__new__(TypeCodec)
+        codec.py_type = py_type
+        codec.encoder = encoder
+        codec.is_ext = True
+        codec.ext_id = <int8_t> ext_id
+        _type_codecs[py_type] = codec
+
+    if decoder is not None:
+        _ext_decoders[ext_id] = decoder
+
+
+def unregister_ext_type(int ext_id):
+    """
+        Remove a custom MessagePack extension type registered with
+        :func:`asynctnt.register_ext_type`.
+
+        :param ext_id: extension type id
+    """
+    cdef TypeCodec codec
+
+    _check_ext_id(ext_id)
+    _ext_decoders.pop(ext_id, None)
+    for py_type, codec in list(_type_codecs.items()):
+        if codec.is_ext and codec.ext_id == ext_id:
+            del _type_codecs[py_type]
+
+
+def register_type_encoder(py_type, encoder):
+    """
+        Register an encoder for a Python type which is not supported
+        natively. ``encoder`` must convert an object to any value
+        supported by asynctnt (e.g. an ``Enum`` to its value, a money type
+        to a ``Decimal``), so no pre-conversion of the request
+        arguments is required.
+
+        :param py_type: Python type
+        :param encoder: callable converting a ``py_type`` object
+    """
+    cdef TypeCodec codec
+
+    if not isinstance(py_type, type):
+        raise TypeError('py_type must be a type')
+
+    codec = <TypeCodec> TypeCodec.__new__(TypeCodec)
+    codec.py_type = py_type
+    codec.encoder = encoder
+    codec.is_ext = False
+    _type_codecs[py_type] = codec
+
+
+def unregister_type_encoder(py_type):
+    """
+        Remove an encoder registered with
+        :func:`asynctnt.register_type_encoder`
+
+        :param py_type: Python type
+    """
+    _type_codecs.pop(py_type, None)
@@ -15,6 +15,7 @@ include "ext/uuid.pxd"
 include "ext/error.pxd"
 include "ext/datetime.pxd"
 include "ext/interval.pxd"
+include "ext/registry.pxd"
 include "buffer.pxd"
 include "rbuffer.pxd"
 
@@ -31,9 +32,13 @@ include "requests/prepare.pxd"
 include "requests/execute.pxd"
 include "requests/id.pxd"
 include "requests/auth.pxd"
+include "requests/watch.pxd"
 include "requests/streams.pxd"
+include "requests/template.pxd"
+include "requests/update_template.pxd"
 
 include "response.pxd"
+include "batch.pxd"
 include "db.pxd"
 include "push.pxd"
 
@@ -57,11 +62,18 @@ cdef class BaseProtocol(CoreProtocol):
         bint fetch_schema
         bint auto_refetch_schema
         float request_timeout
+        bint datetime_as_ns
+        bint pipelined_handshake
+        float schema_refetch_delay
+        bint lazy_schema
+        str schema_snapshot
+        bint shared_schema
         int post_con_state
 
         object connected_fut
         object on_connection_made_cb
         object on_connection_lost_cb
+        object on_watch_event_cb
 
         object _on_request_completed_cb
         object _on_request_timeout_cb
@@ -72,8 +84,19 @@ cdef class BaseProtocol(CoreProtocol):
         int64_t _schema_id
         bint _schema_fetch_in_progress
         object _refetch_schema_future
+        object _schema_refetch_handle
+        bint _schema_refetch_pending
+        int64_t _schema_id_seen
+        uint64_t _schema_refetches
+        uint64_t _schema_refetches_coalesced
+        dict _space_loads
+        bint _schema_snapshot_loaded
+        int64_t _server_schema_id
         Db _db
         IProtoFeatures _features
+        dict _record_classes
+        dict _watch_keys
+        dict _metadata_cache
         req_execute_func execute
 
         object create_future
@@ -83,9 +106,24 @@ cdef class BaseProtocol(CoreProtocol):
     cdef void _post_con_state_machine(self)
 
     cdef void _do_id(self)
+    cdef bint _on_id_done(self, object f)
     cdef void _do_auth(self, str username, str password)
+    cdef bint _on_auth_done(self, object f)
+    cdef object _send_schema_fetch(self)
+    cdef object _load_space(self, str name)
+    cdef SchemaSpace _on_space_loaded(self, Response space_resp,
+                                      Response index_resp)
+    cdef void _on_schema_fetched(self, object f, object fut)
     cdef void _do_fetch_schema(self, object fut)
+    cdef void _do_pipelined_handshake(self)
+    cdef void _send_watch(self, str key, tarantool.iproto_type op)
+    cdef void _watch_all(self)
+    cdef void _on_event(self, const char *buf, uint32_t buf_len)
+    cdef tuple _schema_snapshot_key(self)
+    cdef bint _load_schema_snapshot(self)
+    cdef void _save_schema_snapshot(self)
     cdef object _refetch_schema(self)
+    cdef void _schedule_schema_refetch(self, int64_t schema_id)
 
     cdef inline uint64_t next_sync(self)
     cdef inline uint64_t next_stream_id(self)
@@ -94,4 +132,8 @@ cdef class BaseProtocol(CoreProtocol):
     cdef object _new_waiter_for_request(self, Response response, BaseRequest req, float timeout)
     cdef Db _create_db(self, bint gen_stream_id)
     cdef object _execute_bad(self, BaseRequest req, float timeout)
+    cdef Response _new_response(self, BaseRequest req)
     cdef object _execute_normal(self, BaseRequest req, float timeout)
+    cdef object _execute_template(self, TemplateRequest req, float timeout)
+    cdef list _execute_many(self, list reqs, float timeout)
+    cdef object _execute_batch(self, list reqs, float timeout)
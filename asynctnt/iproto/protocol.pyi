@@ -1,5 +1,5 @@
 import asyncio
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from asynctnt.iproto.protocol import Adjust
 
@@ -54,6 +54,12 @@ class Schema:
     id: int
     spaces: Dict[Union[str, int], SchemaSpace]
 
+    def dumps(self, key: Any = None) -> bytes: ...
+    @staticmethod
+    def loads(data: bytes, key: Any = None) -> Optional["Schema"]: ...
+    @staticmethod
+    def attach(data: Any, key: Any = None) -> Optional["Schema"]: ...
+
 class TarantoolTuple:
     def __repr__(self) -> str: ...
     def __index__(self, i: int) -> Any: ...
@@ -117,10 +123,35 @@ class PushIterator:
     @property
     def response(self) -> Response: ...
 
+class RequestTemplate:
+    func_name: str
+
+    def __init__(self, func_name: str, *, call16: bool = False): ...
+
+class Param:
+    """Placeholder of a parameter in compiled update operations"""
+
+class UpdateRequestTemplate:
+    space: Union[str, int]
+    index: Union[str, int]
+    params_count: int
+
+    def __init__(
+        self,
+        space: Union[str, int],
+        operations: List[Any],
+        index: Union[str, int] = 0,
+    ): ...
+
 class Db:
     @property
     def stream_id(self) -> int: ...
+    @property
+    def schema_id(self) -> int: ...
     def set_stream_id(self, stream_id: int): ...
+    def create_stream(self) -> "Db": ...
+    def cork(self): ...
+    def uncork(self): ...
     def ping(self, timeout: float = -1): ...
     def call16(
         self,
@@ -136,6 +167,17 @@ class Db:
         timeout: float = -1,
         push_subscribe: bool = False,
     ): ...
+    def call_template(
+        self,
+        template: RequestTemplate,
+        args=None,
+        timeout: float = -1,
+        push_subscribe: bool = False,
+    ): ...
+    def call_many(
+        self, func_name: str, args_list, timeout: float = -1
+    ) -> asyncio.Future: ...
+    def call_batch(self, calls, timeout: float = -1) -> asyncio.Future: ...
     def eval(
         self,
         expression: str,
@@ -154,14 +196,30 @@ class Db:
         timeout: float = -1,
         check_schema_change: bool = True,
     ): ...
+    def select_many(
+        self, space, keys, index=0, timeout: float = -1
+    ) -> asyncio.Future: ...
     def insert(self, space, t, replace: bool = False, timeout: float = -1): ...
     def replace(self, space, t, timeout: float = -1): ...
+    def insert_many(
+        self, space, tuples, replace: bool = False, timeout: float = -1
+    ) -> List[asyncio.Future]: ...
     def delete(self, space, key, index=0, timeout: float = -1): ...
     def update(self, space, key, operations, index=0, timeout: float = -1): ...
+    def update_template(
+        self,
+        template: UpdateRequestTemplate,
+        key,
+        params=None,
+        timeout: float = -1,
+    ): ...
     def upsert(self, space, t, operations, timeout: float = -1): ...
     def execute(
         self, query, args, parse_metadata: bool = True, timeout: float = -1
     ): ...
+    def execute_many(
+        self, query, args_list, parse_metadata: bool = True, timeout: float = -1
+    ) -> List[asyncio.Future]: ...
     def prepare(self, query, parse_metadata: bool = True, timeout: float = -1): ...
     def begin(self, isolation: int, tx_timeout: float, timeout: float = -1): ...
     def commit(self, timeout: float = -1): ...
@@ -176,7 +234,13 @@ class Protocol:
     def features(self) -> IProtoFeatures: ...
     def create_db(self, gen_stream_id: bool = False) -> Db: ...
     def get_common_db(self) -> Db: ...
+    @property
+    def schema_refetches(self) -> int: ...
+    @property
+    def schema_refetches_coalesced(self) -> int: ...
     def refetch_schema(self) -> asyncio.Future: ...
+    def watch(self, key: str): ...
+    def unwatch(self, key: str): ...
     def is_connected(self) -> bool: ...
     def is_fully_connected(self) -> bool: ...
     def get_version(self) -> tuple: ...
@@ -217,3 +281,14 @@ class IProtoFeatures:
     dml_tuple_extension: bool
     call_ret_tuple_extension: bool
     call_arg_tuple_extension: bool
+
+def register_ext_type(
+    ext_id: int,
+    *,
+    py_type: Optional[type] = None,
+    encoder: Optional[Callable[[Any], bytes]] = None,
+    decoder: Optional[Callable[[bytes], Any]] = None,
+) -> None: ...
+def unregister_ext_type(ext_id: int) -> None: ...
+def register_type_encoder(py_type: type, encoder: Callable[[Any], Any]) -> None: ...
+def unregister_type_encoder(py_type: type) -> None: ...
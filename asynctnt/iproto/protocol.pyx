@@ -7,6 +7,8 @@ import_datetime()
 
 import asyncio
 import enum
+import mmap
+import os
 
 from asynctnt.exceptions import TarantoolNotConnectedError
 
@@ -19,6 +21,7 @@ include "ext/uuid.pyx"
 include "ext/error.pyx"
 include "ext/datetime.pyx"
 include "ext/interval.pyx"
+include "ext/registry.pyx"
 include "buffer.pyx"
 include "rbuffer.pyx"
 
@@ -35,10 +38,14 @@ include "requests/prepare.pyx"
 include "requests/execute.pyx"
 include "requests/id.pyx"
 include "requests/auth.pyx"
+include "requests/watch.pyx"
 include "requests/streams.pyx"
+include "requests/template.pyx"
+include "requests/update_template.pyx"
 
 include "ttuple.pyx"
 include "response.pyx"
+include "batch.pyx"
 include "db.pyx"
 include "push.pyx"
 
@@ -73,7 +80,16 @@ cdef class BaseProtocol(CoreProtocol):
                  loop,
                  request_timeout=None,
                  encoding=None,
-                 initial_read_buffer_size=None):
+                 initial_read_buffer_size=None,
+                 record_classes=None,
+                 datetime_as_ns=False,
+                 pipelined_handshake=False,
+                 schema_refetch_delay=0.0,
+                 lazy_schema=False,
+                 schema_snapshot=None,
+                 shared_schema=False,
+                 watch_keys=None,
+                 on_watch_event=None):
         CoreProtocol.__init__(self, host, port, encoding,
                               initial_read_buffer_size)
 
@@ -84,11 +100,22 @@ cdef class BaseProtocol(CoreProtocol):
         self.fetch_schema = fetch_schema
         self.auto_refetch_schema = auto_refetch_schema
         self.request_timeout = request_timeout or 0
+        self.datetime_as_ns = datetime_as_ns
+        self.pipelined_handshake = pipelined_handshake
+        self.schema_refetch_delay = schema_refetch_delay or 0
+        self.lazy_schema = lazy_schema and fetch_schema
+        # lazy schema is partial, so it is neither loaded nor saved
+        if fetch_schema and not self.lazy_schema:
+            self.schema_snapshot = schema_snapshot
+        else:
+            self.schema_snapshot = None
+        self.shared_schema = shared_schema and self.schema_snapshot is not None
         self.post_con_state = POST_CONNECTION_NONE
 
         self.connected_fut = connected_fut
         self.on_connection_made_cb = on_connection_made
         self.on_connection_lost_cb = on_connection_lost
+        self.on_watch_event_cb = on_watch_event
         self._closing = False
 
         self._on_request_completed_cb = self._on_request_completed
@@ -101,8 +128,19 @@ cdef class BaseProtocol(CoreProtocol):
         self._schema = Schema.__new__(Schema, self._schema_id)
         self._schema_fetch_in_progress = False
         self._refetch_schema_future = None
+        self._schema_refetch_handle = None
+        self._schema_refetch_pending = False
+        self._schema_id_seen = -1
+        self._schema_refetches = 0
+        self._schema_refetches_coalesced = 0
+        self._space_loads = {}
+        self._schema_snapshot_loaded = False
+        self._server_schema_id = -1
         self._db = self._create_db(<bint> False)
         self._features = IProtoFeatures.__new__(IProtoFeatures)
+        self._record_classes = record_classes if record_classes is not None else {}
+        self._watch_keys = watch_keys if watch_keys is not None else {}
+        self._metadata_cache = {}
         self.execute = self._execute_bad
 
         try:
@@ -125,6 +163,7 @@ cdef class BaseProtocol(CoreProtocol):
         if not self.connected_fut.done():
             self.connected_fut.set_result(True)
             self.con_state = CONNECTION_FULL
+            self._watch_all()
 
     cdef void _set_connection_error(self, e):
         if not self.connected_fut.done():
@@ -136,6 +175,11 @@ cdef class BaseProtocol(CoreProtocol):
     cdef void _on_greeting_received(self):
         self.post_con_state = POST_CONNECTION_ID
         self.execute = self._execute_normal
+        if self.schema_snapshot is not None:
+            self._schema_snapshot_loaded = self._load_schema_snapshot()
+        if self.pipelined_handshake:
+            self._do_pipelined_handshake()
+            return
         self._post_con_state_machine()
 
     cdef void _post_con_state_machine(self):
@@ -159,7 +203,11 @@ cdef class BaseProtocol(CoreProtocol):
                 self.post_con_state = POST_CONNECTION_SCHEMA
 
         if self.post_con_state == POST_CONNECTION_SCHEMA:
-            if self.fetch_schema:
+            if self.fetch_schema and self._schema_snapshot_loaded \
+                    and self._server_schema_id == self._schema_id:
+                # schema has not changed since the snapshot was saved
+                self.post_con_state = POST_CONNECTION_DONE
+            elif self.fetch_schema:
                 self._refetch_schema()
                 return
             else:
@@ -187,6 +235,10 @@ cdef class BaseProtocol(CoreProtocol):
         buf_len -= length
         buf = &buf[length]  # skip header
 
+        if hdr.code == tarantool.IPROTO_EVENT:
+            self._on_event(buf, buf_len)
+            return
+
         sync_obj = <object> hdr.sync
 
         response_p = cpython.dict.PyDict_GetItem(self._reqs, sync_obj)
@@ -224,7 +276,7 @@ cdef class BaseProtocol(CoreProtocol):
                 and self.auto_refetch_schema \
                 and response.schema_id_ > 0 \
                 and response.schema_id_ != self._schema_id:
-            self._refetch_schema()
+            self._schedule_schema_refetch(response.schema_id_)
 
         # returning result
         if is_chunk:
@@ -253,109 +305,455 @@ cdef class BaseProtocol(CoreProtocol):
         fut = self._db._id(0.0)
 
         def on_id(f):
-            if f.cancelled():
-                self._set_connection_error(asyncio.futures.CancelledError())
-                return
-            e = f.exception()
-            if not e:
-                self._features = (<Response> f.result()).result_
+            if self._on_id_done(f):
                 self.post_con_state = POST_CONNECTION_AUTH
                 self._post_con_state_machine()
-            else:
-                logger.error('Tarantool[%s:%s] identification failed: %s',
-                             self.host, self.port, str(e))
-                self._set_connection_error(e)
 
         fut.add_done_callback(on_id)
 
+    cdef bint _on_id_done(self, object f):
+        if f.cancelled():
+            self._set_connection_error(asyncio.futures.CancelledError())
+            return False
+        e = f.exception()
+        if not e:
+            self._server_schema_id = (<Response> f.result()).schema_id_
+            self._features = (<Response> f.result()).result_
+            self._schema.by_name = self._features.space_and_index_names
+            return True
+
+        logger.error('Tarantool[%s:%s] identification failed: %s',
+                     self.host, self.port, str(e))
+        self._set_connection_error(e)
+        return False
+
     cdef void _do_auth(self, str username, str password):
         # No extra error handling from Db.execute
         fut = self._db._auth(self.salt, username, password, 0)
 
         def on_authorized(f):
+            if self._on_auth_done(f):
+                self.post_con_state = POST_CONNECTION_SCHEMA
+                self._post_con_state_machine()
+
+        fut.add_done_callback(on_authorized)
+
+    cdef bint _on_auth_done(self, object f):
+        if f.cancelled():
+            self._set_connection_error(asyncio.futures.CancelledError())
+            return False
+        e = f.exception()
+        if not e:
+            self._server_schema_id = (<Response> f.result()).schema_id_
+            logger.debug('Tarantool[%s:%s] Authorized successfully',
+                         self.host, self.port)
+            return True
+
+        logger.error('Tarantool[%s:%s] Authorization failed: %s',
+                     self.host, self.port, str(e))
+        self._set_connection_error(e)
+        return False
+
+    cdef object _send_schema_fetch(self):
+        cdef:
+            list futures
+            SchemaSpace sp
+
+        if not self.lazy_schema:
+            futures = [
+                self._db._select(SPACE_VSPACE, 0, None, 0, 0xffffffff, 0,
+                                 0, False),
+                self._db._select(SPACE_VINDEX, 0, None, 0, 0xffffffff, 0,
+                                 0, False),
+            ]
+            return asyncio.gather(*futures, return_exceptions=False)
+
+        # only the spaces loaded so far are refetched in lazy mode
+        futures = []
+        self._cork()
+        try:
+            for sp in set(self._schema.spaces.values()):
+                if sp.row is None:
+                    continue
+                futures.append(self._db._select(SPACE_VSPACE, 0, [sp.sid],
+                                                0, 1, 0, 0, False))
+                futures.append(self._db._select(SPACE_VINDEX, 0, [sp.sid],
+                                                0, 0xffffffff, 0, 0, False))
+            if not futures:
+                # just to get the current schema id
+                futures.append(self._db._select(SPACE_VSPACE, 0, None,
+                                                0, 0, 0, 0, False))
+                futures.append(self._db._select(SPACE_VINDEX, 0, None,
+                                                0, 0, 0, 0, False))
+        finally:
+            self._uncork()
+        return asyncio.gather(*futures, return_exceptions=False)
+
+    cdef object _load_space(self, str name):
+        cdef PyObject *obj_p
+
+        obj_p = cpython.dict.PyDict_GetItem(self._space_loads, name)
+        if obj_p is not NULL:
+            return <object> obj_p
+
+        fut = self.create_future()
+        cpython.dict.PyDict_SetItem(self._space_loads, name, fut)
+
+        def done(result, exc):
+            self._space_loads.pop(name, None)
+            if fut.done():
+                return
+            if exc is not None:
+                fut.set_exception(exc)
+            else:
+                fut.set_result(result)
+
+        def on_vindex(f, space_resp):
             if f.cancelled():
-                self._set_connection_error(asyncio.futures.CancelledError())
+                done(None, asyncio.CancelledError())
+                return
+            e = f.exception()
+            if e is not None:
+                done(None, e)
+                return
+            try:
+                sp = self._on_space_loaded(<Response> space_resp,
+                                           <Response> f.result())
+            except Exception as e:
+                done(None, e)
+                return
+            done(sp, None)
+
+        def on_vspace(f):
+            cdef Response resp
+
+            if f.cancelled():
+                done(None, asyncio.CancelledError())
                 return
             e = f.exception()
-            if not e:
-                logger.debug('Tarantool[%s:%s] Authorized successfully',
-                             self.host, self.port)
+            if e is not None:
+                done(None, e)
+                return
 
-                self.post_con_state = POST_CONNECTION_SCHEMA
-                self._post_con_state_machine()
+            resp = <Response> f.result()
+            if len(resp) == 0:
+                logger.debug('Tarantool[%s:%s] Space %s not found',
+                             self.host, self.port, name)
+                done(None, None)
+                return
+
+            self._db._select(SPACE_VINDEX, 0, [resp[0][0]],
+                             0, 0xffffffff, 0, 0, False) \
+                .add_done_callback(lambda f: on_vindex(f, resp))
+
+        # _vspace index #2 is the space name index
+        self._db._select(SPACE_VSPACE, 2, [name], 0, 1, 0, 0, False) \
+            .add_done_callback(on_vspace)
+        return fut
+
+    cdef SchemaSpace _on_space_loaded(self, Response space_resp,
+                                      Response index_resp):
+        cdef:
+            SchemaSpace sp
+            bint schema_changed
+
+        schema_changed = self._schema_id != space_resp.schema_id_
+        if self._schema_id == -1:
+            self._schema_id = space_resp.schema_id_
+            self._schema.id = <int> self._schema_id
+            schema_changed = False
+
+        sp = self._schema.add_space(space_resp[0], list(index_resp))
+        logger.debug('Tarantool[%s:%s] Space %s loaded. Indexes: %d.',
+                     self.host, self.port, sp.name, len(index_resp))
+
+        if schema_changed and self.auto_refetch_schema:
+            # the other loaded spaces may be outdated
+            self._schedule_schema_refetch(space_resp.schema_id_)
+        return sp
+
+    cdef void _on_schema_fetched(self, object f, object fut):
+        self._schema_fetch_in_progress = False
+
+        if f.cancelled():
+            self._set_connection_error(asyncio.futures.CancelledError())
+            return
+        e = f.exception()
+        if not e:
+            responses = f.result()
+            schema_id = (<Response> responses[0]).schema_id_
+            if len(responses) == 2:
+                spaces, indexes = responses
             else:
-                logger.error('Tarantool[%s:%s] Authorization failed: %s',
-                             self.host, self.port, str(e))
-                self._set_connection_error(e)
+                spaces = [row for resp in responses[0::2] for row in resp]
+                indexes = [row for resp in responses[1::2] for row in resp]
+            logger.debug('Tarantool[%s:%s] Schema fetch succeeded. '
+                         'Version: %d, Spaces: %d, Indexes: %d.',
+                         self.host, self.port,
+                         schema_id, len(spaces), len(indexes))
+            try:
+                self._schema = Schema.parse(schema_id,
+                                            spaces, indexes,
+                                            self._schema)
+                self._schema.by_name = self._features.space_and_index_names
+            except Exception as e:
+                logger.exception(e)
+                logger.error('Error happened while parsing schema. '
+                             'Space, fields and index names currently '
+                             'not working. Please file an issue at '
+                             'https://github.com/igorcoding/asynctnt')
+                self.auto_refetch_schema = False
+                self.fetch_schema = False
+                self._schema_id = -1
+                self._schema_refetch_pending = False
+                self._set_connection_ready()
+                if fut is not None and not fut.done():
+                    fut.set_result(None)
+                return
 
-        fut.add_done_callback(on_authorized)
+            self._schema_id = self._schema.id
+            if self.schema_snapshot is not None and not self.shared_schema:
+                self._save_schema_snapshot()
+            self.post_con_state = POST_CONNECTION_DONE
+            self._post_con_state_machine()
+
+            if self._schema_refetch_pending \
+                    or self._schema_id_seen > self._schema_id:
+                # schema has changed again while it was being fetched
+                self._schema_refetch_pending = False
+                self._do_fetch_schema(fut)
+                return
+
+            if fut is not None and not fut.done():
+                fut.set_result(self._schema)
+        else:
+            self._schema_refetch_pending = False
+            if self._closing:
+                # show a diag message rather than Lost connection to Tarantool when disconnected (#19)
+                logger.debug('Schema fetch stopped: connection is closed')
+                return
+
+            logger.error('Tarantool[%s:%s] Schema fetch failed: %s',
+                         self.host, self.port, str(e))
+            if isinstance(e, asyncio.TimeoutError):
+                e = asyncio.TimeoutError('Schema fetch timeout')
+            self._set_connection_error(e)
+            if fut is not None and not fut.done():
+                fut.set_exception(e)
 
     cdef void _do_fetch_schema(self, object fut):
         if self._schema_fetch_in_progress:
             return
 
         self._schema_fetch_in_progress = True
+        self._schema_refetches += 1
 
         def on_fetch(f):
-            self._schema_fetch_in_progress = False
+            self._on_schema_fetched(f, fut)
+
+        self._send_schema_fetch().add_done_callback(on_fetch)
+
+    cdef void _do_pipelined_handshake(self):
+        cdef list futures
+
+        id_fut = None
+        auth_fut = None
+        schema_fut = None
+
+        # id, auth and schema requests are written at once and their
+        # responses are handled in order, just like in the state machine
+        self._cork()
+        try:
+            assert self.version is not None
+            if self.version >= (2, 10, 0):
+                id_fut = self._db._id(0.0)
+            if self.username and self.password:
+                auth_fut = self._db._auth(self.salt, self.username,
+                                          self.password, 0)
+            if self.fetch_schema and not self._schema_snapshot_loaded:
+                self._schema_fetch_in_progress = True
+                self._schema_refetches += 1
+                schema_fut = self._send_schema_fetch()
+        finally:
+            self._uncork()
+
+        futures = [f for f in (id_fut, auth_fut, schema_fut) if f is not None]
+        if not futures:
+            self.post_con_state = POST_CONNECTION_DONE
+            self._post_con_state_machine()
+            return
 
+        def on_handshake(f):
             if f.cancelled():
+                self._schema_fetch_in_progress = False
                 self._set_connection_error(asyncio.futures.CancelledError())
                 return
-            e = f.exception()
-            if not e:
-                if fut is not None and fut.cancelled():
-                    # if the caller has cancelled waiting
+
+            if id_fut is not None:
+                self.post_con_state = POST_CONNECTION_ID
+                if not self._on_id_done(id_fut):
+                    self._schema_fetch_in_progress = False
                     return
 
-                spaces, indexes = f.result()
-                logger.debug('Tarantool[%s:%s] Schema fetch succeeded. '
-                             'Version: %d, Spaces: %d, Indexes: %d.',
-                             self.host, self.port,
-                             spaces.schema_id, len(spaces), len(indexes))
-                try:
-                    self._schema = Schema.parse(spaces.schema_id,
-                                                spaces, indexes)
-                except Exception as e:
-                    logger.exception(e)
-                    logger.error('Error happened while parsing schema. '
-                                 'Space, fields and index names currently '
-                                 'not working. Please file an issue at '
-                                 'https://github.com/igorcoding/asynctnt')
-                    self.auto_refetch_schema = False
-                    self.fetch_schema = False
-                    self._schema_id = -1
-                    self._set_connection_ready()
-                    if fut is not None and not fut.done():
-                        fut.set_result(None)
+            if auth_fut is not None:
+                self.post_con_state = POST_CONNECTION_AUTH
+                if not self._on_auth_done(auth_fut):
+                    self._schema_fetch_in_progress = False
                     return
 
-                self._schema_id = self._schema.id
-                self.post_con_state = POST_CONNECTION_DONE
-                self._post_con_state_machine()
-                if fut is not None and not fut.done():
-                    fut.set_result(self._schema)
-            else:
-                if self._closing:
-                    # show a diag message rather than Lost connection to Tarantool when disconnected (#19)
-                    logger.debug('Schema fetch stopped: connection is closed')
+            self.post_con_state = POST_CONNECTION_SCHEMA
+            if schema_fut is not None:
+                if auth_fut is not None \
+                        and not schema_fut.cancelled() \
+                        and not schema_fut.exception() \
+                        and (<Response> schema_fut.result()[0]).schema_id_ \
+                        != self._server_schema_id:
+                    # schema has changed between auth and schema fetch,
+                    # so it is fetched once more as in the state machine
+                    self._schema_fetch_in_progress = False
+                    self._refetch_schema()
                     return
+                self._on_schema_fetched(schema_fut, None)
+                return
 
-                logger.error('Tarantool[%s:%s] Schema fetch failed: %s',
-                             self.host, self.port, str(e))
-                if isinstance(e, asyncio.TimeoutError):
-                    e = asyncio.TimeoutError('Schema fetch timeout')
-                self._set_connection_error(e)
-                if fut is not None and not fut.done():
-                    fut.set_exception(e)
+            self._post_con_state_machine()
+
+        asyncio.gather(*futures, return_exceptions=True) \
+            .add_done_callback(on_handshake)
 
-        fut_vspace = self._db.select(SPACE_VSPACE, timeout=0,
-                                     check_schema_change=False)
-        fut_vindex = self._db.select(SPACE_VINDEX, timeout=0,
-                                     check_schema_change=False)
-        gather_fut = asyncio.gather(fut_vspace, fut_vindex,
-                                    return_exceptions=False)
-        gather_fut.add_done_callback(on_fetch)
+    cdef void _send_watch(self, str key, tarantool.iproto_type op):
+        cdef WatchRequest req
+
+        # there are no responses to watch/unwatch requests
+        req = <WatchRequest> WatchRequest.__new__(WatchRequest)
+        req.op = op
+        req.sync = self.next_sync()
+        req.stream_id = 0
+        req.key = key
+        self._write(req.encode(self.encoding))
+
+    cdef void _watch_all(self):
+        if not self._watch_keys:
+            return
+
+        if not self._features.watchers:
+            logger.warning('Tarantool[%s:%s] Watchers are not supported '
+                           'by the server', self.host, self.port)
+            return
+
+        self._cork()
+        try:
+            for key in self._watch_keys:
+                self._send_watch(key, tarantool.IPROTO_WATCH)
+        finally:
+            self._uncork()
+
+    cdef void _on_event(self, const char *buf, uint32_t buf_len):
+        cdef const char *b
+
+        if buf_len == 0:  # pragma: nocover
+            return
+
+        b = buf
+        try:
+            body = _decode_obj(&b, self.encoding, self.datetime_as_ns)
+            key = body[tarantool.IPROTO_EVENT_KEY]
+            value = body.get(tarantool.IPROTO_EVENT_DATA)
+        except Exception as e:  # pragma: nocover
+            logger.error('Tarantool[%s:%s] Failed to parse event: %s',
+                         self.host, self.port, str(e))
+            return
+
+        if key not in self._watch_keys:
+            # unwatched while the event was in flight
+            return
+
+        # acknowledge the event to receive the next one
+        self._send_watch(key, tarantool.IPROTO_WATCH)
+
+        if self.on_watch_event_cb is not None:
+            try:
+                self.on_watch_event_cb(key, value)
+            except Exception as e:
+                logger.exception(e)
+
+    def watch(self, str key):
+        if self.con_state == CONNECTION_FULL and self._features.watchers:
+            self._send_watch(key, tarantool.IPROTO_WATCH)
+
+    def unwatch(self, str key):
+        if self.con_state == CONNECTION_FULL and self._features.watchers:
+            self._send_watch(key, tarantool.IPROTO_UNWATCH)
+
+    cdef tuple _schema_snapshot_key(self):
+        # spaces visible in _vspace depend on the user privileges
+        return self.instance_uuid, self.username or 'guest'
+
+    cdef bint _load_schema_snapshot(self):
+        cdef Schema schema
+
+        if self.instance_uuid is None:
+            return False
+
+        try:
+            with open(self.schema_snapshot, 'rb') as f:
+                if self.shared_schema:
+                    # pages of the file are shared by all the processes
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    data = f.read()
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning('Tarantool[%s:%s] Failed to read schema '
+                           'snapshot %s: %s',
+                           self.host, self.port, self.schema_snapshot, str(e))
+            return False
+
+        try:
+            if self.shared_schema:
+                schema = Schema.attach(data, self._schema_snapshot_key())
+            else:
+                schema = Schema.loads(data, self._schema_snapshot_key())
+        except TarantoolSchemaError as e:
+            logger.warning('Tarantool[%s:%s] Ignoring schema snapshot %s: %s',
+                           self.host, self.port, self.schema_snapshot, str(e))
+            return False
+
+        if schema is None:
+            logger.debug('Tarantool[%s:%s] Schema snapshot %s belongs to '
+                         'another instance or user',
+                         self.host, self.port, self.schema_snapshot)
+            return False
+
+        self._schema = schema
+        self._schema_id = schema.id
+        logger.debug('Tarantool[%s:%s] Schema snapshot loaded. Version: %d.',
+                     self.host, self.port, schema.id)
+        return True
+
+    cdef void _save_schema_snapshot(self):
+        if self.instance_uuid is None:
+            return
+
+        try:
+            data = self._schema.dumps(self._schema_snapshot_key())
+        except ValueError as e:
+            # schema holds values marshal does not support
+            logger.warning('Tarantool[%s:%s] Failed to make schema '
+                           'snapshot: %s', self.host, self.port, str(e))
+            return
+
+        # other processes may read the snapshot at the same time
+        tmp_path = '{}.{}.tmp'.format(self.schema_snapshot, os.getpid())
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.schema_snapshot)
+        except OSError as e:
+            logger.warning('Tarantool[%s:%s] Failed to save schema '
+                           'snapshot %s: %s',
+                           self.host, self.port, self.schema_snapshot, str(e))
 
     cdef void _on_connection_made(self):
         CoreProtocol._on_connection_made(self)
@@ -379,6 +777,10 @@ cdef class BaseProtocol(CoreProtocol):
         self.post_con_state = POST_CONNECTION_NONE
         self.execute = self._execute_bad
 
+        if self._schema_refetch_handle is not None:
+            self._schema_refetch_handle.cancel()
+            self._schema_refetch_handle = None
+
         pos = 0
         while cpython.dict.PyDict_Next(self._reqs, &pos, &pkey, &pvalue):
             sync = <uint64_t> <object> pkey
@@ -408,9 +810,9 @@ cdef class BaseProtocol(CoreProtocol):
                     err = exc
 
                 if err is not None:
-                    waiter.set_exception(err)
                     if response is not None:
                         response.set_exception(err)
+                    waiter.set_exception(err)
 
         if self.on_connection_lost_cb:
             self.on_connection_lost_cb(exc)
@@ -482,18 +884,104 @@ cdef class BaseProtocol(CoreProtocol):
     cdef object _execute_bad(self, BaseRequest req, float timeout):
         raise TarantoolNotConnectedError('Tarantool is not connected')
 
-    cdef object _execute_normal(self, BaseRequest req, float timeout):
+    cdef Response _new_response(self, BaseRequest req):
         cdef Response response
         response = <Response> Response.__new__(Response)
         response.request_ = req
         response.encoding = self.encoding
+        response.datetime_as_ns = self.datetime_as_ns
+        response.metadata_cache = self._metadata_cache
         if req.push_subscribe:
             response.init_push()
         cpython.dict.PyDict_SetItem(self._reqs, req.sync, response)
+        return response
+
+    cdef object _execute_normal(self, BaseRequest req, float timeout):
+        cdef Response response
+        response = self._new_response(req)
         self._write(req.encode(self.encoding))
 
         return self._new_waiter_for_request(response, req, timeout)
 
+    cdef object _execute_template(self, TemplateRequest req, float timeout):
+        cdef Response response
+
+        # encode() of requests is not virtual, templates have their own
+        if self.execute == <req_execute_func> self._execute_bad:
+            raise TarantoolNotConnectedError('Tarantool is not connected')
+
+        response = self._new_response(req)
+        self._write(req.encode_template(self.encoding))
+        return self._new_waiter_for_request(response, req, timeout)
+
+    cdef list _execute_many(self, list reqs, float timeout):
+        cdef:
+            BaseRequest req
+            Response response
+            list bufs
+            list futures
+            Py_ssize_t i
+
+        if self.execute == <req_execute_func> self._execute_bad:
+            raise TarantoolNotConnectedError('Tarantool is not connected')
+
+        # all the requests are encoded before anything is written,
+        # so none of them is sent if any of them fails to encode
+        bufs = [req.encode(self.encoding) for req in reqs]
+
+        futures = []
+        self._cork()
+        try:
+            for i in range(len(reqs)):
+                req = <BaseRequest> reqs[i]
+                response = self._new_response(req)
+                self._write(bufs[i])
+                futures.append(
+                    self._new_waiter_for_request(response, req, timeout)
+                )
+        finally:
+            self._uncork()
+        return futures
+
+    cdef object _execute_batch(self, list reqs, float timeout):
+        cdef:
+            BaseRequest req
+            BatchWaiter waiter
+            list bufs
+            Py_ssize_t i
+
+        if self.execute == <req_execute_func> self._execute_bad:
+            raise TarantoolNotConnectedError('Tarantool is not connected')
+
+        # see _execute_many
+        bufs = [req.encode(self.encoding) for req in reqs]
+
+        waiter = <BatchWaiter> BatchWaiter.__new__(BatchWaiter)
+        waiter.fut = self.create_future()
+
+        self._cork()
+        try:
+            for i in range(len(reqs)):
+                req = <BaseRequest> reqs[i]
+                req.waiter = waiter
+                waiter.responses.append(self._new_response(req))
+                waiter.left += 1
+                self._write(bufs[i])
+        finally:
+            self._uncork()
+
+        if waiter.left == 0:
+            waiter.fut.set_result([])
+            return waiter.fut
+
+        if timeout < 0:
+            timeout = self.request_timeout
+        if timeout is not None and timeout > 0:
+            waiter.timeout_handle = \
+                self.loop.call_later(timeout, waiter._on_timeout)
+            waiter.fut.add_done_callback(waiter._on_done)
+        return waiter.fut
+
     cdef uint32_t transform_iterator(self, iterator) except *:
         if isinstance(iterator, int):
             return iterator
@@ -506,18 +994,57 @@ cdef class BaseProtocol(CoreProtocol):
                             '(asynctnt.Iterator, int, str)')
 
     cdef object _refetch_schema(self):
-        if self._refetch_schema_future is not None and not self._refetch_schema_future.done():
-            self._schema_fetch_in_progress = False
-            self._refetch_schema_future.cancel()
+        if self._schema_refetch_handle is not None:
+            self._schema_refetch_handle.cancel()
+            self._schema_refetch_handle = None
+
+        if self._refetch_schema_future is not None \
+                and not self._refetch_schema_future.done():
+            # the fetch in flight may have been sent before the change,
+            # so fetch once more after it instead of starting over
+            self._schema_refetch_pending = True
+            self._schema_refetches_coalesced += 1
+            return self._refetch_schema_future
 
         self._refetch_schema_future = self.create_future()
         self._do_fetch_schema(self._refetch_schema_future)
 
         return self._refetch_schema_future
 
+    cdef void _schedule_schema_refetch(self, int64_t schema_id):
+        if schema_id > self._schema_id_seen:
+            self._schema_id_seen = schema_id
+
+        if self._schema_fetch_in_progress \
+                or self._schema_refetch_handle is not None:
+            # the result of the scheduled (or in flight) fetch is checked
+            # against the last seen schema id, see _on_schema_fetched
+            self._schema_refetches_coalesced += 1
+            return
+
+        if self.schema_refetch_delay > 0:
+            self._schema_refetch_handle = self.loop.call_later(
+                self.schema_refetch_delay, self._on_schema_refetch_timer
+            )
+        else:
+            self._refetch_schema()
+
+    def _on_schema_refetch_timer(self):
+        self._schema_refetch_handle = None
+        if self.con_state == CONNECTION_FULL and not self._closing:
+            self._refetch_schema()
+
     def refetch_schema(self):
         return self._refetch_schema()
 
+    @property
+    def schema_refetches(self):
+        return self._schema_refetches
+
+    @property
+    def schema_refetches_coalesced(self):
+        return self._schema_refetches_coalesced
+
     @property
     def features(self) -> IProtoFeatures:
         return self._features
@@ -14,6 +14,7 @@ cdef class BaseRequest:
         bint parse_as_tuples
         bint push_subscribe
         bint check_schema_change
+        object record_cls
 
     cdef inline Metadata metadata(self):
         if self.space is None:
@@ -28,3 +29,13 @@ cdef char *encode_key_sequence(WriteBuffer buffer,
                                char *p, object t,
                                Metadata metadata,
                                bint default_none) except NULL
+
+cdef char *encode_space(WriteBuffer buffer,
+                        char *p, SchemaSpace space) except NULL
+
+cdef char *encode_index(WriteBuffer buffer,
+                        char *p, SchemaIndex index) except NULL
+
+cdef inline bint index_is_sent(SchemaIndex index):
+    # primary index (id 0) is the default one
+    return index.iid != 0
@@ -1,5 +1,5 @@
 cimport cython
-from libc.stdint cimport int64_t, uint64_t
+from libc.stdint cimport int64_t, uint32_t, uint64_t
 
 
 @cython.freelist(REQUEST_FREELIST)
@@ -52,3 +52,22 @@ cdef char *encode_key_sequence(WriteBuffer buffer,
         raise TypeError(
             '{}, got: {}'.format(msg, type(t))
         )
+
+
+cdef char *encode_space(WriteBuffer buffer,
+                        char *p, SchemaSpace space) except NULL:
+    if space.sid < 0:
+        # space is not in the schema - let Tarantool resolve its name
+        p = buffer.mp_encode_uint(p, tarantool.IPROTO_SPACE_NAME)
+        return buffer.mp_encode_str_obj(p, space.name)
+    p = buffer.mp_encode_uint(p, tarantool.IPROTO_SPACE_ID)
+    return buffer.mp_encode_uint(p, <uint32_t> space.sid)
+
+
+cdef char *encode_index(WriteBuffer buffer,
+                        char *p, SchemaIndex index) except NULL:
+    if index.iid < 0:
+        p = buffer.mp_encode_uint(p, tarantool.IPROTO_INDEX_NAME)
+        return buffer.mp_encode_str_obj(p, index.name)
+    p = buffer.mp_encode_uint(p, tarantool.IPROTO_INDEX_ID)
+    return buffer.mp_encode_uint(p, <uint32_t> index.iid)
@@ -9,39 +9,23 @@ cdef class DeleteRequest(BaseRequest):
             char *p
             char *begin
             uint32_t body_map_sz
-            uint32_t max_body_len
-            uint32_t space_id, index_id
+            bint send_index
 
-        space_id = self.space.sid
-        index_id = self.index.iid
+        send_index = index_is_sent(self.index)
 
         body_map_sz = 2 \
-                      + <uint32_t> (index_id > 0)
+                      + <uint32_t> send_index
         # Size description:
         # mp_sizeof_map(body_map_sz)
-        # + mp_sizeof_uint(TP_SPACE)
-        # + mp_sizeof_uint(space)
-        max_body_len = 1 \
-                       + 1 \
-                       + 9
-
-        if index_id > 0:
-            # mp_sizeof_uint(TP_INDEX) + mp_sizeof_uint(index)
-            max_body_len += 1 + 9
-
-        max_body_len += 1  # mp_sizeof_uint(TP_KEY);
-
-        buffer.ensure_allocated(max_body_len)
+        buffer.ensure_allocated(1)
 
         p = begin = &buffer._buf[buffer._length]
         p = mp_encode_map(p, body_map_sz)
-        p = mp_encode_uint(p, tarantool.IPROTO_SPACE_ID)
-        p = mp_encode_uint(p, space_id)
+        buffer._length += (p - begin)
 
-        if index_id > 0:
-            p = mp_encode_uint(p, tarantool.IPROTO_INDEX_ID)
-            p = mp_encode_uint(p, index_id)
+        p = encode_space(buffer, p, self.space)
+        if send_index:
+            p = encode_index(buffer, p, self.index)
 
-        p = mp_encode_uint(p, tarantool.IPROTO_KEY)
-        buffer._length += (p - begin)
+        p = buffer.mp_encode_uint(p, tarantool.IPROTO_KEY)
         p = encode_key_sequence(buffer, p, self.key, self.index.metadata, False)
@@ -33,9 +33,10 @@ cdef class IDRequest(BaseRequest):
         p = mp_encode_uint(p, tarantool.IPROTO_VERSION)
         p = mp_encode_uint(p, IPROTO_VERSION)
         p = mp_encode_uint(p, tarantool.IPROTO_FEATURES)
-        p = mp_encode_array(p, 3)
+        p = mp_encode_array(p, 4)
         p = mp_encode_uint(p, tarantool.IPROTO_FEATURE_STREAMS)
         p = mp_encode_uint(p, tarantool.IPROTO_FEATURE_TRANSACTIONS)
         p = mp_encode_uint(p, tarantool.IPROTO_FEATURE_ERROR_EXTENSION)
+        p = mp_encode_uint(p, tarantool.IPROTO_FEATURE_WATCHERS)
 
         buffer._length += (p - begin)
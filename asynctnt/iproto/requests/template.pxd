@@ -0,0 +1,22 @@
+from libc.stdint cimport uint64_t
+
+
+cdef class RequestTemplate:
+    cdef:
+        tarantool.iproto_type op
+        readonly str func_name
+
+        bytes _frame
+        bytes _encoding
+        uint64_t _stream_id
+        ssize_t _sync_offset
+
+    cdef bytes frame(self, bytes encoding, uint64_t stream_id)
+
+
+cdef class TemplateRequest(BaseRequest):
+    cdef:
+        RequestTemplate template
+        object args
+
+    cdef WriteBuffer encode_template(self, bytes encoding)
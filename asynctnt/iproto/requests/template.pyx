@@ -0,0 +1,105 @@
+cimport cython
+from libc.stdint cimport uint64_t
+from libc.string cimport memcpy
+
+cimport asynctnt.iproto.tarantool as tarantool
+
+
+@cython.final
+cdef class RequestTemplate:
+    """
+        Pre-encoded call request. Header and body up to the arguments
+        are encoded once, so a request is built by copying the frame,
+        patching IPROTO_SYNC and encoding the arguments only
+    """
+
+    def __cinit__(self, str func_name, *, bint call16=False):
+        self.op = tarantool.IPROTO_CALL_16 if call16 else tarantool.IPROTO_CALL
+        self.func_name = func_name
+        self._frame = None
+        self._encoding = None
+        self._stream_id = 0
+        self._sync_offset = 0
+
+    def __repr__(self):  # pragma: nocover
+        return '<RequestTemplate func_name={!r} op={}>'.format(
+            self.func_name, <int> self.op)
+
+    cdef bytes frame(self, bytes encoding, uint64_t stream_id):
+        cdef:
+            WriteBuffer buffer
+            char *begin
+            char *p
+            uint32_t map_size
+            bytes func_name_temp
+            char *func_name_str
+            ssize_t func_name_len
+
+        if self._frame is not None \
+                and self._stream_id == stream_id \
+                and self._encoding == encoding:
+            return self._frame
+
+        func_name_str = NULL
+        func_name_len = 0
+        func_name_temp = encode_unicode_string(self.func_name, encoding)
+        cpython.bytes.PyBytes_AsStringAndSize(func_name_temp,
+                                              &func_name_str,
+                                              &func_name_len)
+
+        buffer = WriteBuffer.create(encoding)
+        buffer.ensure_allocated(HEADER_CONST_LEN
+                                + 1 + 1
+                                + mp_sizeof_str(<uint32_t> func_name_len)
+                                + 1)
+
+        map_size = 2 + (<uint32_t> (stream_id > 0))
+
+        # header; sync is always encoded as uint64 to be patched in place
+        p = begin = buffer._buf
+        p = mp_encode_map(&p[5], map_size)
+        p = mp_encode_uint(p, tarantool.IPROTO_REQUEST_TYPE)
+        p = mp_encode_uint(p, <uint32_t> self.op)
+        p = mp_encode_uint(p, tarantool.IPROTO_SYNC)
+        p = mp_store_u8(p, 0xcf)
+        self._sync_offset = p - begin
+        p = mp_store_u64(p, 0)
+
+        if stream_id > 0:
+            p = mp_encode_uint(p, tarantool.IPROTO_STREAM_ID)
+            p = mp_encode_uint(p, stream_id)
+
+        # body up to the arguments
+        p = mp_encode_map(p, 2)
+        p = mp_encode_uint(p, tarantool.IPROTO_FUNCTION_NAME)
+        p = mp_encode_str(p, func_name_str, <uint32_t> func_name_len)
+        p = mp_encode_uint(p, tarantool.IPROTO_TUPLE)
+
+        self._frame = cpython.bytes.PyBytes_FromStringAndSize(begin, p - begin)
+        self._encoding = encoding
+        self._stream_id = stream_id
+        return self._frame
+
+
+@cython.final
+cdef class TemplateRequest(BaseRequest):
+    cdef WriteBuffer encode_template(self, bytes encoding):
+        cdef:
+            bytes frame
+            ssize_t frame_len
+            WriteBuffer buffer
+            char *p
+
+        frame = self.template.frame(encoding, self.stream_id)
+        frame_len = cpython.bytes.PyBytes_GET_SIZE(frame)
+
+        buffer = WriteBuffer.create(encoding)
+        buffer.ensure_allocated(frame_len)
+        memcpy(buffer._buf, cpython.bytes.PyBytes_AS_STRING(frame), frame_len)
+        mp_store_u64(&buffer._buf[self.template._sync_offset], self.sync)
+        buffer._length = frame_len
+
+        p = &buffer._buf[buffer._length]
+        encode_key_sequence(buffer, p, self.args, None, False)
+        buffer.write_length()
+        return buffer
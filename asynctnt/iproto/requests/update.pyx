@@ -165,15 +165,11 @@ cdef int encode_request_update(WriteBuffer buffer,
         char *begin
         char *p
         uint32_t body_map_sz
-        uint32_t max_body_len
-        uint32_t space_id, index_id
+        bint send_index
         uint32_t key_of_tuple, key_of_operations
         Metadata metadata
         bint default_fields_none
 
-    space_id = space.sid
-    index_id = index.iid
-
     if not is_upsert:
         key_of_tuple = tarantool.IPROTO_KEY
         key_of_operations = tarantool.IPROTO_TUPLE
@@ -185,35 +181,21 @@ cdef int encode_request_update(WriteBuffer buffer,
         metadata = space.metadata
         default_fields_none = True
 
-    body_map_sz = 3 + <uint32_t> (index_id > 0)
+    send_index = index_is_sent(index)
+
+    body_map_sz = 3 + <uint32_t> send_index
     # Size description:
     # mp_sizeof_map(body_map_sz)
-    # + mp_sizeof_uint(TP_SPACE)
-    # + mp_sizeof_uint(space)
-    max_body_len = 1 \
-                   + 1 \
-                   + 9
-
-    if index_id > 0:
-        # + mp_sizeof_uint(TP_INDEX)
-        # + mp_sizeof_uint(index)
-        max_body_len += 1 + 9
-
-    max_body_len += 1  # + mp_sizeof_uint(TP_KEY)
-    max_body_len += 1  # + mp_sizeof_uint(TP_TUPLE)
-
-    buffer.ensure_allocated(max_body_len)
+    buffer.ensure_allocated(1)
 
     p = begin = &buffer._buf[buffer._length]
     p = mp_encode_map(p, body_map_sz)
-    p = mp_encode_uint(p, tarantool.IPROTO_SPACE_ID)
-    p = mp_encode_uint(p, space_id)
-
-    if index_id > 0:
-        p = mp_encode_uint(p, tarantool.IPROTO_INDEX_ID)
-        p = mp_encode_uint(p, index_id)
     buffer._length += (p - begin)
 
+    p = encode_space(buffer, p, space)
+    if send_index:
+        p = encode_index(buffer, p, index)
+
     p = buffer.mp_encode_uint(p, key_of_tuple)
     p = encode_key_sequence(buffer, p, key_tuple, metadata, default_fields_none)
 
@@ -0,0 +1,20 @@
+cdef class UpdateRequestTemplate:
+    cdef:
+        readonly object space
+        readonly object index
+        readonly int params_count
+        list operations
+
+        list _chunks
+        SchemaSpace _space
+        bytes _encoding
+
+    cdef list chunks(self, SchemaSpace space, bytes encoding)
+
+
+cdef class UpdateTemplateRequest(BaseRequest):
+    cdef:
+        UpdateRequestTemplate template
+        SchemaIndex index
+        object key
+        object params
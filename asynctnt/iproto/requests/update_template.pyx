@@ -0,0 +1,237 @@
+cimport cython
+from libc.string cimport memcpy
+
+cimport asynctnt.iproto.tarantool as tarantool
+
+
+@cython.final
+cdef class Param:
+    """
+        Placeholder of a parameter in the compiled update operations
+    """
+
+    def __repr__(self):  # pragma: nocover
+        return 'Param'
+
+
+cdef inline bint _is_param(object o):
+    return o is Param or isinstance(o, Param)
+
+
+cdef inline char _op_type(object op_type_str, bytes encoding) except 0:
+    cdef:
+        bytes str_temp
+        char *op_str_c
+        ssize_t op_str_len
+        char op
+
+    if isinstance(op_type_str, str):
+        str_temp = encode_unicode_string(op_type_str, encoding)
+    elif isinstance(op_type_str, bytes):
+        str_temp = <bytes> op_type_str
+    else:
+        raise TypeError(
+            'Operation type must of a str or bytes type')
+
+    cpython.bytes.PyBytes_AsStringAndSize(str_temp, &op_str_c, &op_str_len)
+
+    op = <char> 0
+    if op_str_len == 1:
+        op = op_str_c[0]
+
+    if op == tarantool.IPROTO_OP_ADD \
+            or op == tarantool.IPROTO_OP_SUB \
+            or op == tarantool.IPROTO_OP_AND \
+            or op == tarantool.IPROTO_OP_XOR \
+            or op == tarantool.IPROTO_OP_OR \
+            or op == tarantool.IPROTO_OP_DELETE \
+            or op == tarantool.IPROTO_OP_INSERT \
+            or op == tarantool.IPROTO_OP_ASSIGN \
+            or op == tarantool.IPROTO_OP_SPLICE:
+        return op
+
+    raise TypeError(
+        'Unknown update operation type `{}`'.format(op_type_str))
+
+
+cdef inline object _op_args(object operation, char op):
+    # extra elements of operations are ignored just like in update()
+    if op == tarantool.IPROTO_OP_SPLICE:
+        return operation[2:5]
+    return operation[2:3]
+
+
+cdef inline char *_write_bytes(WriteBuffer buffer, char *p,
+                               bytes data) except NULL:
+    cdef ssize_t data_len = cpython.bytes.PyBytes_GET_SIZE(data)
+    p = buffer._ensure_allocated(p, data_len)
+    memcpy(p, cpython.bytes.PyBytes_AS_STRING(data), <size_t> data_len)
+    buffer._length += data_len
+    return p + data_len
+
+
+@cython.final
+cdef class UpdateRequestTemplate:
+    """
+        Pre-compiled update operations. Operation types and field numbers
+        (resolved from field names) and all the static arguments are
+        encoded once, so a request only encodes the key and the values
+        of :class:`Param` placeholders
+    """
+
+    def __cinit__(self, object space, list operations, object index=0):
+        cdef:
+            int params_count
+            ssize_t op_len
+            char op
+
+        # copied, so later changes of the caller's operations do not
+        # leak into the compiled ones
+        operations = [tuple(operation)
+                      if isinstance(operation, (list, tuple)) else operation
+                      for operation in operations]
+
+        params_count = 0
+        for operation in operations:
+            if not isinstance(operation, (list, tuple)):
+                raise TypeError(
+                    'Single operation must be a tuple or list')
+
+            op_len = len(operation)
+            if op_len < 3:
+                raise IndexError('Operation length must be at least 3')
+
+            op = _op_type(operation[0], b'utf-8')
+            if op == tarantool.IPROTO_OP_SPLICE:
+                if op_len < 5:
+                    raise ValueError(
+                        'Splice operation must have length of 5, '
+                        'but got: {}'.format(op_len)
+                    )
+                for i in (2, 3):
+                    if not _is_param(operation[i]) \
+                            and not isinstance(operation[i], int):
+                        raise TypeError(
+                            'Splice position and offset must be int')
+
+            if not isinstance(operation[1], (int, str)):
+                raise TypeError(
+                    'Operation field_no must be of either int or str type')
+
+            for arg in _op_args(operation, op):
+                if _is_param(arg):
+                    params_count += 1
+
+        self.space = space
+        self.index = index
+        self.operations = operations
+        self.params_count = params_count
+        self._chunks = None
+        self._space = None
+        self._encoding = None
+
+    def __repr__(self):  # pragma: nocover
+        return '<UpdateRequestTemplate space={!r} params_count={}>'.format(
+            self.space, self.params_count)
+
+    cdef list chunks(self, SchemaSpace space, bytes encoding):
+        cdef:
+            WriteBuffer buffer
+            char *p
+            list chunks
+            char op
+            object field_no_obj
+            int field_no
+            bytes str_temp
+            object args
+
+        if self._chunks is not None \
+                and self._space is space \
+                and self._encoding == encoding:
+            return self._chunks
+
+        chunks = []
+        buffer = WriteBuffer.create(encoding)
+        p = buffer._buf
+        p = buffer.mp_encode_array(
+            p, <uint32_t> cpython.list.PyList_GET_SIZE(self.operations))
+
+        for operation in self.operations:
+            op = _op_type(operation[0], encoding)
+            args = _op_args(operation, op)
+            p = buffer.mp_encode_array(p, 2 + <uint32_t> len(args))
+            p = buffer.mp_encode_str(p, &op, 1)
+
+            field_no_obj = operation[1]
+            if isinstance(field_no_obj, int):
+                # negative field numbers count from the end of a tuple
+                p = buffer.mp_encode_int_obj(p, field_no_obj)
+            else:
+                field_no = -1
+                if space.metadata is not None:
+                    field_no = space.metadata.id_by_name_safe(field_no_obj)
+
+                if field_no >= 0:
+                    p = buffer.mp_encode_uint(p, <uint64_t> field_no)
+                else:
+                    str_temp = encode_unicode_string(field_no_obj, encoding)
+                    p = buffer.mp_encode_str(
+                        p,
+                        cpython.bytes.PyBytes_AS_STRING(str_temp),
+                        <uint32_t> cpython.bytes.PyBytes_GET_SIZE(str_temp))
+
+            for arg in args:
+                if _is_param(arg):
+                    chunks.append(cpython.bytes.PyBytes_FromStringAndSize(
+                        buffer._buf, buffer._length))
+                    buffer._length = 0
+                    p = buffer._buf
+                else:
+                    p = buffer.mp_encode_obj(p, arg)
+
+        chunks.append(cpython.bytes.PyBytes_FromStringAndSize(
+            buffer._buf, buffer._length))
+
+        self._chunks = chunks
+        self._space = space
+        self._encoding = encoding
+        return chunks
+
+
+@cython.final
+cdef class UpdateTemplateRequest(BaseRequest):
+    cdef int encode_body(self, WriteBuffer buffer) except -1:
+        cdef:
+            char *begin
+            char *p
+            uint32_t body_map_sz
+            bint send_index
+            list chunks
+            ssize_t i
+
+        chunks = self.template.chunks(self.space, buffer._encoding)
+        send_index = index_is_sent(self.index)
+
+        body_map_sz = 3 + <uint32_t> send_index
+        # mp_sizeof_map(body_map_sz)
+        buffer.ensure_allocated(1)
+
+        p = begin = &buffer._buf[buffer._length]
+        p = mp_encode_map(p, body_map_sz)
+        buffer._length += (p - begin)
+
+        p = encode_space(buffer, p, self.space)
+        if send_index:
+            p = encode_index(buffer, p, self.index)
+
+        p = buffer.mp_encode_uint(p, tarantool.IPROTO_KEY)
+        p = encode_key_sequence(buffer, p, self.key,
+                                self.index.metadata, False)
+
+        p = buffer.mp_encode_uint(p, tarantool.IPROTO_TUPLE)
+        for i in range(self.template.params_count):
+            p = _write_bytes(buffer, p, <bytes> chunks[i])
+            p = buffer.mp_encode_obj(p, self.params[i])
+        p = _write_bytes(buffer, p,
+                         <bytes> chunks[self.template.params_count])
+        return 0
@@ -0,0 +1,3 @@
+cdef class WatchRequest(BaseRequest):
+    cdef:
+        str key
@@ -19,6 +19,8 @@ cdef class Response:
         int _rowcount
         readonly list body
         readonly bytes encoding
+        bint datetime_as_ns
+        dict metadata_cache
         readonly Metadata metadata
         readonly Metadata params
         readonly int params_count
@@ -2,8 +2,12 @@ import asyncio
 import collections
 from typing import Optional
 
+cimport cpython.bytes
+cimport cpython.dict
 cimport cpython.list
+cimport cpython.tuple
 cimport cython
+from cpython.ref cimport PyObject
 from libc cimport stdio
 from libc.stdint cimport uint32_t
 
@@ -47,7 +51,9 @@ cdef class Response:
         self.result_ = None
         self.body = None
         self.encoding = None
+        self.datetime_as_ns = False
         self.metadata = None
+        self.metadata_cache = None
         self.params = None
         self.params_count = 0
         self.autoincrement_ids = None
@@ -178,7 +184,7 @@ cdef class Response:
     def __iter__(self):
         return iter(self.body)
 
-cdef object _decode_obj(const char ** p, bytes encoding):
+cdef object _decode_obj(const char ** p, bytes encoding, bint datetime_as_ns):
     cdef:
         uint32_t i
         mp_type obj_type
@@ -198,6 +204,7 @@ cdef object _decode_obj(const char ** p, bytes encoding):
 
         int8_t ext_type
         IProtoDateTime dt
+        PyObject *ext_decoder
 
     obj_type = mp_typeof(p[0][0])
     if obj_type == MP_UINT:
@@ -227,7 +234,7 @@ cdef object _decode_obj(const char ** p, bytes encoding):
         arr_size = mp_decode_array(p)
         value = cpython.list.PyList_New(arr_size)
         for i in range(arr_size):
-            el = _decode_obj(p, encoding)
+            el = _decode_obj(p, encoding, datetime_as_ns)
             cpython.Py_INCREF(el)
             cpython.list.PyList_SET_ITEM(value, i, el)
         return value
@@ -257,7 +264,7 @@ cdef object _decode_obj(const char ** p, bytes encoding):
                                map_key_type)
                 continue
 
-            map[map_key] = _decode_obj(p, encoding)
+            map[map_key] = _decode_obj(p, encoding, datetime_as_ns)
 
         return map
     elif obj_type == MP_NIL:
@@ -267,6 +274,12 @@ cdef object _decode_obj(const char ** p, bytes encoding):
         ext_type = 0
         s_len = mp_decode_extl(p, &ext_type)
 
+        if _ext_decoders:
+            ext_decoder = cpython.dict.PyDict_GetItem(_ext_decoders,
+                                                      <int> ext_type)
+            if ext_decoder is not NULL:
+                return ext_registry_decode(<object> ext_decoder, p, s_len)
+
         if ext_type == tarantool.MP_DECIMAL:
             return decimal_decode(p, s_len)
 
@@ -279,6 +292,8 @@ cdef object _decode_obj(const char ** p, bytes encoding):
         elif ext_type == tarantool.MP_DATETIME:
             datetime_zero(&dt)
             datetime_decode(p, s_len, &dt)
+            if datetime_as_ns:
+                return datetime_to_ns(&dt)
             return datetime_to_py(&dt)
 
         elif ext_type == tarantool.MP_INTERVAL:
@@ -286,7 +301,7 @@ cdef object _decode_obj(const char ** p, bytes encoding):
 
         else:  # pragma: nocover
             logger.warning('Unexpected ext type: %d', ext_type)
-            p += s_len  # skip unknown ext
+            p[0] += s_len  # skip unknown ext
             return None
     else:  # pragma: nocover
         mp_next(p)
@@ -299,14 +314,34 @@ cdef list _response_parse_body_data(const char ** b,
         uint32_t size
         uint32_t tuple_size
         list tuples
-        uint32_t i
+        uint32_t i, j
 
         Metadata metadata
+        object record_cls
 
     size = mp_decode_array(b)
     tuples = []
 
-    if req.parse_as_tuples:
+    record_cls = req.record_cls
+    if req.parse_as_tuples and record_cls is not None:
+        # decode straight into user-registered record instances
+
+        for i in range(size):
+            if mp_typeof(b[0][0]) != MP_ARRAY:  # pragma: nocover
+                raise TypeError(
+                    'Tuple must be an array when decoding as a record'
+                )
+
+            tuple_size = mp_decode_array(b)
+            args = cpython.tuple.PyTuple_New(<Py_ssize_t> tuple_size)
+            for j in range(tuple_size):
+                value = _decode_obj(b, resp.encoding, resp.datetime_as_ns)
+                cpython.Py_INCREF(value)
+                cpython.tuple.PyTuple_SET_ITEM(args, j, value)
+
+            tuples.append(record_cls(*args))
+
+    elif req.parse_as_tuples:
         # decode as TarantoolTuples
 
         metadata = resp.metadata
@@ -322,7 +357,7 @@ cdef list _response_parse_body_data(const char ** b,
             tuple_size = mp_decode_array(b)
             t = tupleobj.AtntTuple_New(metadata, <int> tuple_size)
             for i in range(tuple_size):
-                value = _decode_obj(b, resp.encoding)
+                value = _decode_obj(b, resp.encoding, resp.datetime_as_ns)
                 cpython.Py_INCREF(value)
                 tupleobj.AtntTuple_SET_ITEM(t, i, value)
 
@@ -330,7 +365,7 @@ cdef list _response_parse_body_data(const char ** b,
     else:
         # decode as raw objects
         for i in range(size):
-            tuples.append(_decode_obj(b, resp.encoding))
+            tuples.append(_decode_obj(b, resp.encoding, resp.datetime_as_ns))
 
     return tuples
 
@@ -455,6 +490,33 @@ cdef Metadata response_parse_metadata(const char ** b, bytes encoding):
         metadata.add(<int> field_id, field)
     return metadata
 
+cdef Metadata response_parse_metadata_cached(const char ** b, Response resp):
+    # metadata is the same for all responses of a statement, so parsed
+    # instances are shared between responses, keyed by the raw msgpack
+    cdef:
+        const char *start
+        const char *p
+        PyObject *metadata_p
+        Metadata metadata
+
+    if resp.metadata_cache is None:
+        return response_parse_metadata(b, resp.encoding)
+
+    start = b[0]
+    mp_next(b)
+    key = cpython.bytes.PyBytes_FromStringAndSize(start, b[0] - start)
+
+    metadata_p = cpython.dict.PyDict_GetItem(resp.metadata_cache, key)
+    if metadata_p is not NULL:
+        return <Metadata> metadata_p
+
+    p = start
+    metadata = response_parse_metadata(&p, resp.encoding)
+    if len(resp.metadata_cache) >= METADATA_CACHE_SIZE:
+        resp.metadata_cache.clear()
+    resp.metadata_cache[key] = metadata
+    return metadata
+
 
 cdef ssize_t response_parse_body(const char *buf, uint32_t buf_len,
                                  Response resp, BaseRequest req,
@@ -512,14 +574,14 @@ cdef ssize_t response_parse_body(const char *buf, uint32_t buf_len,
                 mp_next(&b)
                 continue
 
-            resp.metadata = response_parse_metadata(&b, resp.encoding)
+            resp.metadata = response_parse_metadata_cached(&b, resp)
 
         elif key == tarantool.IPROTO_BIND_METADATA:
             if not req.parse_metadata:
                 mp_next(&b)
                 continue
 
-            resp.params = response_parse_metadata(&b, resp.encoding)
+            resp.params = response_parse_metadata_cached(&b, resp)
 
         elif key == tarantool.IPROTO_BIND_COUNT:
 
@@ -557,12 +619,12 @@ cdef ssize_t response_parse_body(const char *buf, uint32_t buf_len,
                 resp.set_data(data)
 
         elif key == tarantool.IPROTO_VERSION:
-            logger.debug("IProto version: %s", _decode_obj(&b, resp.encoding))
+            logger.debug("IProto version: %s", _decode_obj(&b, resp.encoding, False))
 
         elif key == tarantool.IPROTO_FEATURES:
             features = <IProtoFeatures> IProtoFeatures.__new__(IProtoFeatures)
 
-            for item in _decode_obj(&b, resp.encoding):
+            for item in _decode_obj(&b, resp.encoding, False):
                 if item == 0:
                     features.streams = 1
                 elif item == 1:
@@ -589,7 +651,7 @@ cdef ssize_t response_parse_body(const char *buf, uint32_t buf_len,
             resp.result_ = features
 
         elif key == tarantool.IPROTO_AUTH_TYPE:
-            logger.debug("IProto auth type: %s", _decode_obj(&b, resp.encoding))
+            logger.debug("IProto auth type: %s", _decode_obj(&b, resp.encoding, False))
 
         else:  # pragma: nocover
             logger.debug('unknown key in body map: %s', hex(int(key)))
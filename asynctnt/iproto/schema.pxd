@@ -50,6 +50,12 @@ cdef class SchemaSpace:
         readonly Metadata metadata
         readonly dict indexes
 
+        bint by_name
+
+        # raw _vspace and _vindex rows the space was parsed from
+        object row
+        list index_rows
+
     cdef void add_index(self, SchemaIndex idx)
     cdef SchemaIndex get_index(self, index, create_dummy=*)
 
@@ -63,17 +69,29 @@ cdef class Schema:
         readonly dict spaces
         readonly int id
 
+        bint by_name
+
+        # snapshot the spaces are attached from on first lookup
+        object _snapshot
+        Py_ssize_t _snapshot_base
+        dict _snapshot_spaces
+        dict _snapshot_names
+
     cdef SchemaSpace get_space(self, space)
     cdef SchemaSpace create_dummy_space(self, int space_id)
+    cdef SchemaSpace create_named_space(self, str space_name)
     cdef SchemaSpace get_or_create_space(self, space)
 
     cdef SchemaSpace parse_space(self, space_row)
     cdef SchemaIndex parse_index(self, index_row)
+    cdef SchemaSpace add_space(self, space_row, list index_rows)
+    cdef SchemaSpace attach_space(self, space)
+    cdef void attach_all(self) except *
 
     cdef inline clear(self)
 
     @staticmethod
-    cdef Schema parse(int64_t schema_id, spaces, indexes)
+    cdef Schema parse(int64_t schema_id, spaces, indexes, Schema prev=*)
 
 
 cdef list dict_to_list_fields(dict d, Metadata metadata, bint default_none)
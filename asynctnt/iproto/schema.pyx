@@ -1,5 +1,7 @@
 # cython: profile=True
 
+import marshal
+
 from asynctnt.exceptions import TarantoolSchemaError
 from asynctnt.log import logger
 
@@ -96,6 +98,9 @@ cdef class SchemaSpace:
 
         self.metadata = None
         self.indexes = {}
+        self.by_name = False
+        self.row = None
+        self.index_rows = None
 
     cdef void add_index(self, SchemaIndex idx):
         cpython.dict.PyDict_SetItem(self.indexes, idx.iid, idx)
@@ -128,6 +133,18 @@ cdef class SchemaSpace:
                 idx.name = str(index)
                 cpython.dict.PyDict_SetItem(self.indexes, index, idx)
                 return idx
+            elif is_str and create_dummy and self.by_name:
+                logger.debug(
+                    'Index %s not found in space %s/%s. '
+                    'Sending requests by its name.',
+                    index, self.sid, self.name
+                )
+                idx = <SchemaIndex> SchemaIndex.__new__(SchemaIndex)
+                idx.iid = -1
+                idx.sid = self.sid
+                idx.name = index
+                cpython.dict.PyDict_SetItem(self.indexes, index, idx)
+                return idx
             else:
                 raise TarantoolSchemaError(
                     'Index {} not found in space {}/{}'.format(
@@ -146,11 +163,18 @@ cdef class Schema:
     def __cinit__(self, int schema_id):
         self.id = schema_id
         self.spaces = {}
+        self.by_name = False
+        self._snapshot = None
+        self._snapshot_base = 0
+        self._snapshot_spaces = None
+        self._snapshot_names = None
 
     cdef SchemaSpace get_space(self, space):
         cdef PyObject *obj_p = \
             cpython.dict.PyDict_GetItem(self.spaces, space)
         if obj_p is NULL:
+            if self._snapshot is not None:
+                return self.attach_space(space)
             return None
         return <SchemaSpace> obj_p
 
@@ -158,6 +182,7 @@ cdef class Schema:
         cdef:
             bint is_str, is_int
             PyObject *obj_p
+            SchemaSpace sp
         is_str = isinstance(space, str)
         is_int = isinstance(space, int)
         if not is_str and not is_int:
@@ -166,7 +191,14 @@ cdef class Schema:
 
         obj_p = cpython.dict.PyDict_GetItem(self.spaces, space)
         if obj_p is NULL:
-            if is_str:
+            if self._snapshot is not None:
+                sp = self.attach_space(space)
+                if sp is not None:
+                    return sp
+
+            if is_str and self.by_name:
+                return self.create_named_space(space)
+            elif is_str:
                 raise TarantoolSchemaError(
                     'Space {} not found'.format(space)
                 )
@@ -180,9 +212,21 @@ cdef class Schema:
         s = <SchemaSpace> SchemaSpace.__new__(SchemaSpace)
         s.sid = space_id
         s.name = str(space_id)
+        s.by_name = self.by_name
         cpython.dict.PyDict_SetItem(self.spaces, space_id, s)
         return s
 
+    cdef SchemaSpace create_named_space(self, str space_name):
+        cdef SchemaSpace s
+        logger.debug('Space %s not found. Sending requests by its name.',
+                     space_name)
+        s = <SchemaSpace> SchemaSpace.__new__(SchemaSpace)
+        s.sid = -1
+        s.name = space_name
+        s.by_name = True
+        cpython.dict.PyDict_SetItem(self.spaces, space_name, s)
+        return s
+
     cdef inline clear(self):
         self.spaces.clear()
 
@@ -309,25 +353,201 @@ cdef class Schema:
 
         return idx
 
+    cdef SchemaSpace add_space(self, space_row, list index_rows):
+        cdef:
+            SchemaSpace sp
+            SchemaIndex idx
+
+        sp = self.parse_space(space_row)
+        # rows are kept as lists (fetched rows are TarantoolTuple), so that
+        # they compare equal to the rows of a schema loaded from a snapshot
+        sp.row = list(space_row)
+        sp.index_rows = [list(index_row) for index_row in index_rows]
+        cpython.dict.PyDict_SetItem(self.spaces, sp.sid, sp)
+        if sp.name:
+            cpython.dict.PyDict_SetItem(self.spaces, sp.name, sp)
+
+        for index_row in index_rows:
+            idx = self.parse_index(index_row)
+            sp.add_index(idx)
+        return sp
+
     @staticmethod
-    cdef Schema parse(int64_t schema_id, spaces, indexes):
+    cdef Schema parse(int64_t schema_id, spaces, indexes, Schema prev=None):
         cdef:
             Schema s
             SchemaSpace sp
-            SchemaIndex idx
+            SchemaSpace prev_sp
+            dict space_indexes
+            list index_rows
+            PyObject *obj_p
 
         s = <Schema> Schema.__new__(Schema, <int> schema_id)
+
+        space_indexes = {}
+        for index_row in indexes:
+            sid = index_row[0]
+            obj_p = cpython.dict.PyDict_GetItem(space_indexes, sid)
+            if obj_p is NULL:
+                cpython.dict.PyDict_SetItem(space_indexes, sid, [index_row])
+            else:
+                cpython.list.PyList_Append(<list> obj_p, index_row)
+
         for space_row in spaces:
-            sp = s.parse_space(space_row)
-            cpython.dict.PyDict_SetItem(s.spaces, sp.sid, sp)
+            sid = space_row[0]
+            obj_p = cpython.dict.PyDict_GetItem(space_indexes, sid)
+            if obj_p is NULL:
+                index_rows = []
+            else:
+                index_rows = <list> obj_p
+                cpython.dict.PyDict_DelItem(space_indexes, sid)
+
+            sp = None
+            if prev is not None:
+                # reuse spaces whose definition has not changed, spaces
+                # not yet attached from a snapshot are parsed anew
+                obj_p = cpython.dict.PyDict_GetItem(prev.spaces, sid)
+                prev_sp = <SchemaSpace> obj_p if obj_p is not NULL else None
+                if prev_sp is not None \
+                        and prev_sp.row is not None \
+                        and prev_sp.row == list(space_row) \
+                        and prev_sp.index_rows == [list(index_row)
+                                                   for index_row
+                                                   in index_rows]:
+                    sp = prev_sp
+
+            if sp is None:
+                s.add_space(space_row, index_rows)
+            else:
+                cpython.dict.PyDict_SetItem(s.spaces, sp.sid, sp)
+                if sp.name:
+                    cpython.dict.PyDict_SetItem(s.spaces, sp.name, sp)
+
+        for sid in space_indexes:
+            raise TarantoolSchemaError(
+                'Space with id {} not found'.format(sid))
+
+        return s
+
+    cdef SchemaSpace attach_space(self, space):
+        cdef:
+            PyObject *obj_p
+            Py_ssize_t offset, length
+
+        if isinstance(space, str):
+            obj_p = cpython.dict.PyDict_GetItem(self._snapshot_names, space)
+            if obj_p is NULL:
+                return None
+            space = <object> obj_p
+
+        obj_p = cpython.dict.PyDict_GetItem(self._snapshot_spaces, space)
+        if obj_p is NULL:
+            return None
+
+        offset, length = <tuple> obj_p
+        offset += self._snapshot_base
+        try:
+            space_row, index_rows = \
+                marshal.loads(self._snapshot[offset:offset + length])
+        except (EOFError, ValueError, TypeError) as e:
+            raise TarantoolSchemaError(
+                'Malformed schema snapshot: {}'.format(e)) from e
+        return self.add_space(space_row, index_rows)
+
+    cdef void attach_all(self) except *:
+        for sid in self._snapshot_spaces:
+            self.get_space(sid)
+
+    def dumps(self, key=None):
+        """
+            Serialize the schema into a snapshot loadable by
+            :meth:`Schema.loads` and :meth:`Schema.attach`. Only spaces
+            fetched from the server are saved.
+
+            :param key: any marshallable value identifying the server
+                        the schema belongs to
+        """
+        cdef:
+            SchemaSpace sp
+            list blobs
+            dict offsets
+            dict names
+            Py_ssize_t pos
+
+        if self._snapshot is not None:
+            self.attach_all()
+
+        # header is followed by separately marshalled spaces,
+        # so that each of them can be loaded on its own
+        blobs = []
+        offsets = {}
+        names = {}
+        pos = 0
+        for sid, sp in self.spaces.items():
+            if not isinstance(sid, int) or sp.row is None:
+                continue
+            blob = marshal.dumps((sp.row, sp.index_rows))
+            offsets[sid] = (pos, len(blob))
             if sp.name:
-                cpython.dict.PyDict_SetItem(s.spaces, sp.name, sp)
+                names[sp.name] = sid
+            blobs.append(blob)
+            pos += len(blob)
 
-        for index_row in indexes:
-            idx = s.parse_index(index_row)
-            sp = s.spaces[idx.sid]
-            sp.add_index(idx)
+        header = marshal.dumps(
+            (SCHEMA_SNAPSHOT_VERSION, key, self.id, offsets, names)
+        )
+        blobs.insert(0, len(header).to_bytes(4, 'little') + header)
+        return b''.join(blobs)
+
+    @staticmethod
+    def loads(data, key=None):
+        """
+            Load a schema snapshot made by :meth:`Schema.dumps`.
+            Returns ``None`` if the snapshot was made with another key.
+        """
+        cdef Schema s
+
+        s = Schema.attach(data, key)
+        if s is None:
+            return None
+        s.attach_all()
+        s._snapshot = None
+        s._snapshot_spaces = None
+        s._snapshot_names = None
+        return s
 
+    @staticmethod
+    def attach(data, key=None):
+        """
+            Use a schema snapshot made by :meth:`Schema.dumps` without
+            loading it: spaces are parsed from ``data`` (e.g. a memory
+            mapped snapshot file shared by processes) when they are first
+            looked up. ``data`` must not change while the schema is in use.
+            Returns ``None`` if the snapshot was made with another key.
+        """
+        cdef:
+            Schema s
+            Py_ssize_t header_len
+
+        try:
+            header_len = int.from_bytes(data[:4], 'little')
+            version, snapshot_key, schema_id, offsets, names = \
+                marshal.loads(data[4:4 + header_len])
+        except (EOFError, ValueError, TypeError) as e:
+            raise TarantoolSchemaError(
+                'Malformed schema snapshot: {}'.format(e)) from e
+
+        if version != SCHEMA_SNAPSHOT_VERSION:
+            raise TarantoolSchemaError(
+                'Unsupported schema snapshot version: {}'.format(version))
+        if snapshot_key != key:
+            return None
+
+        s = <Schema> Schema.__new__(Schema, <int> schema_id)
+        s._snapshot = data
+        s._snapshot_base = 4 + header_len
+        s._snapshot_spaces = offsets
+        s._snapshot_names = names
         return s
 
     def __repr__(self):  # pragma: nocover
@@ -1,9 +1,22 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from .batch import ResultType, _consume_result, wait_batch
+from .exceptions import ErrorCode, TarantoolDatabaseError
 from .iproto import protocol
 
 if TYPE_CHECKING:  # pragma: nocover
     from .api import Api
+    from .batch import BatchResponse
 
 
 class PreparedStatement:
@@ -70,6 +83,31 @@ class PreparedStatement:
             timeout=timeout,
         )
 
+    async def executemany(
+        self,
+        args_list: Iterable[Optional[List[Union[Dict[str, Any], Any]]]],
+        *,
+        parse_metadata: bool = True,
+        fail_fast: bool = False,
+        timeout: float = -1.0,
+    ) -> "BatchResponse":
+        """
+            Execute this prepared statement for every set of args
+            in a single round trip
+        :param args_list: iterable of arguments lists
+        :param parse_metadata: whether to parse response metadata or not
+        :param fail_fast: raise the first error without waiting
+                          for all the responses
+        :param timeout: request timeout
+        """
+        return await self._api.executemany(
+            self._stmt_id,
+            args_list,
+            parse_metadata=parse_metadata,
+            fail_fast=fail_fast,
+            timeout=timeout,
+        )
+
     async def unprepare(self, timeout: float = -1.0):
         """
             Unprepare current prepared statement
@@ -90,3 +128,142 @@ class PreparedStatement:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self._stmt_id is not None:
             await self.unprepare()
+
+
+class StatementCache:
+    """
+    LRU cache of prepared statements used by ``execute()`` for query
+    strings. Statements are prepared on first use, executed by their id
+    and unprepared on eviction.
+    """
+
+    __slots__ = ("_max_size", "_statements", "_generation")
+
+    def __init__(self, max_size: int):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self._max_size = max_size
+        # query -> (stmt_id, schema_id)
+        self._statements: "OrderedDict[str, Tuple[int, int]]" = OrderedDict()
+        self._generation = 0
+
+    @property
+    def max_size(self) -> int:
+        """
+        Maximum number of cached statements
+        """
+        return self._max_size
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def __contains__(self, query: str) -> bool:
+        return query in self._statements
+
+    def clear(self):
+        """
+        Forget all statements (e.g. they are gone with a reconnect)
+        """
+        self._statements.clear()
+        self._generation += 1
+
+    async def execute(
+        self,
+        db: protocol.Db,
+        query: str,
+        args: Optional[List[Union[Dict[str, Any], Any]]],
+        *,
+        parse_metadata: bool,
+        timeout: float,
+    ) -> protocol.Response:
+        stmt_id = await self.statement_id(db, query, timeout)
+        try:
+            return await db.execute(
+                stmt_id, args, parse_metadata=parse_metadata, timeout=timeout
+            )
+        except TarantoolDatabaseError as e:
+            if e.code != ErrorCode.ER_WRONG_QUERY_ID:
+                raise
+
+        # statement was unprepared concurrently or evicted by the server
+        self._statements.pop(query, None)
+        stmt_id = await self.statement_id(db, query, timeout)
+        return await db.execute(
+            stmt_id, args, parse_metadata=parse_metadata, timeout=timeout
+        )
+
+    async def executemany(
+        self,
+        db: protocol.Db,
+        query: str,
+        args_list: Iterable[Optional[List[Union[Dict[str, Any], Any]]]],
+        *,
+        parse_metadata: bool,
+        fail_fast: bool,
+        timeout: float,
+    ) -> List[ResultType]:
+        args_list = list(args_list)
+        stmt_id = await self.statement_id(db, query, timeout)
+        futures = db.execute_many(
+            stmt_id, args_list, parse_metadata=parse_metadata, timeout=timeout
+        )
+        try:
+            return await wait_batch(futures, fail_fast)
+        except TarantoolDatabaseError as e:
+            if e.code != ErrorCode.ER_WRONG_QUERY_ID:
+                raise
+
+        # statement was unprepared concurrently or evicted by the server,
+        # requests failed with it were not executed, so only they are resent
+        results = await wait_batch(futures, return_exceptions=True)
+        retry = [i for i, res in enumerate(results) if _is_wrong_query_id(res)]
+
+        self._statements.pop(query, None)
+        stmt_id = await self.statement_id(db, query, timeout)
+        futures = db.execute_many(
+            stmt_id,
+            [args_list[i] for i in retry],
+            parse_metadata=parse_metadata,
+            timeout=timeout,
+        )
+        for i, res in zip(retry, await wait_batch(futures, return_exceptions=True)):
+            results[i] = res
+
+        for res in results:
+            if isinstance(res, BaseException):
+                raise res
+        return results
+
+    async def statement_id(
+        self, db: protocol.Db, query: str, timeout: float = -1.0
+    ) -> int:
+        """
+        Get id of a prepared statement for the query, preparing it if needed
+        """
+        schema_id = db.schema_id
+        entry = self._statements.get(query)
+        if entry is not None and entry[1] == schema_id:
+            self._statements.move_to_end(query)
+            return entry[0]
+
+        generation = self._generation
+        resp = await db.prepare(query, timeout=timeout)
+        stmt_id = resp.stmt_id
+        if generation == self._generation:
+            self._statements[query] = (stmt_id, schema_id)
+            self._statements.move_to_end(query)
+            self._evict(db)
+        return stmt_id
+
+    def _evict(self, db: protocol.Db):
+        while len(self._statements) > self._max_size:
+            _, (stmt_id, _) = self._statements.popitem(last=False)
+            # unprepare in background
+            db.prepare(stmt_id).add_done_callback(_consume_result)
+
+
+def _is_wrong_query_id(res: ResultType) -> bool:
+    return (
+        isinstance(res, TarantoolDatabaseError)
+        and res.code == ErrorCode.ER_WRONG_QUERY_ID
+    )
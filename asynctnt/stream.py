@@ -1,4 +1,5 @@
-from .api import Api
+from .api import Api, Isolation
+from .transaction import TransactionBatch
 
 
 class Stream(Api):
@@ -12,6 +13,19 @@ class Stream(Api):
         """
         return self._db.stream_id
 
+    def transaction_batch(
+        self, isolation: Isolation = Isolation.DEFAULT, tx_timeout: float = 0.0
+    ) -> TransactionBatch:
+        """
+        Create a :class:`asynctnt.transaction.TransactionBatch` - statements
+        of a transaction which are sent in a single write together with
+        the begin request
+
+        :param isolation: isolation level
+        :param tx_timeout: transaction timeout
+        """
+        return TransactionBatch(self, isolation, tx_timeout)
+
     async def __aenter__(self):
         """
             If used as Context Manager `begin()` and `commit()`/`rollback()`
@@ -0,0 +1,109 @@
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from .iproto import protocol
+from .types import KeyType, MethodRet, SpaceType
+
+if TYPE_CHECKING:  # pragma: nocover
+    from .api import Api
+
+
+class CallTemplate:
+    """
+    Call request with the header and body encoded once.
+    Every call only patches the request sync and encodes arguments.
+    """
+
+    __slots__ = ("_api", "_template")
+
+    def __init__(self, api: "Api", func_name: str, *, call16: bool = False):
+        self._api = api
+        self._template = protocol.RequestTemplate(func_name, call16=call16)
+
+    @property
+    def func_name(self) -> str:
+        """
+        Function name to call
+        """
+        return self._template.func_name
+
+    def call(
+        self,
+        args: Optional[List[Any]] = None,
+        *,
+        timeout: float = -1.0,
+        push_subscribe: bool = False,
+    ) -> MethodRet:
+        """
+        Call the function with specified args
+
+        :param args: arguments to pass to the function (list object)
+        :param timeout: Request timeout
+        :param push_subscribe: Subscribe to push notifications
+
+        :returns: :class:`asynctnt.Response` instance
+        """
+        return self._api._db.call_template(
+            self._template, args, timeout=timeout, push_subscribe=push_subscribe
+        )
+
+    __call__ = call
+
+
+class UpdateTemplate:
+    """
+    Update request with operations compiled once: field names are
+    resolved to numbers and static parts are pre-encoded, so every
+    update only encodes the key and the values of
+    :class:`asynctnt.Param` placeholders.
+    """
+
+    __slots__ = ("_api", "_template")
+
+    def __init__(
+        self,
+        api: "Api",
+        space: SpaceType,
+        operations: List[Any],
+        *,
+        index: SpaceType = 0,
+    ):
+        self._api = api
+        self._template = protocol.UpdateRequestTemplate(space, operations, index)
+
+    @property
+    def space(self) -> SpaceType:
+        """
+        Space to update
+        """
+        return self._template.space
+
+    @property
+    def params_count(self) -> int:
+        """
+        Number of parameters
+        """
+        return self._template.params_count
+
+    def update(
+        self,
+        key: KeyType,
+        params: Optional[List[Any]] = None,
+        *,
+        timeout: float = -1.0,
+    ) -> MethodRet:
+        """
+        Update the tuple with the key substituting
+        :class:`asynctnt.Param` placeholders with params
+
+        :param key: key of the tuple to update
+        :param params: values of the parameters in order of
+                       the placeholders in the operations
+        :param timeout: Request timeout
+
+        :returns: :class:`asynctnt.Response` instance
+        """
+        return self._api._db.update_template(
+            self._template, key, params, timeout=timeout
+        )
+
+    __call__ = update
@@ -0,0 +1,324 @@
+import asyncio
+import functools
+import random
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from .api import Isolation
+from .batch import _consume_result, load_spaces, wait_batch
+from .exceptions import (
+    ErrorCode,
+    TarantoolDatabaseError,
+    TarantoolTransactionError,
+)
+from .iproto import protocol
+from .log import logger
+from .types import KeyType, SpaceType, TupleType
+
+if TYPE_CHECKING:  # pragma: nocover
+    from .connection import Connection
+    from .stream import Stream
+
+T = TypeVar("T")
+
+# errors after which a transaction may succeed if it is run once again
+CONFLICT_ERROR_CODES = frozenset((ErrorCode.ER_TRANSACTION_CONFLICT,))
+
+
+class TransactionBatch:
+    """
+    Statements of a transaction which are sent to Tarantool in one go
+    together with begin (and commit) requests.
+    """
+
+    __slots__ = ("_stream", "_isolation", "_tx_timeout", "_statements", "_spaces")
+
+    def __init__(
+        self,
+        stream: "Stream",
+        isolation: Isolation = Isolation.DEFAULT,
+        tx_timeout: float = 0.0,
+    ):
+        self._stream = stream
+        self._isolation = isolation
+        self._tx_timeout = tx_timeout
+        self._statements: List[Callable[..., Any]] = []
+        self._spaces: List[SpaceType] = []
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def _add(self, func: Callable[..., Any], *args, **kwargs) -> "TransactionBatch":
+        self._statements.append(functools.partial(func, *args, **kwargs))
+        return self
+
+    def _add_to(
+        self, space: SpaceType, func: Callable[..., Any], *args, **kwargs
+    ) -> "TransactionBatch":
+        if space not in self._spaces:
+            self._spaces.append(space)
+        return self._add(func, space, *args, **kwargs)
+
+    def select(
+        self, space: SpaceType, key: Optional[KeyType] = None, **kwargs
+    ) -> "TransactionBatch":
+        """
+        Add select statement. See :meth:`asynctnt.Connection.select`
+        """
+        return self._add_to(space, self._stream.select, key, **kwargs)
+
+    def insert(
+        self, space: SpaceType, t: TupleType, *, replace: bool = False
+    ) -> "TransactionBatch":
+        """
+        Add insert statement. See :meth:`asynctnt.Connection.insert`
+        """
+        return self._add_to(space, self._stream.insert, t, replace=replace)
+
+    def replace(self, space: SpaceType, t: TupleType) -> "TransactionBatch":
+        """
+        Add replace statement. See :meth:`asynctnt.Connection.replace`
+        """
+        return self._add_to(space, self._stream.replace, t)
+
+    def delete(self, space: SpaceType, key: KeyType, **kwargs) -> "TransactionBatch":
+        """
+        Add delete statement. See :meth:`asynctnt.Connection.delete`
+        """
+        return self._add_to(space, self._stream.delete, key, **kwargs)
+
+    def update(
+        self, space: SpaceType, key: KeyType, operations: List[Any], **kwargs
+    ) -> "TransactionBatch":
+        """
+        Add update statement. See :meth:`asynctnt.Connection.update`
+        """
+        return self._add_to(space, self._stream.update, key, operations, **kwargs)
+
+    def upsert(
+        self, space: SpaceType, t: TupleType, operations: List[Any], **kwargs
+    ) -> "TransactionBatch":
+        """
+        Add upsert statement. See :meth:`asynctnt.Connection.upsert`
+        """
+        return self._add_to(space, self._stream.upsert, t, operations, **kwargs)
+
+    def call(
+        self, func_name: str, args: Optional[List[Any]] = None
+    ) -> "TransactionBatch":
+        """
+        Add call statement. See :meth:`asynctnt.Connection.call`
+        """
+        return self._add(self._stream.call, func_name, args)
+
+    def eval(
+        self, expression: str, args: Optional[List[Any]] = None
+    ) -> "TransactionBatch":
+        """
+        Add eval statement. See :meth:`asynctnt.Connection.eval`
+        """
+        return self._add(self._stream.eval, expression, args)
+
+    def execute(
+        self,
+        query: Union[str, int],
+        args: Optional[List[Union[Dict[str, Any], Any]]] = None,
+        *,
+        parse_metadata: bool = True,
+    ) -> "TransactionBatch":
+        """
+        Add SQL statement. See :meth:`asynctnt.Connection.execute`
+        """
+        # bypass statement cache - preparing is asynchronous and would
+        # reorder the requests
+        return self._add(
+            self._stream._db.execute, query, args, parse_metadata=parse_metadata
+        )
+
+    async def commit(
+        self, *, atomic: bool = True, timeout: float = -1.0
+    ) -> List[protocol.Response]:
+        """
+            Send begin request and all the statements in a single write
+            and commit the transaction.
+
+            With ``atomic=True`` commit (or rollback if any statement fails)
+            is sent after all the statements responses are received - 2 round
+            trips in total. With ``atomic=False`` commit is sent in the same
+            write - a single round trip, but Tarantool does not abort
+            a transaction on a failed statement, so the rest of the
+            statements are committed anyway.
+
+        :param atomic: rollback the transaction if any statement fails
+        :param timeout: request timeout
+        :raises TarantoolTransactionError: if any statement fails
+        :return: list of statements responses
+        """
+        stream = self._stream
+        await load_spaces(stream._db, self._spaces)
+        futures = []
+        stream._db.cork()
+        try:
+            futures.append(stream.begin(self._isolation, self._tx_timeout, timeout))
+            for statement in self._statements:
+                futures.append(statement(timeout=timeout))
+            if not atomic:
+                futures.append(stream.commit(timeout))
+        except BaseException:
+            # the requests encoded so far are flushed anyway, so the
+            # transaction is rolled back within the same write
+            if futures:
+                futures.append(stream.rollback(timeout))
+            for fut in futures:
+                fut.add_done_callback(_consume_result)
+            raise
+        finally:
+            stream._db.uncork()
+
+        try:
+            results = await wait_batch(futures, return_exceptions=True)
+        except BaseException:
+            stream.rollback(timeout).add_done_callback(_consume_result)
+            raise
+
+        if isinstance(results[0], BaseException):
+            raise results[0]
+
+        responses = results[1 : len(self._statements) + 1]
+        failed = next(
+            (
+                (i, res)
+                for i, res in enumerate(responses)
+                if isinstance(res, BaseException)
+            ),
+            None,
+        )
+
+        if atomic:
+            if failed is not None:
+                await stream.rollback(timeout)
+                raise TarantoolTransactionError(failed[0], failed[1], False)
+            await stream.commit(timeout)
+        else:
+            if isinstance(results[-1], BaseException):
+                raise results[-1]
+            if failed is not None:
+                raise TarantoolTransactionError(failed[0], failed[1], True)
+
+        return responses
+
+
+def is_conflict_error(e: BaseException) -> bool:
+    """
+    Check if the exception is a transaction conflict error
+    """
+    if isinstance(e, TarantoolTransactionError):
+        e = e.error
+    return isinstance(e, TarantoolDatabaseError) and e.code in CONFLICT_ERROR_CODES
+
+
+class TransactionStats:
+    """
+    Counters of transactions run with :meth:`asynctnt.Connection.transaction`
+    """
+
+    __slots__ = ("transactions", "attempts", "conflicts", "failures")
+
+    def __init__(self):
+        self.transactions = 0
+        """ Number of transactions run """
+
+        self.attempts = 0
+        """ Total number of attempts (including retries) """
+
+        self.conflicts = 0
+        """ Number of attempts aborted by a conflict """
+
+        self.failures = 0
+        """ Number of transactions failed after all the retries """
+
+    @property
+    def retries(self) -> int:
+        """
+        Number of retried attempts
+        """
+        return self.attempts - self.transactions
+
+    def reset(self):
+        """
+        Reset all the counters
+        """
+        self.transactions = 0
+        self.attempts = 0
+        self.conflicts = 0
+        self.failures = 0
+
+    def __repr__(self):  # pragma: nocover
+        return (
+            "<TransactionStats transactions={} attempts={} "
+            "conflicts={} failures={}>".format(
+                self.transactions, self.attempts, self.conflicts, self.failures
+            )
+        )
+
+
+async def _rollback(stream: "Stream", timeout: float):
+    # errors of the rollback must not hide the original error
+    try:
+        await stream.rollback(timeout)
+    except TarantoolDatabaseError:
+        # failed commit ends the transaction, otherwise it is still active
+        pass
+    except Exception as e:
+        logger.exception(e)
+
+
+async def run_transaction(
+    conn: "Connection",
+    stats: TransactionStats,
+    fn: Callable[["Stream"], Awaitable[T]],
+    *,
+    isolation: Isolation,
+    tx_timeout: float,
+    retries: int,
+    backoff: float,
+    max_backoff: float,
+    timeout: float,
+) -> T:
+    if retries < 0:
+        raise ValueError("retries must not be negative")
+
+    stats.transactions += 1
+    attempt = 0
+    while True:
+        stats.attempts += 1
+        stream = conn.stream()
+        await stream.begin(isolation, tx_timeout, timeout)
+        try:
+            result = await fn(stream)
+            await stream.commit(timeout)
+            return result
+        except BaseException as e:
+            await _rollback(stream, timeout)
+            if not isinstance(e, Exception) or not is_conflict_error(e):
+                raise
+
+            stats.conflicts += 1
+            if attempt >= retries:
+                stats.failures += 1
+                raise
+
+        # exponential backoff with full jitter
+        delay = min(max_backoff, backoff * (2**attempt))
+        attempt += 1
+        if delay > 0:
+            await asyncio.sleep(random.uniform(0, delay))
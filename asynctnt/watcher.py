@@ -0,0 +1,111 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from .log import logger
+
+if TYPE_CHECKING:  # pragma: nocover
+    from .connection import Connection
+
+WatchCallback = Callable[[str, Any], Any]
+
+
+class Watcher:
+    """
+    Subscription to a watch key (see ``box.broadcast()``).
+
+    The callback (if any) is called with the key and the new value
+    every time it changes. A watcher is also an async iterator of the
+    values: only the latest value is kept, so a slow consumer skips the
+    intermediate ones.
+    """
+
+    __slots__ = (
+        "_conn",
+        "_key",
+        "_callback",
+        "_value",
+        "_version",
+        "_seen_version",
+        "_waiter",
+        "_closed",
+    )
+
+    def __init__(
+        self,
+        conn: "Connection",
+        key: str,
+        callback: Optional[WatchCallback] = None,
+    ):
+        self._conn = conn
+        self._key = key
+        self._callback = callback
+        self._value: Any = None
+        self._version = 0
+        self._seen_version = 0
+        self._waiter: Optional[asyncio.Future] = None
+        self._closed = False
+
+    @property
+    def key(self) -> str:
+        """
+        Watched key
+        """
+        return self._key
+
+    @property
+    def value(self) -> Any:
+        """
+        Latest value of the key (``None`` until it's received)
+        """
+        return self._value
+
+    @property
+    def closed(self) -> bool:
+        """
+        Is watcher unregistered
+        """
+        return self._closed
+
+    def unwatch(self):
+        """
+        Unregister the watcher. Iteration over the watcher stops.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._conn._unwatch(self)
+        self._wakeup()
+
+    def _notify(self, value: Any):
+        if self._closed:
+            return
+        self._value = value
+        self._version += 1
+        self._wakeup()
+
+        if self._callback is not None:
+            try:
+                self._callback(self._key, value)
+            except Exception as e:
+                logger.exception(e)
+
+    def _wakeup(self):
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+        self._waiter = None
+
+    def __aiter__(self) -> "Watcher":
+        return self
+
+    async def __anext__(self) -> Any:
+        while not self._closed:
+            if self._seen_version != self._version:
+                self._seen_version = self._version
+                return self._value
+
+            self._waiter = asyncio.get_running_loop().create_future()
+            await self._waiter
+        raise StopAsyncIteration
+
+    def __repr__(self):  # pragma: nocover
+        return "<Watcher key={!r} closed={}>".format(self._key, self._closed)
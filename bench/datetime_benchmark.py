@@ -0,0 +1,42 @@
+"""
+Datetime encoding/decoding micro-benchmark.
+
+Measures the MP_DATETIME codec without a server for naive values (which
+are converted in local time) and for values with a fixed UTC offset,
+using the same harness as bench/decimal_benchmark.py.
+"""
+
+import argparse
+import datetime
+import random
+
+from decimal_benchmark import bench_codec
+
+
+def make_datetimes(n, tz):
+    rnd = random.Random(42)
+    start = datetime.datetime(1900, 1, 1, tzinfo=tz)
+    values = []
+    for _ in range(n):
+        # whole seconds: naive values are encoded through a float timestamp
+        seconds = rnd.randint(0, 200 * 365 * 86400)
+        values.append(start + datetime.timedelta(seconds=seconds))
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=100000, help="number of datetimes")
+    parser.add_argument("-r", type=int, default=5, help="number of repeats")
+    args = parser.parse_args()
+
+    for name, tz in [
+        ("naive", None),
+        ("+03:00", datetime.timezone(datetime.timedelta(hours=3))),
+    ]:
+        print("[{}]".format(name))
+        bench_codec(make_datetimes(args.n, tz), args.r)
+
+
+if __name__ == "__main__":
+    main()
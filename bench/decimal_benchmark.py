@@ -0,0 +1,178 @@
+"""
+Decimal encoding/decoding micro-benchmark.
+
+Measures the MP_DECIMAL codec without a server: decimals are encoded as
+arguments of an eval request and decoded from a response fed straight
+into a protocol instance. Optionally measures round trips of decimals
+through a Tarantool instance started with bench/init.lua.
+"""
+
+import argparse
+import asyncio
+import base64
+import random
+import timeit
+from decimal import Decimal
+
+HOST = "127.0.0.1"
+PORT = 3305
+USERNAME = "t1"
+PASSWORD = "t1"
+
+EXPRESSION = "return ..."
+
+
+def make_decimals(n):
+    rnd = random.Random(42)
+    values = []
+    for _ in range(n):
+        cents = rnd.randint(-(10**12), 10**12)
+        values.append(Decimal(cents).scaleb(-rnd.randint(0, 6)))
+    return values
+
+
+class _Transport(asyncio.Transport):
+    def __init__(self):
+        super().__init__()
+        self.last_write = b""
+
+    def write(self, data):
+        self.last_write = bytes(data)
+
+    def get_extra_info(self, name, default=None):
+        return default
+
+    def is_closing(self):
+        return False
+
+    def close(self):
+        pass
+
+
+def _greeting():
+    # Tarantool older than 2.10 has no id request, so the connection
+    # is ready right after the greeting
+    version = b"Tarantool 2.8.0 (Binary) 00000000-0000-0000-0000-000000000000"
+    salt = base64.b64encode(b"s" * 32)
+    return version.ljust(63) + b"\n" + salt.ljust(63) + b"\n"
+
+
+def _mp_read_uint(data, pos):
+    tag = data[pos]
+    if tag < 0x80:
+        return tag, pos + 1
+    size = {0xCC: 1, 0xCD: 2, 0xCE: 4, 0xCF: 8}[tag]
+    return int.from_bytes(data[pos + 1 : pos + 1 + size], "big"), pos + 1 + size
+
+
+def _request_sync(request):
+    # 5 bytes of length are followed by the header map of uints
+    pos = 6
+    for _ in range(request[5] & 0x0F):
+        key, pos = _mp_read_uint(request, pos)
+        value, pos = _mp_read_uint(request, pos)
+        if key == 0x01:
+            return value
+    raise ValueError("sync not found")
+
+
+def _mp_uint32(value):
+    return b"\xce" + value.to_bytes(4, "big")
+
+
+def make_protocol(loop):
+    import asynctnt
+
+    conn = asynctnt.Connection(
+        host=HOST, port=PORT, fetch_schema=False, auto_refetch_schema=False
+    )
+    connected_fut = loop.create_future()
+    proto = conn.protocol_factory(connected_fut, loop)
+    transport = _Transport()
+    proto.connection_made(transport)
+    proto.data_received(_greeting())
+    assert connected_fut.done()
+    return proto, transport
+
+
+def bench_codec(values, repeat):
+    loop = asyncio.new_event_loop()
+    try:
+        proto, transport = make_protocol(loop)
+        db = proto.get_common_db()
+
+        def encode():
+            return db.eval(EXPRESSION, values)
+
+        elapsed = min(timeit.repeat(encode, number=1, repeat=repeat))
+        print("{:<20} {:>10.0f} values/s".format("encode", len(values) / elapsed))
+
+        # request body is {IPROTO_EXPR: EXPRESSION, IPROTO_TUPLE: [...]},
+        # the encoded arguments are sent back as the response data
+        encode()
+        request = transport.last_write
+        expr = bytes([0xA0 | len(EXPRESSION)]) + EXPRESSION.encode()
+        data = request[request.index(expr) + len(expr) + 1 :]
+        sync = _request_sync(request) + 1
+
+        def decode():
+            nonlocal sync
+            header = b"\x83\x00\x00\x01" + _mp_uint32(sync) + b"\x05\x01"
+            payload = header + b"\x81\x30" + data
+            fut = db.eval(EXPRESSION, None)
+            sync += 1
+            proto.data_received(_mp_uint32(len(payload)) + payload)
+            return fut
+
+        fut = decode()
+        assert list(fut.result()) == values
+        elapsed = min(timeit.repeat(decode, number=1, repeat=repeat))
+        print("{:<20} {:>10.0f} values/s".format("decode", len(values) / elapsed))
+    finally:
+        loop.close()
+
+
+async def bench_roundtrip(values, repeat):
+    import asynctnt
+
+    conn = asynctnt.Connection(
+        host=HOST,
+        port=PORT,
+        username=USERNAME,
+        password=PASSWORD,
+        fetch_schema=False,
+        auto_refetch_schema=False,
+    )
+    await conn.connect()
+    try:
+        loop = asyncio.get_running_loop()
+        best = None
+        for _ in range(repeat):
+            start = loop.time()
+            await conn.eval(EXPRESSION, values)
+            elapsed = loop.time() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print("{:<20} {:>10.0f} values/s".format("eval round trip", len(values) / best))
+    finally:
+        await conn.disconnect()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=100000, help="number of decimals")
+    parser.add_argument("-r", type=int, default=5, help="number of repeats")
+    parser.add_argument(
+        "--server",
+        action="store_true",
+        help="also measure round trips through Tarantool",
+    )
+    args = parser.parse_args()
+
+    values = make_decimals(args.n)
+    bench_codec(values, args.r)
+    if args.server:
+        asyncio.run(bench_roundtrip(values, args.r))
+
+
+if __name__ == "__main__":
+    main()
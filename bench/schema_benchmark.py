@@ -0,0 +1,148 @@
+"""
+Measures schema refetch on a large synthetic schema: a full parse
+against an incremental refresh which reuses unchanged spaces, and
+loading a schema snapshot against attaching to it,
+using a Tarantool instance started with bench/init.lua.
+"""
+
+import argparse
+import asyncio
+import time
+
+HOST = "127.0.0.1"
+PORT = 3305
+USERNAME = "t1"
+PASSWORD = "t1"
+
+CREATE_SPACES = """
+local prefix, count = ...
+for i = 1, count do
+    local name = prefix .. i
+    if box.space[name] == nil then
+        local s = box.schema.space.create(name, {format = {
+            {name = 'id', type = 'unsigned'},
+            {name = 'name', type = 'string'},
+            {name = 'value', type = 'unsigned'},
+            {name = 'data', type = 'any', is_nullable = true},
+        }})
+        s:create_index('primary', {parts = {'id'}})
+        s:create_index('name', {parts = {'name'}, unique = false})
+    end
+end
+"""
+
+DROP_SPACES = """
+local prefix, count = ...
+for i = 1, count do
+    local s = box.space[prefix .. i]
+    if s ~= nil then
+        s:drop()
+    end
+end
+"""
+
+TOUCH_SPACE = """
+local name = ...
+local s = box.space[name]
+if s.index.tmp == nil then
+    s:create_index('tmp', {parts = {'value'}, unique = false})
+else
+    s.index.tmp:drop()
+end
+"""
+
+
+def connect():
+    import asynctnt
+
+    return asynctnt.connect(
+        host=HOST,
+        port=PORT,
+        username=USERNAME,
+        password=PASSWORD,
+        fetch_schema=False,
+        auto_refetch_schema=False,
+    )
+
+
+async def timed(name, n, prepare, f):
+    elapsed = []
+    for _ in range(n):
+        await prepare()
+        start = time.perf_counter()
+        await f()
+        elapsed.append(time.perf_counter() - start)
+    elapsed.sort()
+    print(
+        "[{}] min: {:.1f}ms, median: {:.1f}ms".format(
+            name, elapsed[0] * 1000, elapsed[len(elapsed) // 2] * 1000
+        )
+    )
+
+
+async def run(spaces, n, prefix):
+    from asynctnt.iproto.protocol import Schema
+
+    conn = await connect()
+    fresh_conn = None
+    try:
+        await conn.eval(CREATE_SPACES, [prefix, spaces], timeout=600)
+        await conn.refetch_schema()
+        print("spaces in schema: {}".format(len(conn.schema.spaces) // 2))
+
+        async def new_connection():
+            nonlocal fresh_conn
+            if fresh_conn is not None:
+                await fresh_conn.disconnect()
+            fresh_conn = await connect()
+
+        async def full():
+            # nothing to reuse on a new connection
+            await fresh_conn.refetch_schema()
+
+        async def touch_space():
+            await conn.eval(TOUCH_SPACE, [prefix + "1"])
+
+        await timed("full", n, new_connection, full)
+        await timed("incremental", n, touch_space, conn.refetch_schema)
+
+        snapshot = conn.schema.dumps()
+        print("snapshot size: {} bytes".format(len(snapshot)))
+
+        async def nothing():
+            pass
+
+        async def loads():
+            Schema.loads(snapshot)
+
+        async def attach():
+            Schema.attach(snapshot)
+
+        await timed("snapshot loads", n, nothing, loads)
+        await timed("snapshot attach", n, nothing, attach)
+    finally:
+        if fresh_conn is not None:
+            await fresh_conn.disconnect()
+        await conn.eval(DROP_SPACES, [prefix, spaces], timeout=600)
+        await conn.disconnect()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-s", type=int, default=4000, help="number of spaces")
+    parser.add_argument("-n", type=int, default=20, help="number of refetches")
+    parser.add_argument("--prefix", default="bench_schema_", help="space names prefix")
+    args = parser.parse_args()
+
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
+    asyncio.run(run(args.s, args.n, args.prefix))
+
+
+if __name__ == "__main__":
+    main()
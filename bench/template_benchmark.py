@@ -0,0 +1,71 @@
+"""
+Compares plain call() requests with pre-encoded call templates
+against a Tarantool instance started with bench/init.lua.
+"""
+
+import argparse
+import asyncio
+import math
+import time
+
+HOST = "127.0.0.1"
+PORT = 3305
+USERNAME = "t1"
+PASSWORD = "t1"
+
+
+async def bench(name, n, b, make_request):
+    n_requests_per_bulk = math.ceil(n / b)
+
+    async def bulk_f():
+        for _ in range(n_requests_per_bulk):
+            await make_request()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[bulk_f() for _ in range(b)])
+    elapsed = time.perf_counter() - start
+    print("[{}] Elapsed: {:.3f}s, RPS: {:.0f}".format(name, elapsed, n / elapsed))
+
+
+async def run(n, b):
+    import asynctnt
+
+    conn = asynctnt.Connection(
+        host=HOST,
+        port=PORT,
+        username=USERNAME,
+        password=PASSWORD,
+        fetch_schema=False,
+        auto_refetch_schema=False,
+    )
+    await conn.connect()
+    try:
+        args = [42, "profile"]
+        func_param = conn.template("func_param")
+
+        await bench("call", n, b, lambda: conn.call("func_param", args))
+        await bench("template", n, b, lambda: func_param(args))
+    finally:
+        await conn.disconnect()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-n", type=int, default=200000, help="number of executed requests"
+    )
+    parser.add_argument("-b", type=int, default=300, help="number of bulks")
+    args = parser.parse_args()
+
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
+    asyncio.run(run(args.n, args.b))
+
+
+if __name__ == "__main__":
+    main()
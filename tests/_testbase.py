@@ -241,6 +241,8 @@ class TarantoolTestCase(TestCase):
         request_timeout=None,
         encoding="utf-8",
         initial_read_buffer_size=None,
+        datetime_as_ns=False,
+        statement_cache_size=0,
     ):
         self._conn = asynctnt.Connection(
             host=self.tnt.host,
@@ -255,6 +257,8 @@ class TarantoolTestCase(TestCase):
             ping_timeout=ping_timeout,
             encoding=encoding,
             initial_read_buffer_size=initial_read_buffer_size,
+            datetime_as_ns=datetime_as_ns,
+            statement_cache_size=statement_cache_size,
         )
         await self._conn.connect()
         return self._conn
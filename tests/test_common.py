@@ -84,6 +84,94 @@ class CommonTestCase(BaseTarantoolTestCase):
         self.assertEqual("f6", sp.metadata.fields[5].name)
         self.assertEqual("*", sp.metadata.fields[5].type)
 
+    async def test__schema_refetch_reuses_unchanged_spaces(self):
+        await self.tnt_reconnect(
+            fetch_schema=True, auto_refetch_schema=False, username="t1", password="t1"
+        )
+        tester = self.conn.schema.spaces[self.TESTER_SPACE_NAME]
+        tester_metadata = tester.metadata
+
+        await self.conn.eval("box.schema.create_space('new_space')")
+        try:
+            await self.conn.refetch_schema()
+            self.assertIs(self.conn.schema.spaces[self.TESTER_SPACE_NAME], tester)
+            self.assertIs(self.conn.schema.spaces[self.TESTER_SPACE_ID], tester)
+            self.assertIs(tester.metadata, tester_metadata)
+            new_space = self.conn.schema.spaces["new_space"]
+            self.assertEqual(new_space.indexes, {})
+
+            await self.conn.eval("box.space.new_space:create_index('primary')")
+            await self.conn.refetch_schema()
+            self.assertIs(self.conn.schema.spaces[self.TESTER_SPACE_NAME], tester)
+            self.assertIsNot(self.conn.schema.spaces["new_space"], new_space)
+            self.assertIn("primary", self.conn.schema.spaces["new_space"].indexes)
+
+            await self.conn.call("change_format")
+            await self.conn.refetch_schema()
+            sp = self.conn.schema.spaces[self.TESTER_SPACE_NAME]
+            self.assertIsNot(sp, tester)
+            self.assertEqual("f6", sp.metadata.fields[5].name)
+        finally:
+            await self.conn.eval(
+                "local s = box.space.new_space;" "if s ~= nil then s:drop(); end"
+            )
+
+    async def test__schema_refetch_debounced(self):
+        await self.tnt_reconnect(
+            auto_refetch_schema=True,
+            username="t1",
+            password="t1",
+            schema_refetch_delay=0.3,
+        )
+        self.assertEqual(self.conn.schema_refetch_delay, 0.3)
+        schema_before = self.conn.schema_id
+        refetches_before = self.conn.schema_refetches
+
+        try:
+            for i in range(3):
+                await self.conn.eval(
+                    "box.schema.create_space('new_space_{}')".format(i)
+                )
+                await self.conn.ping()
+
+            # requests use the current schema until the window passes
+            self.assertEqual(self.conn.schema_id, schema_before)
+            await self.sleep(1)
+
+            self.assertGreater(self.conn.schema_id, schema_before, "Schema changed")
+            self.assertEqual(self.conn.schema_refetches, refetches_before + 1)
+            self.assertGreater(self.conn.schema_refetches_coalesced, 0)
+            for i in range(3):
+                self.assertIn("new_space_{}".format(i), self.conn.schema.spaces)
+        finally:
+            await self.conn.eval(
+                "for i = 0, 2 do "
+                "local s = box.space['new_space_' .. i]; "
+                "if s ~= nil then s:drop() end "
+                "end"
+            )
+
+    async def test__schema_refetch_manual_coalesced(self):
+        await self.tnt_reconnect(
+            fetch_schema=True, auto_refetch_schema=False, username="t1", password="t1"
+        )
+        refetches_before = self.conn.schema_refetches
+
+        await self.conn.eval("box.schema.create_space('new_space')")
+        try:
+            await asyncio.gather(
+                self.conn.refetch_schema(),
+                self.conn.refetch_schema(),
+                self.conn.refetch_schema(),
+            )
+            self.assertIn("new_space", self.conn.schema.spaces)
+            self.assertEqual(self.conn.schema_refetches, refetches_before + 2)
+            self.assertEqual(self.conn.schema_refetches_coalesced, 2)
+        finally:
+            await self.conn.eval(
+                "local s = box.space.new_space;" "if s ~= nil then s:drop(); end"
+            )
+
     async def test__schema_no_fetch_and_refetch(self):
         await self.tnt_reconnect(
             auto_refetch_schema=False, username="t1", password="t1", fetch_schema=False
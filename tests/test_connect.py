@@ -1,4 +1,6 @@
 import asyncio
+import os
+import tempfile
 import uuid
 
 import asynctnt
@@ -216,6 +218,274 @@ class ConnectTestCase(BaseTarantoolTestCase):
             self.assertIsNotNone(conn._protocol.schema)
             await conn.call("box.info")
 
+    async def test__connect_pipelined(self):
+        conn = asynctnt.Connection(
+            host=self.tnt.host,
+            port=self.tnt.port,
+            reconnect_timeout=0,
+            pipelined_handshake=True,
+        )
+        self.assertTrue(conn.pipelined_handshake)
+        async with conn:
+            self.assertTrue(conn.is_fully_connected)
+            self.assertEqual(conn.state, ConnectionState.CONNECTED)
+            self.assertGreater(conn.schema_id, 0)
+            self.assertIn(self.TESTER_SPACE_NAME, conn.schema.spaces)
+            await conn.call("box.info")
+
+    async def test__connect_pipelined_auth(self):
+        conn = asynctnt.Connection(
+            host=self.tnt.host,
+            port=self.tnt.port,
+            username="t1",
+            password="t1",
+            reconnect_timeout=0,
+            pipelined_handshake=True,
+        )
+        async with conn:
+            self.assertTrue(conn.is_fully_connected)
+            self.assertGreater(conn.schema_id, 0)
+            self.assertIn(self.TESTER_SPACE_NAME, conn.schema.spaces)
+            if conn.version >= (2, 10):
+                self.assertTrue(conn.features.streams)
+            await conn.call("box.info")
+
+    async def test__connect_pipelined_auth_no_schema(self):
+        conn = asynctnt.Connection(
+            host=self.tnt.host,
+            port=self.tnt.port,
+            username="t1",
+            password="t1",
+            fetch_schema=False,
+            auto_refetch_schema=False,
+            reconnect_timeout=0,
+            pipelined_handshake=True,
+        )
+        async with conn:
+            self.assertTrue(conn.is_fully_connected)
+            self.assertEqual(conn.state, ConnectionState.CONNECTED)
+            await conn.call("box.info")
+
+    async def test__connect_pipelined_invalid_user(self):
+        async with asynctnt.Connection(host=self.tnt.host, port=self.tnt.port) as conn:
+            version = conn.version
+
+        conn = asynctnt.Connection(
+            host=self.tnt.host,
+            port=self.tnt.port,
+            username="fancy",
+            password="man",
+            connect_timeout=1,
+            reconnect_timeout=0,
+            pipelined_handshake=True,
+        )
+        with self.assertRaises(TarantoolDatabaseError) as e:
+            await conn.connect()
+
+        err_code = ErrorCode.ER_PASSWORD_MISMATCH
+        if version < (2, 11):
+            err_code = ErrorCode.ER_NO_SUCH_USER
+        self.assertEqual(e.exception.code, err_code)
+
+    async def test__connect_lazy_schema(self):
+        conn = asynctnt.Connection(
+            host=self.tnt.host,
+            port=self.tnt.port,
+            username="t1",
+            password="t1",
+            reconnect_timeout=0,
+            lazy_schema=True,
+        )
+        self.assertTrue(conn.lazy_schema)
+        async with conn:
+            self.assertTrue(conn.is_fully_connected)
+            self.assertGreater(conn.schema_id, 0)
+            self.assertEqual(conn.schema.spaces, {})
+
+            # concurrent first uses share a single space fetch
+            res = await asyncio.gather(
+                conn.insert(
+                    self.TESTER_SPACE_NAME,
+                    {"f1": 1, "f2": "hello", "f3": 1, "f4": 2},
+                ),
+                conn.select(self.TESTER_SPACE_NAME, index="txt"),
+                conn.select(self.TESTER_SPACE_NAME, index="txt"),
+            )
+            self.assertEqual(res[0][0]["f2"], "hello")
+
+            sp = conn.schema.spaces[self.TESTER_SPACE_NAME]
+            self.assertIs(conn.schema.spaces[self.TESTER_SPACE_ID], sp)
+            self.assertIn("txt", sp.indexes)
+            self.assertNotIn("no_such_space", conn.schema.spaces)
+
+            res = await conn.select(self.TESTER_SPACE_NAME, ["hello"], index="txt")
+            self.assertEqual(res[0]["f1"], 1)
+
+    async def test__connect_lazy_schema_refetch(self):
+        conn = asynctnt.Connection(
+            host=self.tnt.host,
+            port=self.tnt.port,
+            username="t1",
+            password="t1",
+            reconnect_timeout=0,
+            lazy_schema=True,
+        )
+        async with conn:
+            await conn.select(self.TESTER_SPACE_NAME)
+            await conn.eval(
+                "box.schema.create_space('new_space'):create_index('primary')"
+            )
+            try:
+                await conn.refetch_schema()
+                self.assertIn(self.TESTER_SPACE_NAME, conn.schema.spaces)
+                self.assertNotIn("new_space", conn.schema.spaces)
+
+                await conn.select("new_space")
+                self.assertIn("new_space", conn.schema.spaces)
+            finally:
+                await conn.eval(
+                    "local s = box.space.new_space;" "if s ~= nil then s:drop(); end"
+                )
+
+    async def test__connect_lazy_schema_transaction_batch(self):
+        for atomic in (True, False):
+            conn = asynctnt.Connection(
+                host=self.tnt.host,
+                port=self.tnt.port,
+                username="t1",
+                password="t1",
+                reconnect_timeout=0,
+                lazy_schema=True,
+            )
+            async with conn:
+                if not check_version(self, conn.version, min=(2, 10)):
+                    return
+
+                # statements of a space which is not loaded yet are still
+                # sent in order within the transaction
+                tx = conn.stream().transaction_batch()
+                tx.eval("return box.space.tester:count()")
+                tx.replace(self.TESTER_SPACE_NAME, [1, "hello", 1, 4])
+                tx.eval("return box.space.tester:count()")
+                res = await tx.commit(atomic=atomic)
+                self.assertResponseEqual(res[0], [0])
+                self.assertResponseEqual(res[2], [1])
+
+                await conn.delete(self.TESTER_SPACE_NAME, [1])
+
+    async def test__connect_schema_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "schema.snap")
+
+            def connect():
+                return asynctnt.Connection(
+                    host=self.tnt.host,
+                    port=self.tnt.port,
+                    username="t1",
+                    password="t1",
+                    reconnect_timeout=0,
+                    schema_snapshot=path,
+                )
+
+            async with connect() as conn:
+                self.assertEqual(conn.schema_snapshot, path)
+                self.assertEqual(conn.schema_refetches, 1)
+            self.assertTrue(os.path.exists(path))
+
+            async with connect() as conn:
+                # schema has not changed, so it is not fetched
+                self.assertEqual(conn.schema_refetches, 0)
+                self.assertIn(self.TESTER_SPACE_NAME, conn.schema.spaces)
+                res = await conn.insert(
+                    self.TESTER_SPACE_NAME,
+                    {"f1": 1, "f2": "hello", "f3": 1, "f4": 2},
+                )
+                self.assertEqual(res[0]["f2"], "hello")
+
+                # spaces loaded from the snapshot are reused by a refetch
+                tester = conn.schema.spaces[self.TESTER_SPACE_NAME]
+                await conn.refetch_schema()
+                self.assertEqual(conn.schema_refetches, 1)
+                self.assertIs(conn.schema.spaces[self.TESTER_SPACE_NAME], tester)
+
+                await conn.eval(
+                    "box.schema.create_space('new_space'):create_index('primary')"
+                )
+
+            async with connect() as conn:
+                try:
+                    # outdated snapshot is refetched before the connection
+                    # becomes ready
+                    self.assertEqual(conn.schema_refetches, 1)
+                    self.assertIn("new_space", conn.schema.spaces)
+                finally:
+                    await conn.eval(
+                        "local s = box.space.new_space;"
+                        "if s ~= nil then s:drop(); end"
+                    )
+
+    async def test__connect_schema_snapshot_other_user(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "schema.snap")
+            async with asynctnt.Connection(
+                host=self.tnt.host,
+                port=self.tnt.port,
+                username="t1",
+                password="t1",
+                reconnect_timeout=0,
+                schema_snapshot=path,
+            ):
+                pass
+
+            async with asynctnt.Connection(
+                host=self.tnt.host,
+                port=self.tnt.port,
+                reconnect_timeout=0,
+                schema_snapshot=path,
+            ) as conn:
+                self.assertEqual(conn.schema_refetches, 1)
+
+    async def test__connect_shared_schema(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "schema.snap")
+            async with asynctnt.Connection(
+                host=self.tnt.host,
+                port=self.tnt.port,
+                username="t1",
+                password="t1",
+                reconnect_timeout=0,
+                schema_snapshot=path,
+            ):
+                pass
+            mtime = os.stat(path).st_mtime_ns
+
+            async with asynctnt.Connection(
+                host=self.tnt.host,
+                port=self.tnt.port,
+                username="t1",
+                password="t1",
+                reconnect_timeout=0,
+                schema_snapshot=path,
+                shared_schema=True,
+            ) as conn:
+                self.assertTrue(conn.shared_schema)
+                self.assertEqual(conn.schema_refetches, 0)
+                # spaces are attached on first use
+                self.assertNotIn(self.TESTER_SPACE_NAME, conn.schema.spaces)
+
+                res = await conn.insert(
+                    self.TESTER_SPACE_NAME,
+                    {"f1": 1, "f2": "hello", "f3": 1, "f4": 2},
+                )
+                self.assertEqual(res[0]["f2"], "hello")
+                res = await conn.select(self.TESTER_SPACE_NAME, ["hello"], index="txt")
+                self.assertEqual(res[0]["f1"], 1)
+
+                sp = conn.schema.spaces[self.TESTER_SPACE_NAME]
+                self.assertIs(conn.schema.spaces[self.TESTER_SPACE_ID], sp)
+
+            self.assertEqual(os.stat(path).st_mtime_ns, mtime)
+
     async def test__disconnect(self):
         conn = asynctnt.Connection(
             host=self.tnt.host, port=self.tnt.port, reconnect_timeout=0
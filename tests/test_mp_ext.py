@@ -1,4 +1,5 @@
 import datetime
+import enum
 import sys
 import uuid
 from dataclasses import dataclass
@@ -82,6 +83,23 @@ class MpExtDecimalTestCase(BaseTarantoolTestCase):
                 )
                 self.assertEqual(res[0], dec, "matches tarantool decimal")
 
+    @ensure_version(min=(2, 2))
+    async def test__decimal_exponent(self):
+        space = "tester_ext_dec"
+
+        for case in ["0.000", "-0.00", "1.20", "12.3400", "1E+3", "1.2E-7"]:
+            with self.subTest(case):
+                dec = Decimal(case)
+                res = await self.conn.replace(space, [1, dec])
+                self.assertEqual(res[0][1].as_tuple(), dec.as_tuple())
+
+    @ensure_version(min=(2, 2))
+    async def test__decimal_non_finite(self):
+        for case in ["NaN", "-Infinity", "sNaN"]:
+            with self.subTest(case):
+                with self.assertRaises(ValueError):
+                    await self.conn.call("func_param", [Decimal(case)])
+
 
 class MpExtUUIDTestCase(BaseTarantoolTestCase):
     @ensure_version(min=(2, 4, 1))
@@ -133,6 +151,19 @@ class MpExtErrorTestCase(BaseTarantoolTestCase):
             self.assertEqual(0, frame.err_no)
             self.assertEqual(ErrorCode.ER_SPACE_EXISTS, frame.code)
 
+    @ensure_version(min=(2, 4, 1))
+    async def test__ext_error_code_and_trace(self):
+        data = [1, "hello", 1, 4, "what is up"]
+        await self.conn.insert("tester", data)
+        with self.assertRaises(TarantoolDatabaseError) as ctx:
+            await self.conn.insert("tester", data)
+
+        e = ctx.exception
+        self.assertEqual(ErrorCode.ER_TUPLE_FOUND, e.code)
+        trace = e.error.trace
+        self.assertIs(trace, e.error.trace, "trace is decoded once")
+        self.assertEqual(ErrorCode.ER_TUPLE_FOUND, trace[0].code)
+
     @ensure_version(min=(2, 4, 1))
     async def test__ext_error_custom(self):
         try:
@@ -300,6 +331,54 @@ class MpExtDatetimeTestCase(BaseTarantoolTestCase):
         res = resp[0]
         self.assertEqual(dt, res["dt"])
 
+    @ensure_version(min=(2, 10))
+    async def test__ext_datetime_read_without_tz(self):
+        resp = await self.conn.eval(
+            """
+            local date = require('datetime')
+            return date.new{timestamp = 1650680263, nsec = 450000700},
+                   date.new{timestamp = -1262304000, nsec = 999999501}
+        """
+        )
+        dt = datetime.datetime.fromtimestamp(1650680263)
+        self.assertEqual(dt.replace(microsecond=450001), resp[0])
+        self.assertIsNone(resp[0].tzinfo)
+        dt = datetime.datetime.fromtimestamp(-1262303999)
+        self.assertEqual(dt, resp[1])
+
+    @ensure_version(min=(2, 10))
+    async def test__ext_datetime_read_same_tz(self):
+        resp = await self.conn.eval(
+            """
+            local date = require('datetime')
+            return date.parse('2000-01-01T02:00:00+0300'),
+                   date.parse('2001-02-03T04:05:06.000007+0300')
+        """
+        )
+        self.assertEqual(datetime_fromisoformat("2000-01-01T02:00:00+03:00"), resp[0])
+        self.assertEqual(
+            datetime_fromisoformat("2001-02-03T04:05:06.000007+03:00"), resp[1]
+        )
+        self.assertIs(resp[0].tzinfo, resp[1].tzinfo)
+
+    @ensure_version(min=(2, 10))
+    async def test__ext_datetime_read_as_ns(self):
+        await self.tnt_reconnect(datetime_as_ns=True)
+        resp = await self.conn.eval(
+            """
+            local date = require('datetime')
+            return date.parse('2000-01-01T02:00:00.23+0300'),
+                   date.parse('1930-01-01T02:17:43.23-08:00')
+        """
+        )
+        epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+        us = datetime.timedelta(microseconds=1)
+
+        dt = datetime_fromisoformat("2000-01-01T02:00:00.230000+03:00")
+        self.assertEqual((dt - epoch) // us * 1000, resp[0])
+        dt = datetime_fromisoformat("1930-01-01T02:17:43.230000-08:00")
+        self.assertEqual((dt - epoch) // us * 1000, resp[1])
+
 
 class MpExtIntervalTestCase(BaseTarantoolTestCase):
     @ensure_version(min=(2, 10))
@@ -566,6 +645,71 @@ class MpExtIntervalTestCase(BaseTarantoolTestCase):
         self.assertTrue(resp[0])
 
 
+class Color(enum.Enum):
+    RED = 1
+    GREEN = 2
+
+
+class TaggedUUID:
+    def __init__(self, value: uuid.UUID):
+        self.value = value
+
+    def __eq__(self, other):
+        return isinstance(other, TaggedUUID) and other.value == self.value
+
+
+class MpExtRegistryTestCase(BaseTarantoolTestCase):
+    def tearDown(self):
+        asynctnt.unregister_type_encoder(Color)
+        asynctnt.unregister_ext_type(2)
+        super().tearDown()
+
+    async def test__type_encoder(self):
+        asynctnt.register_type_encoder(Color, lambda c: c.value)
+        resp = await self.conn.call("func_param", [Color.GREEN])
+        self.assertEqual(resp[0], [2])
+
+    async def test__type_encoder_unregistered(self):
+        asynctnt.register_type_encoder(Color, lambda c: c.value)
+        asynctnt.unregister_type_encoder(Color)
+        with self.assertRaises(TypeError):
+            await self.conn.call("func_param", [Color.GREEN])
+
+    async def test__type_encoder_same_type(self):
+        asynctnt.register_type_encoder(Color, lambda c: c)
+        with self.assertRaises(TypeError):
+            await self.conn.call("func_param", [Color.GREEN])
+
+    @ensure_version(min=(2, 4, 1))
+    async def test__ext_type(self):
+        # MP_UUID payload is 16 raw bytes
+        asynctnt.register_ext_type(
+            2,
+            py_type=TaggedUUID,
+            encoder=lambda t: t.value.bytes,
+            decoder=lambda data: TaggedUUID(uuid.UUID(bytes=data)),
+        )
+        val = uuid.uuid4()
+        resp = await self.conn.eval(
+            """
+            local args = {...}
+            local uuid = require('uuid')
+            return uuid.is_uuid(args[1]), args[1]
+        """,
+            [TaggedUUID(val)],
+        )
+        self.assertTrue(resp[0])
+        self.assertEqual(resp[1], TaggedUUID(val))
+
+    async def test__ext_type_invalid(self):
+        with self.assertRaises(ValueError):
+            asynctnt.register_ext_type(200, decoder=bytes)
+        with self.assertRaises(ValueError):
+            asynctnt.register_ext_type(2, py_type=TaggedUUID)
+        with self.assertRaises(ValueError):
+            asynctnt.register_ext_type(2)
+
+
 def datetime_fromisoformat(s):
     if sys.version_info < (3, 7, 0):
         return dateutil.parser.isoparse(s)
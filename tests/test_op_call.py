@@ -1,6 +1,7 @@
 import asyncio
 
 from asynctnt import Response
+from asynctnt.batch import BatchResponse
 from asynctnt.exceptions import ErrorCode, TarantoolDatabaseError
 from tests import BaseTarantoolTestCase
 from tests.util import get_complex_param
@@ -112,6 +113,88 @@ class CallTestCase(BaseTarantoolTestCase):
         self.assertEqual(e.exception.code, 0, "code by box.error{} is 0")
         self.assertEqual(e.exception.message, "my reason", "Reason ok")
 
+    async def test__call_template(self):
+        tpl = self.conn.template("func_param")
+        self.assertEqual(tpl.func_name, "func_param")
+
+        for param in ["myparam", 42]:
+            res = await tpl([param])
+            self.assertIsInstance(res, Response, "Got call response")
+            self.assertGreater(res.sync, 0, "sync > 0")
+            self.assertResponseEqual(res, [[param]], "Body ok")
+
+    async def test__call_template_complex_param(self):
+        p, cmp = get_complex_param(
+            encoding=self.conn.encoding, replace_bin=self.conn.version < (3, 0)
+        )
+        tpl = self.conn.template("func_param")
+        res = await tpl([p])
+        self.assertDictEqual(res[0][0], cmp, "Body ok")
+
+    async def test__call_template_args_tuple(self):
+        tpl = self.conn.template("func_param")
+        res = await tpl.call(("myparam",))
+        self.assertResponseEqual(res, [["myparam"]], "Body ok")
+
+    async def test__call_template_no_args(self):
+        tpl = self.conn.template("func_hello")
+        res = await tpl()
+        self.assertResponseEqual(res, [["hello"]], "Body ok")
+
+    async def test__call_template_call16(self):
+        tpl = self.conn.template("func_param_bare", call16=True)
+        res = await tpl(["myparam"])
+        self.assertResponseEqual(res, [["myparam"]], "Body ok")
+
+    async def test__call_template_unknown_function(self):
+        tpl = self.conn.template("blablabla")
+        with self.assertRaises(TarantoolDatabaseError) as ctx:
+            await tpl()
+        self.assertEqual(ctx.exception.code, ErrorCode.ER_NO_SUCH_PROC)
+
+    async def test__call_template_timeout_late(self):
+        tpl = self.conn.template("func_long")
+        with self.assertRaises(asyncio.TimeoutError):
+            await tpl([0.3], timeout=0.1)
+
+    async def test__call_many(self):
+        res = await self.conn.call_many("func_param", [["a"], [1], ("b",)])
+        self.assertIsInstance(res, BatchResponse, "Got batch response")
+        self.assertEqual(3, len(res))
+        self.assertEqual([], res.errors)
+        for resp, param in zip(res, ["a", 1, "b"]):
+            self.assertIsInstance(resp, Response, "Got call response")
+            self.assertResponseEqual(resp, [[param]], "Body ok")
+
+    async def test__call_many_empty(self):
+        res = await self.conn.call_many("func_param", [])
+        self.assertEqual(0, len(res))
+
+    async def test__call_batch(self):
+        res = await self.conn.call_batch(
+            [
+                ("func_param", ["myparam"]),
+                ("blablabla", []),
+                ("func_hello", None),
+                ("raise", None),
+            ]
+        )
+        self.assertEqual(4, len(res))
+        self.assertResponseEqual(res[0], [["myparam"]], "Body ok")
+        self.assertResponseEqual(res[2], [["hello"]], "Body ok")
+
+        self.assertEqual([1, 3], [i for i, _ in res.errors])
+        self.assertIsInstance(res[1], TarantoolDatabaseError)
+        self.assertEqual(res[1].code, ErrorCode.ER_NO_SUCH_PROC)
+        self.assertIsInstance(res[3], TarantoolDatabaseError)
+        self.assertEqual(res[3].message, "my reason")
+
+    async def test__call_many_timeout_late(self):
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.conn.call_batch(
+                [("func_hello", None), ("func_long", [0.3])], timeout=0.1
+            )
+
 
 class Call16TestCase(BaseTarantoolTestCase):
     async def test__call16_basic(self):
@@ -1,6 +1,7 @@
 from asynctnt import Response
 from asynctnt.exceptions import TarantoolSchemaError
 from tests import BaseTarantoolTestCase
+from tests._testbase import ensure_version
 
 
 class DeleteTestCase(BaseTarantoolTestCase):
@@ -96,18 +97,31 @@ class DeleteTestCase(BaseTarantoolTestCase):
                 )
             )
 
+    @ensure_version(max=(3, 0))
     async def test__delete_by_name_no_schema(self):
         await self.tnt_reconnect(fetch_schema=False)
 
         with self.assertRaises(TarantoolSchemaError):
             await self.conn.delete(self.TESTER_SPACE_NAME, [0])
 
+    @ensure_version(max=(3, 0))
     async def test__delete_by_index_name_no_schema(self):
         await self.tnt_reconnect(fetch_schema=False)
 
         with self.assertRaises(TarantoolSchemaError):
             await self.conn.delete(self.TESTER_SPACE_ID, [0], index="primary")
 
+    @ensure_version(min=(3, 0))
+    async def test__delete_by_index_name_no_schema_space_names(self):
+        data = await self._fill_data()
+        await self.tnt_reconnect(fetch_schema=False)
+
+        res = await self.conn.delete(self.TESTER_SPACE_NAME, [0], index="primary")
+        self.assertResponseEqual(res, [data[0]], "Body ok")
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME)
+        self.assertResponseEqual(res, [data[1]], "Body ok")
+
     async def test__delete_invalid_types(self):
         with self.assertRaisesRegex(
             TypeError, "missing 2 required positional arguments: 'space' and 'key'"
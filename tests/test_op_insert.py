@@ -1,6 +1,12 @@
 from asynctnt import Response
-from asynctnt.exceptions import TarantoolSchemaError
+from asynctnt.batch import BatchResponse
+from asynctnt.exceptions import (
+    ErrorCode,
+    TarantoolDatabaseError,
+    TarantoolSchemaError,
+)
 from tests import BaseTarantoolTestCase
+from tests._testbase import ensure_version
 from tests.util import get_complex_param
 
 
@@ -23,6 +29,7 @@ class InsertTestCase(BaseTarantoolTestCase):
         self.assertGreater(res.sync, 0, "sync > 0")
         self.assertResponseEqual(res, [data], "Body ok")
 
+    @ensure_version(max=(3, 0))
     async def test__insert_by_name_no_schema(self):
         await self.tnt_reconnect(fetch_schema=False)
 
@@ -30,6 +37,14 @@ class InsertTestCase(BaseTarantoolTestCase):
         with self.assertRaises(TarantoolSchemaError):
             await self.conn.insert(self.TESTER_SPACE_NAME, data)
 
+    @ensure_version(min=(3, 0))
+    async def test__insert_by_name_no_schema_space_names(self):
+        await self.tnt_reconnect(fetch_schema=False)
+
+        data = [1, "hello", 1, 4, "what is up"]
+        res = await self.conn.insert(self.TESTER_SPACE_NAME, data)
+        self.assertResponseEqual(res, [data], "Body ok")
+
     async def test__insert_complex_tuple(self):
         p, p_cmp = get_complex_param(replace_bin=False)
         data = [1, "hello", 1, 2, p]
@@ -121,6 +136,64 @@ class InsertTestCase(BaseTarantoolTestCase):
         with self.assertRaises(KeyError):
             res[0][""]
 
+    async def test__insert_many(self):
+        data = [[i, str(i), i, i * 2, "txt"] for i in range(25)]
+        res = await self.conn.insert_many(
+            self.TESTER_SPACE_NAME, iter(data), chunk_size=10, max_in_flight=2
+        )
+
+        self.assertIsInstance(res, BatchResponse, "Got batch response")
+        self.assertEqual(25, len(res), "responses count ok")
+        self.assertEqual(25, res.rowcount, "rowcount ok")
+        self.assertEqual([], res.errors, "no errors")
+        for i, resp in enumerate(res):
+            self.assertResponseEqual(resp, [data[i]], "Body ok")
+
+        res = await self.conn.select(self.TESTER_SPACE_ID)
+        self.assertResponseEqual(res, data, "Body ok")
+
+    async def test__insert_many_replace(self):
+        await self.conn.insert(self.TESTER_SPACE_ID, [1, "one", 1, 1, "txt"])
+
+        data = [[1, "two", 1, 1, "txt"], [2, "two", 2, 2, "txt"]]
+        res = await self.conn.insert_many(self.TESTER_SPACE_ID, data, replace=True)
+        self.assertEqual(2, res.rowcount, "rowcount ok")
+
+        res = await self.conn.select(self.TESTER_SPACE_ID)
+        self.assertResponseEqual(res, data, "Body ok")
+
+    async def test__insert_many_error(self):
+        await self.conn.insert(self.TESTER_SPACE_ID, [1, "one", 1, 1, "txt"])
+
+        data = [[1, "one", 1, 1, "txt"], [2, "two", 2, 2, "txt"]]
+        with self.assertRaises(TarantoolDatabaseError) as e:
+            await self.conn.insert_many(self.TESTER_SPACE_ID, data)
+        self.assertEqual(ErrorCode.ER_TUPLE_FOUND, e.exception.code)
+
+        data = [[3, "three", 3, 3, "txt"], [1, "one", 1, 1, "txt"]]
+        res = await self.conn.insert_many(
+            self.TESTER_SPACE_ID, data, return_exceptions=True
+        )
+        self.assertEqual(1, res.rowcount, "rowcount ok")
+        self.assertEqual(1, len(res.errors), "errors count ok")
+        idx, err = res.errors[0]
+        self.assertEqual(1, idx, "failed tuple index ok")
+        self.assertIsInstance(err, TarantoolDatabaseError)
+        self.assertEqual(ErrorCode.ER_TUPLE_FOUND, err.code)
+
+    async def test__insert_many_encode_error(self):
+        data = [[1, "one", 1, 1, "txt"], [2, object()]]
+        with self.assertRaises(TypeError):
+            await self.conn.insert_many(self.TESTER_SPACE_ID, data)
+
+        # nothing is sent if any of the tuples fails to encode
+        res = await self.conn.select(self.TESTER_SPACE_ID)
+        self.assertResponseEqual(res, [])
+
+    async def test__insert_many_bad_chunk_size(self):
+        with self.assertRaises(ValueError):
+            await self.conn.insert_many(self.TESTER_SPACE_ID, [], chunk_size=0)
+
     async def test__insert_dict_resp(self):
         data = [0, "hello", 0, 5, "wow"]
         res = await self.conn.insert(self.TESTER_SPACE_ID, data)
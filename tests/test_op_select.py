@@ -1,11 +1,21 @@
 import logging
+from typing import Any, NamedTuple
 
-from asynctnt import Iterator, Response
+from asynctnt import Iterator, Response, TarantoolTuple
 from asynctnt.exceptions import TarantoolSchemaError
 from tests import BaseTarantoolTestCase
+from tests._testbase import ensure_version
 from tests.util import get_complex_param
 
 
+class TesterRecord(NamedTuple):
+    f1: int
+    f2: str
+    f3: int
+    f4: int
+    f5: Any
+
+
 class SelectTestCase(BaseTarantoolTestCase):
     LOGGING_LEVEL = logging.INFO
 
@@ -96,6 +106,7 @@ class SelectTestCase(BaseTarantoolTestCase):
         except Exception as e:
             self.fail(e)
 
+    @ensure_version(max=(3, 0))
     async def test__select_by_name_no_schema(self):
         await self.tnt_reconnect(fetch_schema=False)
 
@@ -110,12 +121,33 @@ class SelectTestCase(BaseTarantoolTestCase):
         except Exception as e:
             self.fail(e)
 
+    @ensure_version(max=(3, 0))
     async def test__select_by_index_name_no_schema(self):
         await self.tnt_reconnect(fetch_schema=False)
 
         with self.assertRaises(TarantoolSchemaError):
             await self.conn.select(self.TESTER_SPACE_NAME, index="txt")
 
+    @ensure_version(min=(3, 0))
+    async def test__select_by_name_no_schema_space_names(self):
+        data = await self._fill_data()
+        await self.tnt_reconnect(fetch_schema=False)
+        self.assertTrue(self.conn.features.space_and_index_names)
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME)
+        self.assertResponseEqual(res, data, "Body ok")
+
+    @ensure_version(min=(3, 0))
+    async def test__select_by_index_name_no_schema_space_names(self):
+        data = await self._fill_data()
+        await self.tnt_reconnect(fetch_schema=False)
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME, ["1"], index="txt")
+        self.assertResponseEqual(res, [data[1]], "Body ok")
+
+        res = await self.conn.select(self.TESTER_SPACE_ID, ["2"], index="txt")
+        self.assertResponseEqual(res, [data[2]], "Body ok")
+
     async def test__select_by_key_one_item(self):
         data = await self._fill_data()
 
@@ -132,6 +164,37 @@ class SelectTestCase(BaseTarantoolTestCase):
         res = await self.conn.select(self.TESTER_SPACE_NAME, [next_txt], index="txt")
         self.assertResponseEqual(res, data[len(data) - 2 :], "Body ok")
 
+    async def test__select_many(self):
+        data = await self._fill_data(5)
+
+        res = await self.conn.select_many(self.TESTER_SPACE_NAME, [3, [1], (4,), 100])
+        self.assertEqual(4, len(res))
+        self.assertIsInstance(res[0], TarantoolTuple)
+        self.assertEqual(data[3], list(res[0]))
+        self.assertEqual(data[1], list(res[1]))
+        self.assertEqual(data[4], list(res[2]))
+        self.assertIsNone(res[3])
+
+    async def test__select_many_index(self):
+        data = await self._fill_data()
+
+        res = await self.conn.select_many(
+            self.TESTER_SPACE_ID, iter(["2", ["0"], "not found"]), index="txt"
+        )
+        self.assertEqual([data[2], data[0], None], [t and list(t) for t in res])
+
+    async def test__select_many_dict_key(self):
+        data = await self._fill_data(3)
+
+        res = await self.conn.select_many(
+            self.TESTER_SPACE_NAME, [{"f1": 2}, {"f1": 100}]
+        )
+        self.assertEqual([data[2], None], [t and list(t) for t in res])
+
+    async def test__select_many_empty(self):
+        res = await self.conn.select_many(self.TESTER_SPACE_ID, [])
+        self.assertEqual([], res)
+
     async def test__select_limit(self):
         data = await self._fill_data()
 
@@ -246,3 +309,26 @@ class SelectTestCase(BaseTarantoolTestCase):
         data = await self._fill_data_dict()
         res = await self.conn.select(self.TESTER_SPACE_ID, [])
         self.assertResponseEqualKV(res, data)
+
+    async def test__select_registered_record(self):
+        data = await self._fill_data()
+        self.conn.register_record(self.TESTER_SPACE_NAME, TesterRecord)
+        try:
+            res = await self.conn.select(self.TESTER_SPACE_ID)
+            for item in res:
+                self.assertIsInstance(item, TesterRecord)
+            self.assertListEqual([list(t) for t in res], data, "Body ok")
+
+            res = await self.conn.insert(self.TESTER_SPACE_ID, [10, "10", 1, 2, "a"])
+            self.assertEqual(res[0], TesterRecord(10, "10", 1, 2, "a"))
+        finally:
+            self.conn.unregister_record(self.TESTER_SPACE_NAME)
+
+        res = await self.conn.select(self.TESTER_SPACE_ID, [0])
+        self.assertIsInstance(res[0], TarantoolTuple)
+
+    async def test__select_registered_record_invalid(self):
+        with self.assertRaises(TypeError):
+            self.conn.register_record(self.TESTER_SPACE_ID, "not a class")
+        with self.assertRaises(TypeError):
+            self.conn.register_record([self.TESTER_SPACE_ID], TesterRecord)
@@ -1,5 +1,7 @@
 import asynctnt
 from asynctnt import Response
+from asynctnt.batch import BatchResponse
+from asynctnt.exceptions import ErrorCode, TarantoolDatabaseError
 from tests import BaseTarantoolTestCase
 from tests._testbase import ensure_version
 
@@ -134,6 +136,55 @@ class SQLExecuteTestCase(BaseTarantoolTestCase):
         )
         self.assertEqual(2, res.rowcount, "rowcount ok")
 
+    @ensure_version(min=(2, 0))
+    async def test__sql_executemany(self):
+        res = await self.conn.executemany(
+            "insert into sql_space (id, name) values (?, ?)",
+            [[1, "one"], [2, "two"], [3, "three"]],
+        )
+        self.assertIsInstance(res, BatchResponse, "Got batch response")
+        self.assertEqual(3, len(res), "responses count ok")
+        self.assertEqual(3, res.rowcount, "rowcount ok")
+        self.assertIsNone(res.autoincrement_ids, "autoincrement ok")
+
+        res = await self.conn.execute("select * from sql_space order by id")
+        self.assertResponseEqual(res, [[1, "one"], [2, "two"], [3, "three"]])
+
+    @ensure_version(min=(2, 0))
+    async def test__sql_executemany_autoincrement(self):
+        res = await self.conn.executemany(
+            "insert into sql_space_autoincrement (name) values (?)",
+            (["name{}".format(i)] for i in range(3)),
+        )
+        self.assertEqual(3, res.rowcount, "rowcount ok")
+        self.assertEqual([1, 2, 3], res.autoincrement_ids, "autoincrement ok")
+
+    @ensure_version(min=(2, 0))
+    async def test__sql_executemany_error(self):
+        for fail_fast in (False, True):
+            with self.assertRaises(TarantoolDatabaseError) as e:
+                await self.conn.executemany(
+                    "insert into sql_space (id, name) values (?, ?)",
+                    [[1, "one"], [1, "one"], [2, "two"]],
+                    fail_fast=fail_fast,
+                )
+            self.assertEqual(ErrorCode.ER_TUPLE_FOUND, e.exception.code)
+
+        res = await self.conn.execute("select * from sql_space order by id")
+        self.assertResponseEqual(res, [[1, "one"], [2, "two"]])
+
+    @ensure_version(min=(2, 0))
+    async def test__sql_executemany_encode_error(self):
+        with self.assertRaises(TypeError):
+            await self.conn.executemany(
+                "insert into sql_space (id, name) values (?, ?)",
+                [[1, "one"], [2, object()]],
+            )
+
+        # nothing is sent if any of the rows fails to encode
+        res = await self.conn.execute("select * from sql_space")
+        self.assertResponseEqual(res, [])
+
     @ensure_version(min=(2, 0))
     async def test__sql_update(self):
         await self.conn.execute("insert into sql_space values (1, 'one')")
@@ -198,6 +249,17 @@ class SQLExecuteTestCase(BaseTarantoolTestCase):
         self.assertEqual("COLUMN_2", res.metadata.fields[1].name)
         self.assertEqual("integer", res.metadata.fields[1].type)
 
+    @ensure_version(min=(2, 0))
+    async def test__metadata_shared(self):
+        res1 = await self.conn.execute("select 1, 2")
+        res2 = await self.conn.execute("select 3, 4")
+        self.assertIs(res1.metadata, res2.metadata, "metadata is shared")
+        self.assertResponseEqual(res1, [[1, 2]], "Body ok")
+        self.assertResponseEqual(res2, [[3, 4]], "Body ok")
+
+        res3 = await self.conn.execute("select 1 as a, 2 as b")
+        self.assertIsNot(res1.metadata, res3.metadata, "different metadata")
+
     @ensure_version(min=(2, 0))
     async def test__metadata_names(self):
         await self._compat(self.conn)
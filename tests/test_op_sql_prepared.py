@@ -1,3 +1,4 @@
+import asynctnt
 from asynctnt import Response
 from asynctnt.prepared import PreparedStatement
 from tests import BaseTarantoolTestCase
@@ -95,3 +96,88 @@ class SQLPreparedStatementTestCase(BaseTarantoolTestCase):
             async with stmt:  # does nothing
                 res = await stmt.execute([1, 2])
                 self.assertResponseEqual(res, [[1, 2]], "Body ok")
+
+    @ensure_version(min=(2, 0))
+    async def test__executemany(self):
+        stmt = self.conn.prepare("select 1, 2 where 1 = ? and 2 = ?")
+        async with stmt:
+            res = await stmt.executemany([[1, 2], [3, 4], [1, 2]])
+            self.assertEqual(3, len(res), "responses count ok")
+            self.assertResponseEqual(res[0], [[1, 2]], "Body ok")
+            self.assertResponseEqual(res[1], [], "Body is empty")
+            self.assertResponseEqual(res[2], [[1, 2]], "Body ok")
+
+
+class SQLStatementCacheTestCase(BaseTarantoolTestCase):
+    @ensure_version(min=(2, 0))
+    async def test__cache_disabled_by_default(self):
+        self.assertEqual(self.conn.statement_cache_size, 0)
+        self.assertIsNone(self.conn._stmt_cache)
+
+    async def test__cache_size_negative(self):
+        with self.assertRaises(ValueError):
+            asynctnt.Connection(statement_cache_size=-1)
+
+    @ensure_version(min=(2, 0))
+    async def test__cache_execute(self):
+        await self.tnt_reconnect(statement_cache_size=2)
+        self.assertEqual(self.conn.statement_cache_size, 2)
+
+        query = "select 1, 2 where 1 = ? and 2 = ?"
+        res = await self.conn.execute(query, [1, 2])
+        self.assertResponseEqual(res, [[1, 2]], "Body ok")
+        self.assertIn(query, self.conn._stmt_cache)
+
+        res = await self.conn.execute(query, [3, 4])
+        self.assertResponseEqual(res, [], "Body is empty")
+        self.assertEqual(len(self.conn._stmt_cache), 1)
+
+    @ensure_version(min=(2, 0))
+    async def test__cache_eviction(self):
+        await self.tnt_reconnect(statement_cache_size=2)
+        for i in range(3):
+            res = await self.conn.execute("select {}".format(i))
+            self.assertResponseEqual(res, [[i]], "Body ok")
+
+        self.assertEqual(len(self.conn._stmt_cache), 2)
+        self.assertNotIn("select 0", self.conn._stmt_cache)
+
+        res = await self.conn.execute("select 0")
+        self.assertResponseEqual(res, [[0]], "Body ok")
+
+    @ensure_version(min=(2, 0))
+    async def test__cache_unprepared_statement(self):
+        await self.tnt_reconnect(statement_cache_size=2)
+        res = await self.conn.execute("select 1, 2")
+        res = await self.conn.prepare_iproto("select 1, 2")
+        await self.conn.unprepare_iproto(res.stmt_id)
+
+        res = await self.conn.execute("select 1, 2")
+        self.assertResponseEqual(res, [[1, 2]], "Body ok")
+
+    @ensure_version(min=(2, 0))
+    async def test__cache_executemany_unprepared_statement(self):
+        await self.tnt_reconnect(statement_cache_size=2)
+        query = "select ?"
+        res = await self.conn.executemany(query, [[1], [2]])
+        self.assertEqual(2, len(res), "responses count ok")
+
+        res = await self.conn.prepare_iproto(query)
+        await self.conn.unprepare_iproto(res.stmt_id)
+
+        res = await self.conn.executemany(query, [[3], [4]])
+        self.assertResponseEqual(res[0], [[3]], "Body ok")
+        self.assertResponseEqual(res[1], [[4]], "Body ok")
+
+    @ensure_version(min=(2, 0))
+    async def test__cache_cleared_on_reconnect(self):
+        await self.tnt_reconnect(statement_cache_size=2)
+        await self.conn.execute("select 1, 2")
+        self.assertEqual(len(self.conn._stmt_cache), 1)
+
+        await self.conn.disconnect()
+        await self.conn.connect()
+        self.assertEqual(len(self.conn._stmt_cache), 0)
+
+        res = await self.conn.execute("select 1, 2")
+        self.assertResponseEqual(res, [[1, 2]], "Body ok")
@@ -1,6 +1,7 @@
 from decimal import Decimal
 
-from asynctnt import Response
+from asynctnt import Param, Response
+from asynctnt.diff import diff_update_ops
 from asynctnt.exceptions import ErrorCode, TarantoolDatabaseError, TarantoolSchemaError
 from tests import BaseTarantoolTestCase
 from tests._testbase import ensure_version
@@ -311,6 +312,7 @@ class UpdateTestCase(BaseTarantoolTestCase):
         self.assertGreater(res.sync, 0, "sync > 0")
         self.assertResponseEqual(res, [data[1]], "Body ok")
 
+    @ensure_version(max=(3, 0))
     async def test__update_by_name_no_schema(self):
         await self._fill_data()
 
@@ -377,6 +379,7 @@ class UpdateTestCase(BaseTarantoolTestCase):
         except Exception as e:
             self.fail(e)
 
+    @ensure_version(max=(3, 0))
     async def test__update_by_index_name_no_schema(self):
         await self.tnt_reconnect(fetch_schema=False)
 
@@ -385,6 +388,17 @@ class UpdateTestCase(BaseTarantoolTestCase):
                 self.TESTER_SPACE_NAME, [0], [["=", 2, 1]], index="primary"
             )
 
+    @ensure_version(min=(3, 0))
+    async def test__update_by_index_name_no_schema_space_names(self):
+        data = await self._fill_data()
+        await self.tnt_reconnect(fetch_schema=False)
+
+        res = await self.conn.update(
+            self.TESTER_SPACE_NAME, [0], [["=", 2, 100]], index="primary"
+        )
+        data[0][2] = 100
+        self.assertResponseEqual(res, [data[0]], "Body ok")
+
     async def test__update_operations_none(self):
         data = await self._fill_data()
         try:
@@ -422,3 +436,161 @@ class UpdateTestCase(BaseTarantoolTestCase):
                 }
             ],
         )
+
+
+class UpdateTemplateTestCase(BaseTarantoolTestCase):
+    async def _fill_data(self):
+        data = [
+            [0, "a", 1, 5, "data1"],
+            [1, "b", 8, 6, "data2"],
+        ]
+        for t in data:
+            await self.conn.insert(self.TESTER_SPACE_ID, t)
+
+        return data
+
+    async def test__update_template(self):
+        data = await self._fill_data()
+
+        tmpl = self.conn.compile_update(
+            self.TESTER_SPACE_NAME, [("+", "f3", Param), ("=", 4, Param)]
+        )
+        self.assertEqual(2, tmpl.params_count)
+
+        for i in range(2):
+            res = await tmpl([i], [10, "new"])
+            self.assertIsInstance(res, Response, "Got response")
+            data[i][2] += 10
+            data[i][4] = "new"
+            self.assertResponseEqual(res, [data[i]], "Body ok")
+
+        res = await tmpl.update([0], (1, "newer"))
+        data[0][2] += 1
+        data[0][4] = "newer"
+        self.assertResponseEqual(res, [data[0]], "Body ok")
+
+    async def test__update_template_static_args(self):
+        data = await self._fill_data()
+
+        tmpl = self.conn.compile_update(
+            self.TESTER_SPACE_NAME, [("+", 2, 1), (":", "f5", 0, 4, Param)]
+        )
+        self.assertEqual(1, tmpl.params_count)
+
+        res = await tmpl([1], ["DATA"])
+        data[1][2] += 1
+        data[1][4] = "DATA2"
+        self.assertResponseEqual(res, [data[1]], "Body ok")
+
+    async def test__update_template_by_index(self):
+        data = await self._fill_data()
+
+        tmpl = self.conn.compile_update(
+            self.TESTER_SPACE_NAME, [("=", "f4", Param)], index="primary"
+        )
+        res = await tmpl([0], [7])
+        data[0][3] = 7
+        self.assertResponseEqual(res, [data[0]], "Body ok")
+
+    async def test__update_template_no_params(self):
+        data = await self._fill_data()
+
+        tmpl = self.conn.compile_update(self.TESTER_SPACE_NAME, [("+", 2, 1)])
+        self.assertEqual(0, tmpl.params_count)
+
+        res = await tmpl([0])
+        data[0][2] += 1
+        self.assertResponseEqual(res, [data[0]], "Body ok")
+
+    async def test__update_template_negative_field_no(self):
+        data = await self._fill_data()
+
+        ops = [["=", -1, Param]]
+        tmpl = self.conn.compile_update(self.TESTER_SPACE_NAME, ops)
+        ops[0][1] = 2
+        ops.append(("+", 2, 1))
+
+        res = await tmpl([0], ["new"])
+        data[0][4] = "new"
+        self.assertResponseEqual(res, [data[0]], "Body ok")
+
+    async def test__update_template_params_count_mismatch(self):
+        tmpl = self.conn.compile_update(
+            self.TESTER_SPACE_NAME, [("+", 2, Param), ("=", 3, Param)]
+        )
+
+        with self.assertRaises(ValueError):
+            await tmpl([0], [1])
+
+        with self.assertRaises(TypeError):
+            await tmpl([0])
+
+    async def test__update_template_invalid_operations(self):
+        with self.assertRaises(TypeError):
+            self.conn.compile_update(self.TESTER_SPACE_NAME, [("^^", 2, Param)])
+
+        with self.assertRaises(IndexError):
+            self.conn.compile_update(self.TESTER_SPACE_NAME, [("+", 2)])
+
+        with self.assertRaises(ValueError):
+            self.conn.compile_update(self.TESTER_SPACE_NAME, [(":", 2, 1, Param)])
+
+        with self.assertRaises(TypeError):
+            self.conn.compile_update(self.TESTER_SPACE_NAME, [("=", 2.5, Param)])
+
+
+class ReplaceDiffTestCase(BaseTarantoolTestCase):
+    async def test__diff_update_ops(self):
+        old = [1, "a" * 100, "b", {"x": [1]}, 5]
+        self.assertEqual(
+            [["=", 2, "c"], ["!", 5, 6]],
+            diff_update_ops(old, [1, "a" * 100, "c", {"x": [1]}, 5, 6]),
+        )
+        self.assertEqual(
+            [["#", 2, 1]], diff_update_ops(old, [1, "a" * 100, {"x": [1]}, 5])
+        )
+        self.assertEqual(
+            [["!", 1, "new"]],
+            diff_update_ops(old, [1, "new", "a" * 100, "b", {"x": [1]}, 5]),
+        )
+        self.assertEqual([["=", 4, 5.0]], diff_update_ops(old, old[:4] + [5.0]))
+        self.assertEqual([], diff_update_ops(old, list(old)))
+        self.assertIsNone(diff_update_ops(old, [2] + old[1:]))
+
+    async def test__replace_diff_update(self):
+        data = [1, "a" * 1000, 1, 4, "what is up"]
+        await self.conn.insert(self.TESTER_SPACE_NAME, data)
+        old = (await self.conn.select(self.TESTER_SPACE_NAME, [1]))[0]
+
+        new = [1, "a" * 1000, 2, 4, "what is up", "extra"]
+        res = await self.conn.replace_diff(self.TESTER_SPACE_NAME, old, new)
+        self.assertResponseEqual(res, [new], "Body ok")
+
+        new = [1, "a" * 1000, 2, 4]
+        res = await self.conn.replace_diff(self.TESTER_SPACE_NAME, res[0], new)
+        self.assertResponseEqual(res, [new], "Body ok")
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME, [1])
+        self.assertResponseEqual(res, [new], "Body ok")
+
+    async def test__replace_diff_replace(self):
+        data = [1, "hello", 1, 4, "what is up"]
+        await self.conn.insert(self.TESTER_SPACE_NAME, data)
+
+        # replace is smaller
+        new = [1, "hi", 2, 5, "what"]
+        res = await self.conn.replace_diff(self.TESTER_SPACE_NAME, data, new)
+        self.assertResponseEqual(res, [new], "Body ok")
+
+        # primary key changed
+        new = [2, "hi", 2, 5, "what"]
+        res = await self.conn.replace_diff(self.TESTER_SPACE_NAME, data, new)
+        self.assertResponseEqual(res, [new], "Body ok")
+
+        # no old tuple
+        new = [3, "hi", 2, 5, "what"]
+        res = await self.conn.replace_diff(self.TESTER_SPACE_NAME, None, new)
+        self.assertResponseEqual(res, [new], "Body ok")
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME)
+        self.assertEqual(3, len(res))
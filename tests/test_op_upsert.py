@@ -1,6 +1,14 @@
+import asyncio
+import gc
+
 from asynctnt import Response
-from asynctnt.exceptions import TarantoolSchemaError
+from asynctnt.exceptions import (
+    TarantoolDatabaseError,
+    TarantoolError,
+    TarantoolSchemaError,
+)
 from tests import BaseTarantoolTestCase
+from tests._testbase import ensure_version
 
 
 class UpsertTestCase(BaseTarantoolTestCase):
@@ -51,6 +59,7 @@ class UpsertTestCase(BaseTarantoolTestCase):
         self.assertGreater(res.sync, 0, "sync > 0")
         self.assertResponseEqual(res, [data], "Body ok")
 
+    @ensure_version(max=(3, 0))
     async def test__upsert_by_name_no_schema(self):
         await self.tnt_reconnect(fetch_schema=False)
 
@@ -85,3 +94,93 @@ class UpsertTestCase(BaseTarantoolTestCase):
 
         res = await self.conn.upsert(self.TESTER_SPACE_ID, data, [["=", 2, 2]])
         self.assertResponseEqual(res, [], "Body ok")
+
+
+class UpsertCombinerTestCase(BaseTarantoolTestCase):
+    async def test__combine_same_key(self):
+        combiner = self.conn.upsert_combiner(self.TESTER_SPACE_NAME)
+        futures = [
+            combiner.upsert([k % 2, "hello", 1, 0], [("+", 2, 1), ("+", 3, 2)])
+            for k in range(100)
+        ]
+        self.assertEqual(2, len(combiner))
+
+        res = await asyncio.gather(*futures)
+        self.assertEqual(100, len(res))
+        self.assertIsInstance(res[0], Response)
+        self.assertEqual(100, combiner.requested)
+        self.assertEqual(2, combiner.sent)
+
+        # first upsert inserts the tuple, the rest of them update it
+        res = await self.conn.select(self.TESTER_SPACE_NAME)
+        self.assertResponseEqual(
+            res, [[0, "hello", 50, 98], [1, "hello", 50, 98]], "Body ok"
+        )
+
+        for _ in range(10):
+            combiner.upsert([0, "hello", 1, 0], [("+", 2, 3), ("-", 3, 1)])
+        await combiner.flush()
+        self.assertEqual(3, combiner.sent)
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME, [0])
+        self.assertResponseEqual(res, [[0, "hello", 80, 88]], "Body ok")
+
+    async def test__not_combined_ops_keep_order(self):
+        await self.conn.insert(self.TESTER_SPACE_NAME, [0, "hello", 1, 0])
+        combiner = self.conn.upsert_combiner(self.TESTER_SPACE_NAME)
+        combiner.upsert([0, "hello", 1, 0], [("+", 2, 5)])
+        combiner.upsert([0, "hello", 1, 0], [("=", 2, 100)])
+        combiner.upsert([0, "hello", 1, 0], [("+", 2, 1)])
+        await combiner.close()
+        self.assertTrue(combiner.closed)
+        self.assertEqual(3, combiner.sent)
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME, [0])
+        self.assertResponseEqual(res, [[0, "hello", 101, 0]], "Body ok")
+
+        with self.assertRaises(TarantoolError):
+            combiner.upsert([0, "hello", 1, 0], [("+", 2, 1)])
+
+    async def test__combined_error(self):
+        combiner = self.conn.upsert_combiner(self.TESTER_SPACE_NAME)
+        futures = [
+            combiner.upsert([0, 1, 1, 0], [("+", 2, 1)]),
+            combiner.upsert([0, 1, 1, 0], [("+", 2, 1)]),
+        ]
+
+        with self.assertRaises(TarantoolDatabaseError):
+            await combiner.flush()
+
+        for fut in futures:
+            with self.assertRaises(TarantoolDatabaseError):
+                await fut
+
+    async def test__combined_error_dropped_futures(self):
+        loop = asyncio.get_running_loop()
+        errors = []
+        loop.set_exception_handler(lambda _, ctx: errors.append(ctx))
+        try:
+            combiner = self.conn.upsert_combiner(self.TESTER_SPACE_NAME, window=0)
+            for _ in range(3):
+                combiner.upsert([0, 1, 1, 0], [("+", 2, 1)])
+            # let the combined upsert fail without anybody awaiting it
+            await asyncio.sleep(0.5)
+            gc.collect()
+
+            with self.assertRaises(TarantoolDatabaseError):
+                await combiner.flush()
+            await combiner.flush()
+            self.assertEqual([], errors)
+        finally:
+            loop.set_exception_handler(None)
+
+    async def test__flush_on_disconnect(self):
+        combiner = self.conn.upsert_combiner(self.TESTER_SPACE_NAME, window=10)
+        fut = combiner.upsert([0, "hello", 1, 0], [("+", 2, 1)])
+        await self.conn.disconnect()
+        self.assertTrue(combiner.closed)
+        self.assertTrue(fut.done())
+
+        await self.conn.connect()
+        res = await self.conn.select(self.TESTER_SPACE_NAME, [0])
+        self.assertResponseEqual(res, [[0, "hello", 1, 0]], "Body ok")
@@ -0,0 +1,104 @@
+import asyncio
+
+from tests import BaseTarantoolTestCase
+from tests._testbase import ensure_version
+
+
+class WatchTestCase(BaseTarantoolTestCase):
+    async def broadcast(self, key, value):
+        await self.conn.eval("box.broadcast(...)", [key, value])
+
+    async def wait_value(self, key, value, timeout=1.0):
+        async def wait():
+            while self.conn.watch_cache.get(key) != value:
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(wait(), timeout)
+
+    @ensure_version(min=(2, 10))
+    async def test__watch_callback(self):
+        await self.broadcast("test_key", {"a": 1})
+
+        values = []
+        watcher = self.conn.watch(
+            "test_key", lambda key, value: values.append((key, value))
+        )
+        try:
+            await self.wait_value("test_key", {"a": 1})
+            self.assertEqual(values, [("test_key", {"a": 1})])
+            self.assertEqual(watcher.value, {"a": 1})
+
+            await self.broadcast("test_key", {"a": 2})
+            await self.wait_value("test_key", {"a": 2})
+            self.assertEqual(values[-1], ("test_key", {"a": 2}))
+        finally:
+            watcher.unwatch()
+        self.assertTrue(watcher.closed)
+        self.assertNotIn("test_key", self.conn.watch_cache)
+
+    @ensure_version(min=(2, 10))
+    async def test__watch_no_value(self):
+        watcher = self.conn.watch("test_key_unknown")
+        try:
+            value = await asyncio.wait_for(watcher.__anext__(), 1.0)
+            self.assertIsNone(value)
+            self.assertIn("test_key_unknown", self.conn.watch_cache)
+        finally:
+            watcher.unwatch()
+
+    @ensure_version(min=(2, 10))
+    async def test__watch_iterator(self):
+        await self.broadcast("test_key", 1)
+
+        values = []
+
+        async def consume(watcher):
+            async for value in watcher:
+                values.append(value)
+                if value == 3:
+                    watcher.unwatch()
+
+        watcher = self.conn.watch("test_key")
+        task = asyncio.create_task(consume(watcher))
+        await self.wait_value("test_key", 1)
+        await self.broadcast("test_key", 2)
+        await self.wait_value("test_key", 2)
+        await self.broadcast("test_key", 3)
+        await asyncio.wait_for(task, 1.0)
+
+        self.assertEqual(values[0], 1)
+        self.assertEqual(values[-1], 3)
+
+    @ensure_version(min=(2, 10))
+    async def test__watch_same_key_twice(self):
+        await self.broadcast("test_key", "value")
+
+        w1 = self.conn.watch("test_key")
+        await self.wait_value("test_key", "value")
+
+        w2 = self.conn.watch("test_key")
+        try:
+            value = await asyncio.wait_for(w2.__anext__(), 1.0)
+            self.assertEqual(value, "value")
+
+            w1.unwatch()
+            await self.broadcast("test_key", "value2")
+            value = await asyncio.wait_for(w2.__anext__(), 1.0)
+            self.assertEqual(value, "value2")
+        finally:
+            w2.unwatch()
+
+    @ensure_version(min=(2, 10))
+    async def test__watch_reconnect(self):
+        await self.broadcast("test_key", "before")
+        watcher = self.conn.watch("test_key")
+        try:
+            await self.wait_value("test_key", "before")
+
+            await self.conn.disconnect()
+            await self.conn.connect()
+            await self.broadcast("test_key", "after")
+            await self.wait_value("test_key", "after")
+            self.assertEqual(watcher.value, "after")
+        finally:
+            watcher.unwatch()
@@ -1,6 +1,10 @@
 import asyncio
 
-from asynctnt.exceptions import ErrorCode, TarantoolDatabaseError
+from asynctnt.exceptions import (
+    ErrorCode,
+    TarantoolDatabaseError,
+    TarantoolTransactionError,
+)
 from tests import BaseTarantoolTestCase
 from tests._testbase import ensure_bin_version, ensure_version
 
@@ -25,6 +29,118 @@ class StreamTestCase(BaseTarantoolTestCase):
         res = await self.conn.select(self.TESTER_SPACE_NAME)
         self.assertResponseEqual(res, [data])
 
+    @ensure_version(min=(2, 10))
+    async def test__insert_many_in_transaction(self):
+        data = [[i, "hello", i, 4, "what is up"] for i in range(5)]
+        res = await self.conn.insert_many(
+            self.TESTER_SPACE_NAME, data, chunk_size=2, in_transaction=True
+        )
+        self.assertEqual(5, res.rowcount)
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME)
+        self.assertResponseEqual(res, data)
+
+    @ensure_version(min=(2, 10))
+    async def test__insert_many_in_transaction_rolled_back(self):
+        data = [0, "hello", 0, 4, "what is up"]
+        await self.conn.insert(self.TESTER_SPACE_NAME, data)
+
+        with self.assertRaises(TarantoolDatabaseError) as e:
+            await self.conn.insert_many(
+                self.TESTER_SPACE_NAME,
+                [[10, "hello", 10, 4, "what is up"], data],
+                in_transaction=True,
+            )
+        self.assertEqual(ErrorCode.ER_TUPLE_FOUND, e.exception.code)
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME)
+        self.assertResponseEqual(res, [data])
+
+    @ensure_version(min=(2, 10))
+    async def test__insert_many_in_transaction_stops_on_error(self):
+        data = [0, "hello", 0, 4, "what is up"]
+        await self.conn.insert(self.TESTER_SPACE_NAME, data)
+
+        with self.assertRaises(TarantoolDatabaseError):
+            await self.conn.insert_many(
+                self.TESTER_SPACE_NAME,
+                ([i, "hello", i, 4, "what is up"] for i in range(100)),
+                chunk_size=10,
+                max_in_flight=1,
+                in_transaction=True,
+            )
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME)
+        self.assertResponseEqual(res, [data])
+
+    @ensure_version(min=(2, 10))
+    async def test__transaction_batch(self):
+        s = self.conn.stream()
+        data = [1, "hello", 1, 4, "what is up"]
+        tx = s.transaction_batch()
+        tx.insert(self.TESTER_SPACE_NAME, data)
+        tx.update(self.TESTER_SPACE_NAME, [1], [("=", 1, "hi")])
+        tx.select(self.TESTER_SPACE_NAME, [1])
+        self.assertEqual(3, len(tx))
+
+        res = await tx.commit()
+        self.assertEqual(3, len(res))
+        self.assertResponseEqual(res[0], [data])
+        self.assertResponseEqual(res[2], [[1, "hi", 1, 4, "what is up"]])
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME)
+        self.assertResponseEqual(res, [[1, "hi", 1, 4, "what is up"]])
+
+    @ensure_version(min=(2, 10))
+    async def test__transaction_batch_rolled_back(self):
+        s = self.conn.stream()
+        data = [1, "hello", 1, 4, "what is up"]
+        tx = s.transaction_batch()
+        tx.insert(self.TESTER_SPACE_NAME, data)
+        tx.insert(self.TESTER_SPACE_NAME, data)
+
+        with self.assertRaises(TarantoolTransactionError) as e:
+            await tx.commit()
+        self.assertEqual(1, e.exception.index)
+        self.assertFalse(e.exception.committed)
+        self.assertIsInstance(e.exception.error, TarantoolDatabaseError)
+        self.assertEqual(ErrorCode.ER_TUPLE_FOUND, e.exception.error.code)
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME)
+        self.assertResponseEqual(res, [])
+
+    @ensure_version(min=(2, 10))
+    async def test__transaction_batch_encode_error(self):
+        s = self.conn.stream()
+        tx = s.transaction_batch()
+        tx.insert(self.TESTER_SPACE_NAME, [1, "hello", 1, 4, "what is up"])
+        tx.insert(self.TESTER_SPACE_NAME, [2, object()])
+        with self.assertRaises(TypeError):
+            await tx.commit()
+
+        # no transaction is left open in the stream
+        await s.begin()
+        await s.rollback()
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME)
+        self.assertResponseEqual(res, [])
+
+    @ensure_version(min=(2, 10))
+    async def test__transaction_batch_not_atomic(self):
+        s = self.conn.stream()
+        data = [1, "hello", 1, 4, "what is up"]
+        tx = s.transaction_batch()
+        tx.insert(self.TESTER_SPACE_NAME, data)
+        tx.insert(self.TESTER_SPACE_NAME, data)
+
+        with self.assertRaises(TarantoolTransactionError) as e:
+            await tx.commit(atomic=False)
+        self.assertEqual(1, e.exception.index)
+        self.assertTrue(e.exception.committed)
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME)
+        self.assertResponseEqual(res, [data])
+
     @ensure_version(min=(2, 10))
     async def test__transaction_rolled_back(self):
         s = self.conn.stream()
@@ -181,3 +297,104 @@ class StreamTestCase(BaseTarantoolTestCase):
         self.assertEqual(
             "Transaction has been aborted by timeout", exc.exception.message
         )
+
+    @ensure_version(min=(2, 10))
+    async def test__conn_transaction(self):
+        data = [1, "hello", 1, 4, "what is up"]
+
+        async def fn(s):
+            await s.insert(self.TESTER_SPACE_NAME, data)
+            return "done"
+
+        self.conn.transaction_stats.reset()
+        res = await self.conn.transaction(fn)
+        self.assertEqual("done", res)
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME)
+        self.assertResponseEqual(res, [data])
+
+        stats = self.conn.transaction_stats
+        self.assertEqual(1, stats.transactions)
+        self.assertEqual(1, stats.attempts)
+        self.assertEqual(0, stats.retries)
+        self.assertEqual(0, stats.conflicts)
+
+    @ensure_version(min=(2, 10))
+    async def test__conn_transaction_rolled_back(self):
+        class ExpectedError(Exception):
+            pass
+
+        async def fn(s):
+            await s.insert(self.TESTER_SPACE_NAME, [1, "hello", 1, 4, "what is up"])
+            raise ExpectedError
+
+        self.conn.transaction_stats.reset()
+        with self.assertRaises(ExpectedError):
+            await self.conn.transaction(fn)
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME)
+        self.assertResponseEqual(res, [])
+        self.assertEqual(1, self.conn.transaction_stats.attempts)
+        self.assertEqual(0, self.conn.transaction_stats.conflicts)
+
+    @ensure_version(min=(2, 10))
+    async def test__conn_transaction_rolled_back_on_cancel(self):
+        async def fn(s):
+            await s.insert(self.TESTER_SPACE_NAME, [1, "hello", 1, 4, "what is up"])
+            raise asyncio.CancelledError
+
+        with self.assertRaises(asyncio.CancelledError):
+            await self.conn.transaction(fn)
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME)
+        self.assertResponseEqual(res, [])
+
+    @ensure_version(min=(2, 10))
+    async def test__conn_transaction_retry_on_conflict(self):
+        await self.conn.insert(self.TESTER_SPACE_NAME, [1, "hello", 1, 4])
+        attempts = 0
+
+        async def incr(s):
+            nonlocal attempts
+            attempts += 1
+            res = await s.select(self.TESTER_SPACE_NAME, [1])
+            value = res[0][2] + 1
+            if attempts == 1:
+                # concurrent update of the tuple read by the transaction
+                await self.conn.update(self.TESTER_SPACE_NAME, [1], [("+", 2, 10)])
+            await s.replace(self.TESTER_SPACE_NAME, [1, "hello", value, 4])
+            return value
+
+        self.conn.transaction_stats.reset()
+        res = await self.conn.transaction(incr, backoff=0)
+        self.assertEqual(12, res)
+        self.assertEqual(2, attempts)
+
+        res = await self.conn.select(self.TESTER_SPACE_NAME, [1])
+        self.assertResponseEqual(res, [[1, "hello", 12, 4]])
+
+        stats = self.conn.transaction_stats
+        self.assertEqual(1, stats.transactions)
+        self.assertEqual(2, stats.attempts)
+        self.assertEqual(1, stats.retries)
+        self.assertEqual(1, stats.conflicts)
+        self.assertEqual(0, stats.failures)
+
+    @ensure_version(min=(2, 10))
+    async def test__conn_transaction_retries_exhausted(self):
+        await self.conn.insert(self.TESTER_SPACE_NAME, [1, "hello", 1, 4])
+
+        async def incr(s):
+            res = await s.select(self.TESTER_SPACE_NAME, [1])
+            await self.conn.update(self.TESTER_SPACE_NAME, [1], [("+", 2, 10)])
+            await s.replace(self.TESTER_SPACE_NAME, [1, "hello", res[0][2] + 1, 4])
+
+        self.conn.transaction_stats.reset()
+        with self.assertRaises(TarantoolDatabaseError) as exc:
+            await self.conn.transaction(incr, retries=2, backoff=0)
+        self.assertEqual(ErrorCode.ER_TRANSACTION_CONFLICT, exc.exception.code)
+
+        stats = self.conn.transaction_stats
+        self.assertEqual(3, stats.attempts)
+        self.assertEqual(3, stats.conflicts)
+        self.assertEqual(1, stats.failures)